@@ -1 +1,8 @@
-from .application_entry import main
\ No newline at end of file
+import sys
+
+if "--profile_startup" in sys.argv or "--profile-startup" in sys.argv:
+    # Must be enabled before the rest of the patcher is imported
+    from .support import startup_profiler
+    startup_profiler.enable()
+
+from .application_entry import main
@@ -12,20 +12,18 @@ from pathlib import Path
 
 from . import constants
 
-from .wx_gui import gui_entry
-
 from .detections import (
-    device_probe,
+    device_snapshot,
     os_probe
 )
 from .support import (
     utilities,
     defaults,
-    arguments,
     reroute_payloads,
     commit_info,
     logging_handler,
-    analytics_handler
+    analytics_handler,
+    startup_profiler
 )
 
 
@@ -42,9 +40,20 @@ class OpenCoreLegacyPatcher:
         self._generate_base_data()
 
         if utilities.check_cli_args() is None:
+            # GUI and CLI modules are only imported once needed, see '--profile_startup'
+            from .wx_gui import gui_entry
+            self._log_startup_profile()
             gui_entry.EntryPoint(self.constants).start()
 
 
+    def _log_startup_profile(self) -> None:
+        """
+        Log import-time breakdown, if requested
+        """
+        if startup_profiler.is_enabled():
+            logging.info(startup_profiler.report())
+
+
     def _fix_cwd(self) -> None:
         """
         In some extreme scenarios, our current working directory may disappear
@@ -77,7 +86,7 @@ class OpenCoreLegacyPatcher:
         self.constants.detected_os_version = os_data.detect_os_version()
 
         # Generate computer data
-        self.constants.computer = device_probe.Computer.probe()
+        self.constants.computer = device_snapshot.HardwareSnapshotCache(self.constants.patcher_version).probe()
         self.computer = self.constants.computer
         self.constants.booted_oc_disk = utilities.find_disk_off_uuid(utilities.clean_device_path(self.computer.opencore_path))
         if self.constants.computer.firmware_vendor:
@@ -132,6 +141,8 @@ class OpenCoreLegacyPatcher:
             while self.constants.unpack_thread.is_alive():
                 time.sleep(0.1)
 
+        from .support import arguments
+        self._log_startup_profile()
         arguments.arguments(self.constants)
 
 def main():
@@ -131,6 +131,7 @@ class Constants:
         self.current_path:  Path = Path(__file__).parent.parent.resolve()
         self.original_path: Path = Path(__file__).parent.parent.resolve()
         self.payload_path:  Path = self.current_path / Path("payloads")
+        self.custom_build_path: Path = None  # Override build folder, ie. isolated folders for parallel validation builds
 
 
         # Patcher Settings
@@ -646,6 +647,8 @@ class Constants:
     # Build Location
     @property
     def build_path(self):
+        if self.custom_build_path is not None:
+            return self.custom_build_path
         return self.current_path / Path("Build-Folder/")
 
     @property
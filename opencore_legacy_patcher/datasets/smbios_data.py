@@ -22,7 +22,7 @@ Reference:
   https://github.com/acidanthera/OpenCorePkg/blob/master/Library/OcMacInfoLib/AutoGenerated.c
 """
 
-from ..detections import device_probe
+from ..detections import pci_devices
 
 from . import (
     cpu_data,
@@ -39,14 +39,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 13,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950
+            pci_devices.Intel.Archs.GMA_950
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -60,14 +60,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 13,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950
+            pci_devices.Intel.Archs.GMA_950
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -81,14 +81,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 13,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_X3100
+            pci_devices.Intel.Archs.GMA_X3100
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -102,14 +102,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_X3100
+            pci_devices.Intel.Archs.GMA_X3100
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -123,13 +123,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -141,13 +141,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -160,14 +160,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "Legacy iSight": True,
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -180,13 +180,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -199,13 +199,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -218,12 +218,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 12,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell
+            pci_devices.Intel.Archs.Broadwell
         ],
         "Stock Storage": [
             "NVMe",
@@ -235,12 +235,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 12,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell
+            pci_devices.Intel.Archs.Broadwell
         ],
         "Stock Storage": [
             "NVMe",
@@ -253,12 +253,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 12,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake
+            pci_devices.Intel.Archs.Skylake
         ],
         "Stock Storage": [
             "NVMe",
@@ -271,12 +271,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 12,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake
+            pci_devices.Intel.Archs.Kaby_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -289,12 +289,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_X3100
+            pci_devices.Intel.Archs.GMA_X3100
         ],
         "Stock Storage": [
             "SATA 1.8",
@@ -307,13 +307,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "nForce Chipset": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 1.8",
@@ -326,13 +326,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 11,
         "nForce Chipset": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "mSATA",
@@ -345,13 +345,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "nForce Chipset": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "mSATA",
@@ -364,12 +364,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 11,
         "Ethernet Chipset": "Broadcom",  # Set for Apple Thunderbolt Adapter
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge
+            pci_devices.Intel.Archs.Sandy_Bridge
         ],
         "Stock Storage": [
             "mSATA",
@@ -382,12 +382,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 13,
         "Ethernet Chipset": "Broadcom",  # Set for Apple Thunderbolt Adapter
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge
+            pci_devices.Intel.Archs.Sandy_Bridge
         ],
         "Stock Storage": [
             "mSATA",
@@ -400,12 +400,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 11,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge
+            pci_devices.Intel.Archs.Ivy_Bridge
         ],
         "Stock Storage": [
             "mSATA",
@@ -418,12 +418,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge
+            pci_devices.Intel.Archs.Ivy_Bridge
         ],
         "Stock Storage": [
             "mSATA",
@@ -436,12 +436,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 11,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell
+            pci_devices.Intel.Archs.Haswell
         ],
         "Stock Storage": [
             "mSATA",
@@ -454,12 +454,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell
+            pci_devices.Intel.Archs.Haswell
         ],
         "Stock Storage": [
             "NVMe",
@@ -472,12 +472,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 11,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell
+            pci_devices.Intel.Archs.Broadwell
         ],
         "Stock Storage": [
             "NVMe",
@@ -490,12 +490,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell
+            pci_devices.Intel.Archs.Broadwell
         ],
         "Stock Storage": [
             "NVMe",
@@ -508,12 +508,12 @@ smbios_dictionary = {
         "SecureBootModel": "j140k",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.sonoma,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake
+            pci_devices.Intel.Archs.Coffee_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -525,12 +525,12 @@ smbios_dictionary = {
         "SecureBootModel": "j140k",  # TODO: Verify
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.sonoma,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake
+            pci_devices.Intel.Archs.Coffee_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -544,12 +544,12 @@ smbios_dictionary = {
         "SecureBootModel": "x589amlu",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.sonoma,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake
+            pci_devices.Intel.Archs.Coffee_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -562,12 +562,12 @@ smbios_dictionary = {
         "SecureBootModel": "j140a",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.sonoma,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake
+            pci_devices.Intel.Archs.Coffee_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -580,12 +580,12 @@ smbios_dictionary = {
         "SecureBootModel": "j230k",
         "CPU Generation": cpu_data.CPUGen.ice_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ice_Lake
+            pci_devices.Intel.Archs.Ice_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -599,12 +599,12 @@ smbios_dictionary = {
         "SecureBootModel": "x589icly",
         "CPU Generation": cpu_data.CPUGen.ice_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ice_Lake
+            pci_devices.Intel.Archs.Ice_Lake
         ],
         "Stock Storage": [
             "NVMe",
@@ -616,7 +616,7 @@ smbios_dictionary = {
         "SecureBootModel": "j313",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": None,
         "Stock GPUs": [], # TODO: Add Apple Silicon GPU
@@ -630,7 +630,7 @@ smbios_dictionary = {
         "SecureBootModel": "j313",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": None,
         "Stock GPUs": [],
@@ -645,13 +645,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 15,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -665,13 +665,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 17,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -685,13 +685,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 17,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -705,13 +705,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 15,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -725,13 +725,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 15,  # Shipped with 17 as well
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -744,13 +744,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Screen Size": 15,  # Shipped with 17 as well
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -764,14 +764,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,  # Shipped with 17 as well
         "Switchable GPUs": True,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -784,14 +784,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,  # Shipped with 17 as well
         "Switchable GPUs": True,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -805,14 +805,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -824,14 +824,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -844,14 +844,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 17,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -864,14 +864,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -884,14 +884,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -904,13 +904,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -923,14 +923,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 17,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Iron_Lake,
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.Intel.Archs.Iron_Lake,
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -943,14 +943,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Iron_Lake,
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.Intel.Archs.Iron_Lake,
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -963,13 +963,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Screen Size": 13,
         "Ethernet Chipset": "Broadcom",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -982,13 +982,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 13,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1001,14 +1001,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1021,14 +1021,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 17,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1042,14 +1042,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Screen Size": 17,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1062,14 +1062,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
-            device_probe.NVIDIA.Archs.Kepler
+            pci_devices.Intel.Archs.Ivy_Bridge,
+            pci_devices.NVIDIA.Archs.Kepler
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1082,12 +1082,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 13,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
+            pci_devices.Intel.Archs.Ivy_Bridge,
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1100,14 +1100,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
-            device_probe.NVIDIA.Archs.Kepler
+            pci_devices.Intel.Archs.Ivy_Bridge,
+            pci_devices.NVIDIA.Archs.Kepler
         ],
         "Stock Storage": [
             "mSATA",
@@ -1120,12 +1120,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
+            pci_devices.Intel.Archs.Ivy_Bridge,
         ],
         "Stock Storage": [
             "mSATA",
@@ -1138,12 +1138,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1156,12 +1156,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 15,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1174,14 +1174,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.NVIDIA.Archs.Kepler,
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.NVIDIA.Archs.Kepler,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1194,12 +1194,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 15,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1212,14 +1212,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.AMD.Archs.Legacy_GCN_7000
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.AMD.Archs.Legacy_GCN_7000
         ],
         "Stock Storage": [
             "NVMe",
@@ -1232,12 +1232,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell,
+            pci_devices.Intel.Archs.Broadwell,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1250,12 +1250,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
+            pci_devices.Intel.Archs.Skylake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1268,12 +1268,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
+            pci_devices.Intel.Archs.Skylake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1286,14 +1286,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
-            device_probe.AMD.Archs.Polaris
+            pci_devices.Intel.Archs.Skylake,
+            pci_devices.AMD.Archs.Polaris
         ],
         "Stock Storage": [
             "NVMe",
@@ -1306,12 +1306,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
+            pci_devices.Intel.Archs.Kaby_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1324,12 +1324,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
+            pci_devices.Intel.Archs.Kaby_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1342,14 +1342,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703_UART,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
-            device_probe.AMD.Archs.Polaris
+            pci_devices.Intel.Archs.Kaby_Lake,
+            pci_devices.AMD.Archs.Polaris
         ],
         "Stock Storage": [
             "NVMe",
@@ -1362,14 +1362,14 @@ smbios_dictionary = {
         "SecureBootModel": "j680",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Polaris
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Polaris
         ],
         "Stock Storage": [
             "NVMe",
@@ -1382,12 +1382,12 @@ smbios_dictionary = {
         "SecureBootModel": "j132",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
+            pci_devices.Intel.Archs.Coffee_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1400,14 +1400,14 @@ smbios_dictionary = {
         "SecureBootModel": "j780",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 15,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Vega
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Vega
         ],
         "Stock Storage": [
             "NVMe",
@@ -1420,12 +1420,12 @@ smbios_dictionary = {
         "SecureBootModel": "j213",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
+            pci_devices.Intel.Archs.Coffee_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1438,14 +1438,14 @@ smbios_dictionary = {
         "SecureBootModel": "j152f",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 16,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Navi
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Navi
         ],
         "Stock Storage": [
             "NVMe",
@@ -1458,12 +1458,12 @@ smbios_dictionary = {
         "SecureBootModel": "j214k",
         "CPU Generation": cpu_data.CPUGen.ice_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ice_Lake,
+            pci_devices.Intel.Archs.Ice_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1476,12 +1476,12 @@ smbios_dictionary = {
         "SecureBootModel": "j223",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 13,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
+            pci_devices.Intel.Archs.Coffee_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1494,14 +1494,14 @@ smbios_dictionary = {
         "SecureBootModel": "j215",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Screen Size": 16,
         "Switchable GPUs": True,
         "Ethernet Chipset": None,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Navi
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Navi
         ],
         "Stock Storage": [
             "NVMe",
@@ -1514,7 +1514,7 @@ smbios_dictionary = {
         "SecureBootModel": "j293",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 13,
         "Ethernet Chipset": None,
@@ -1530,7 +1530,7 @@ smbios_dictionary = {
         "SecureBootModel": "j316s",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 16,
         "Ethernet Chipset": None,
@@ -1546,7 +1546,7 @@ smbios_dictionary = {
         "SecureBootModel": "j316c",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 16,
         "Ethernet Chipset": None,
@@ -1562,7 +1562,7 @@ smbios_dictionary = {
         "SecureBootModel": "j314s",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 14,
         "Ethernet Chipset": None,
@@ -1578,7 +1578,7 @@ smbios_dictionary = {
         "SecureBootModel": "j314c",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 14,
         "Ethernet Chipset": None,
@@ -1594,7 +1594,7 @@ smbios_dictionary = {
         "SecureBootModel": "J493AP",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Screen Size": 14,
         "Ethernet Chipset": None,
@@ -1610,11 +1610,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950
+            pci_devices.Intel.Archs.GMA_950
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1628,11 +1628,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "Ethernet Chipset": "Marvell",
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950
+            pci_devices.Intel.Archs.GMA_950
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1646,12 +1646,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1664,12 +1664,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2070,
         "Ethernet Chipset": "Broadcom",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1682,11 +1682,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge
+            pci_devices.Intel.Archs.Sandy_Bridge
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1699,12 +1699,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1717,11 +1717,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
+            pci_devices.Intel.Archs.Sandy_Bridge,
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1734,11 +1734,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
+            pci_devices.Intel.Archs.Ivy_Bridge,
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1751,11 +1751,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
+            pci_devices.Intel.Archs.Ivy_Bridge,
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1768,11 +1768,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "SATA 2.5",
@@ -1786,11 +1786,11 @@ smbios_dictionary = {
         "SecureBootModel": "j174",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
+            pci_devices.Intel.Archs.Coffee_Lake,
         ],
         "Stock Storage": [
             "NVMe",
@@ -1802,7 +1802,7 @@ smbios_dictionary = {
         "SecureBootModel": "j274",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [],
@@ -1817,13 +1817,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500,
+            pci_devices.AMD.Archs.R500,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1837,13 +1837,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.yonah.value,
         "Max OS Supported": os_data.os_data.snow_leopard,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950,
+            pci_devices.Intel.Archs.GMA_950,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1857,13 +1857,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500,
+            pci_devices.AMD.Archs.R500,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1877,13 +1877,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950,
+            pci_devices.Intel.Archs.GMA_950,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1897,14 +1897,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.conroe.value,
         "Max OS Supported": os_data.os_data.lion,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Legacy iSight": True,
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500,
-            device_probe.NVIDIA.Archs.Curie
+            pci_devices.AMD.Archs.R500,
+            pci_devices.NVIDIA.Archs.Curie
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1918,14 +1918,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn,  # Stock models shipped with Conroe
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1938,14 +1938,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn,  # Stock models shipped with Conroe
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1959,14 +1959,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -1979,14 +1979,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "UGA Graphics": True,
         "Ethernet Chipset": "Marvell",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2000,14 +2000,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla,
-            device_probe.AMD.Archs.TeraScale_1,
+            pci_devices.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.TeraScale_1,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2019,12 +2019,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2036,12 +2036,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2053,12 +2053,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla,
+            pci_devices.NVIDIA.Archs.Tesla,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2072,13 +2072,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_1,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2090,13 +2090,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_1,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2108,13 +2108,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Nvidia",
         "nForce Chipset": True,
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_1,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2127,12 +2127,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_1,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2145,13 +2145,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.AMD.Archs.TeraScale_2,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_2,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2164,13 +2164,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.AMD.Archs.TeraScale_2,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.TeraScale_2,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2183,13 +2183,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2,
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2202,13 +2202,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2,
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2222,13 +2222,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.sandy_bridge.value,
         "Max OS Supported": os_data.os_data.high_sierra,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Broadcom",
         "Socketed GPUs": "MXM",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Sandy_Bridge,
-            device_probe.AMD.Archs.TeraScale_2,
+            pci_devices.Intel.Archs.Sandy_Bridge,
+            pci_devices.AMD.Archs.TeraScale_2,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2241,12 +2241,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
-            device_probe.NVIDIA.Archs.Kepler,
+            pci_devices.Intel.Archs.Ivy_Bridge,
+            pci_devices.NVIDIA.Archs.Kepler,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2260,12 +2260,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
-            device_probe.NVIDIA.Archs.Kepler,
+            pci_devices.Intel.Archs.Ivy_Bridge,
+            pci_devices.NVIDIA.Archs.Kepler,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2279,11 +2279,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4360,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4360,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v1,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Ivy_Bridge,
+            pci_devices.Intel.Archs.Ivy_Bridge,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2297,11 +2297,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2315,12 +2315,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.NVIDIA.Archs.Kepler,
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.NVIDIA.Archs.Kepler,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2334,12 +2334,12 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.catalina,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.NVIDIA.Archs.Kepler,
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.NVIDIA.Archs.Kepler,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2353,11 +2353,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2371,13 +2371,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.AMD.Archs.Legacy_GCN_7000,
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.AMD.Archs.Legacy_GCN_7000,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2390,13 +2390,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.big_sur,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
-            device_probe.AMD.Archs.Legacy_GCN_7000,
+            pci_devices.Intel.Archs.Haswell,
+            pci_devices.AMD.Archs.Legacy_GCN_7000,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2410,11 +2410,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell,
+            pci_devices.Intel.Archs.Broadwell,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2428,11 +2428,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.broadwell.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Broadwell,
+            pci_devices.Intel.Archs.Broadwell,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2446,14 +2446,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
-            device_probe.AMD.Archs.Legacy_GCN_8000,
-            device_probe.AMD.Archs.Legacy_GCN_9000,
+            pci_devices.Intel.Archs.Skylake,
+            pci_devices.AMD.Archs.Legacy_GCN_8000,
+            pci_devices.AMD.Archs.Legacy_GCN_9000,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2466,14 +2466,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
-            device_probe.AMD.Archs.Legacy_GCN_8000,
-            device_probe.AMD.Archs.Legacy_GCN_9000,
+            pci_devices.Intel.Archs.Skylake,
+            pci_devices.AMD.Archs.Legacy_GCN_8000,
+            pci_devices.AMD.Archs.Legacy_GCN_9000,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2486,14 +2486,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Skylake,
-            device_probe.AMD.Archs.Legacy_GCN_8000,
-            device_probe.AMD.Archs.Legacy_GCN_9000,
+            pci_devices.Intel.Archs.Skylake,
+            pci_devices.AMD.Archs.Legacy_GCN_8000,
+            pci_devices.AMD.Archs.Legacy_GCN_9000,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2507,11 +2507,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
+            pci_devices.Intel.Archs.Kaby_Lake,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2525,13 +2525,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
-            device_probe.AMD.Archs.Polaris,
+            pci_devices.Intel.Archs.Kaby_Lake,
+            pci_devices.AMD.Archs.Polaris,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2545,13 +2545,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.kaby_lake.value,
         "Max OS Supported": os_data.os_data.ventura,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20703,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Kaby_Lake,
-            device_probe.AMD.Archs.Polaris,
+            pci_devices.Intel.Archs.Kaby_Lake,
+            pci_devices.AMD.Archs.Polaris,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2565,14 +2565,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Polaris,
-            device_probe.AMD.Archs.Vega,
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.Vega,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2586,14 +2586,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Polaris,
-            device_probe.AMD.Archs.Vega,
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.Vega,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2607,14 +2607,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Coffee_Lake,
-            device_probe.AMD.Archs.Polaris,
-            device_probe.AMD.Archs.Vega,
+            pci_devices.Intel.Archs.Coffee_Lake,
+            pci_devices.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.Vega,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2628,13 +2628,13 @@ smbios_dictionary = {
         "SecureBootModel": "j185",
         "CPU Generation": cpu_data.CPUGen.comet_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Comet_Lake,
-            device_probe.AMD.Archs.Navi,
+            pci_devices.Intel.Archs.Comet_Lake,
+            pci_devices.AMD.Archs.Navi,
         ],
         "Stock Storage": [
             "NVMe"
@@ -2647,13 +2647,13 @@ smbios_dictionary = {
         "SecureBootModel": "j185f",
         "CPU Generation": cpu_data.CPUGen.comet_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Broadcom",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Comet_Lake,
-            device_probe.AMD.Archs.Navi,
+            pci_devices.Intel.Archs.Comet_Lake,
+            pci_devices.AMD.Archs.Navi,
         ],
         "Stock Storage": [
             "NVMe"
@@ -2665,7 +2665,7 @@ smbios_dictionary = {
         "SecureBootModel": "j456",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [],
@@ -2679,7 +2679,7 @@ smbios_dictionary = {
         "SecureBootModel": "j457",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [],
@@ -2694,12 +2694,12 @@ smbios_dictionary = {
         "SecureBootModel": "j137",
         "CPU Generation": cpu_data.CPUGen.skylake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Aquantia",
         "Dual DisplayPort Display": True,
         "Stock GPUs": [
-            device_probe.AMD.Archs.Vega,
+            pci_devices.AMD.Archs.Vega,
         ],
         "Stock Storage": [
             "NVMe"
@@ -2718,7 +2718,7 @@ smbios_dictionary = {
         "Ethernet Chipset": "Intel 80003ES2LAN",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Curie
+            pci_devices.NVIDIA.Archs.Curie
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2738,7 +2738,7 @@ smbios_dictionary = {
         "Ethernet Chipset": "Intel 80003ES2LAN",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Curie
+            pci_devices.NVIDIA.Archs.Curie
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2752,14 +2752,14 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.penryn.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm43224,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm43224,
         "Bluetooth Model": bluetooth_data.bluetooth_data.APPLE_CSR,
         "UGA Graphics": True,
         "Ethernet Chipset": "Intel 80003ES2LAN",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_1,
-            device_probe.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.TeraScale_1,
+            pci_devices.AMD.Archs.Polaris,
 
         ],
         "Stock Storage": [
@@ -2774,13 +2774,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.el_capitan,
-        "Wireless Model": device_probe.Atheros.Chipsets.AirPortAtheros40,
+        "Wireless Model": pci_devices.Atheros.Chipsets.AirPortAtheros40,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Intel 82574L",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla,
-            device_probe.AMD.Archs.Polaris,
+            pci_devices.NVIDIA.Archs.Tesla,
+            pci_devices.AMD.Archs.Polaris,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2793,13 +2793,13 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.nehalem.value,
         "Max OS Supported": os_data.os_data.mojave,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirPortBrcm4331,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirPortBrcm4331,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM2046,
         "Ethernet Chipset": "Intel 82574L",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.AMD.Archs.TeraScale_2,
-            device_probe.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.TeraScale_2,
+            pci_devices.AMD.Archs.Polaris,
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2812,11 +2812,11 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.ivy_bridge.value,
         "Max OS Supported": os_data.os_data.monterey,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [
-            device_probe.AMD.Archs.Legacy_GCN_7000
+            pci_devices.AMD.Archs.Legacy_GCN_7000
         ],
         "Stock Storage": [
             "NVMe",
@@ -2829,14 +2829,14 @@ smbios_dictionary = {
         "SecureBootModel": "j160",
         "CPU Generation": cpu_data.CPUGen.coffee_lake.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.UART,
         "Ethernet Chipset": "Aquantia",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.AMD.Archs.Polaris,
-            device_probe.AMD.Archs.Vega,
-            device_probe.AMD.Archs.Navi
+            pci_devices.AMD.Archs.Polaris,
+            pci_devices.AMD.Archs.Vega,
+            pci_devices.AMD.Archs.Navi
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2856,7 +2856,7 @@ smbios_dictionary = {
         "Ethernet Chipset": "Intel 80003ES2LAN",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2876,7 +2876,7 @@ smbios_dictionary = {
         "Ethernet Chipset": "Intel 80003ES2LAN",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.AMD.Archs.R500
+            pci_devices.AMD.Archs.R500
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2895,7 +2895,7 @@ smbios_dictionary = {
         "Ethernet Chipset": "Intel 82574L",
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.NVIDIA.Archs.Tesla
+            pci_devices.NVIDIA.Archs.Tesla
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2908,7 +2908,7 @@ smbios_dictionary = {
         "SecureBootModel": "j375c",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Aquantia",
         "Stock GPUs": [],
@@ -2923,7 +2923,7 @@ smbios_dictionary = {
         "SecureBootModel": "j375d",
         "CPU Generation": cpu_data.CPUGen.apple_silicon.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Aquantia",
         "Stock GPUs": [],
@@ -2941,7 +2941,7 @@ smbios_dictionary = {
         "Bluetooth Model": bluetooth_data.bluetooth_data.NonApplicable,
         "Socketed GPUs": "PCIe",
         "Stock GPUs": [
-            device_probe.Intel.Archs.GMA_950
+            pci_devices.Intel.Archs.GMA_950
         ],
         "Stock Storage": [
             "SATA 3.5",
@@ -2954,7 +2954,7 @@ smbios_dictionary = {
         "SecureBootModel": "j273a",
         "CPU Generation": cpu_data.CPUGen.apple_dtk.value,
         "Max OS Supported": os_data.os_data.max_os,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe,
         "Bluetooth Model": bluetooth_data.bluetooth_data.PCIe,
         "Ethernet Chipset": "Broadcom",
         "Stock GPUs": [],
@@ -2969,10 +2969,10 @@ smbios_dictionary = {
         "SecureBootModel": None,
         "CPU Generation": cpu_data.CPUGen.haswell.value,
         "Max OS Supported": os_data.os_data.mavericks,
-        "Wireless Model": device_probe.Broadcom.Chipsets.AirportBrcmNIC,
+        "Wireless Model": pci_devices.Broadcom.Chipsets.AirportBrcmNIC,
         "Bluetooth Model": bluetooth_data.bluetooth_data.BRCM20702_v2,
         "Stock GPUs": [
-            device_probe.Intel.Archs.Haswell,
+            pci_devices.Intel.Archs.Haswell,
         ],
         "Stock Storage": [
             "NVMe",
@@ -0,0 +1,236 @@
+"""
+smbios_index.py: Indexed view of smbios_data.smbios_dictionary
+
+smbios_dictionary is compiled once into slotted records, with secondary indexes
+on Board ID (including SecureBootModel), CPU Generation, Max OS Supported and
+Stock GPUs. Queries intersect indexes rather than scanning every model.
+
+Unknown dictionary keys fail compilation, thus new smbios_data properties must be
+added to SMBIOSModel rather than silently dropped.
+
+Usage:
+>>> from datasets import smbios_index
+>>> smbios_index.find_model_off_board("Mac-942B59F58194171B")
+'iMac12,2'
+>>> smbios_index.find_board_off_model("iMac12,2")
+'Mac-942B59F58194171B'
+
+>>> # Models with Kepler GPUs dropped before Monterey
+>>> smbios_index.query(stock_gpu=pci_devices.NVIDIA.Archs.Kepler, max_os_before=os_data.os_data.monterey)
+"""
+
+import enum
+
+from dataclasses import dataclass
+from typing      import Optional
+
+from . import (
+    smbios_data,
+    cpu_data,
+    os_data
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SMBIOSModel:
+    model:             str
+    board_id:          Optional[str]
+    secure_boot_model: Optional[str]
+    firmware_features: Optional[str]
+    cpu_generation:    Optional[cpu_data.CPUGen]
+    max_os_supported:  os_data.os_data
+    wireless_model:    Optional[enum.Enum]
+    bluetooth_model:   Optional[enum.Enum]
+    stock_gpus:        tuple
+    stock_storage:     tuple
+    marketing_name:    Optional[str]   = None
+    screen_size:       Optional[int]   = None
+    ethernet_chipset:  Optional[str]   = None
+    socketed_gpus:     Optional[str]   = None
+    switchable_gpus:   Optional[bool]  = None
+    uga_graphics:      Optional[bool]  = None
+    nforce_chipset:    Optional[bool]  = None
+    dual_displayport:  Optional[bool]  = None
+    legacy_isight:     Optional[bool]  = None
+
+    @property
+    def is_variant(self) -> bool:
+        """
+        Whether entry is an alternate Board ID or internal model (ie. 'iMac9,1_v2', 'AAPL_iMac12,2')
+        """
+        return "_" in self.model or " " in self.model
+
+
+KNOWN_KEYS: set = {
+    "Board ID",
+    "SecureBootModel",
+    "FirmwareFeatures",
+    "CPU Generation",
+    "Max OS Supported",
+    "Wireless Model",
+    "Bluetooth Model",
+    "Stock GPUs",
+    "Stock Storage",
+    "Marketing Name",
+    "Screen Size",
+    "Ethernet Chipset",
+    "Socketed GPUs",
+    "Switchable GPUs",
+    "UGA Graphics",
+    "nForce Chipset",
+    "Dual DisplayPort Display",
+    "Legacy iSight",
+}
+
+
+class SMBIOSIndex:
+    """
+    Parameters:
+        dictionary (dict): SMBIOS dictionary, see smbios_data.smbios_dictionary
+    """
+
+    def __init__(self, dictionary: dict) -> None:
+        self.models:           dict = {}  # Model -> SMBIOSModel, in dictionary order
+        self.board_ids:        dict = {}  # Board ID/SecureBootModel -> model, see find_model_off_board()
+        self.cpu_generations:  dict = {}  # CPUGen -> set of models
+        self.max_os_supported: dict = {}  # os_data -> set of models
+        self.stock_gpus:       dict = {}  # GPU architecture -> set of models
+
+        for model, data in dictionary.items():
+            unknown_keys = data.keys() - KNOWN_KEYS
+            if unknown_keys:
+                raise Exception(f"Unknown SMBIOS keys for {model}: {', '.join(sorted(unknown_keys))}")
+
+            record = SMBIOSModel(
+                model=model,
+                board_id=data["Board ID"],
+                secure_boot_model=data["SecureBootModel"],
+                firmware_features=data["FirmwareFeatures"],
+                cpu_generation=None if data["CPU Generation"] is None else cpu_data.CPUGen(data["CPU Generation"]),
+                max_os_supported=data["Max OS Supported"],
+                wireless_model=data["Wireless Model"],
+                bluetooth_model=data["Bluetooth Model"],
+                stock_gpus=tuple(data["Stock GPUs"]),
+                stock_storage=tuple(data["Stock Storage"]),
+                marketing_name=data.get("Marketing Name"),
+                screen_size=data.get("Screen Size"),
+                ethernet_chipset=data.get("Ethernet Chipset"),
+                socketed_gpus=data.get("Socketed GPUs"),
+                switchable_gpus=data.get("Switchable GPUs"),
+                uga_graphics=data.get("UGA Graphics"),
+                nforce_chipset=data.get("nForce Chipset"),
+                dual_displayport=data.get("Dual DisplayPort Display"),
+                legacy_isight=data.get("Legacy iSight"),
+            )
+            self.models[model] = record
+
+            for board in [record.board_id, record.secure_boot_model]:
+                if board is not None:
+                    # First match wins, matching dictionary order
+                    self.board_ids.setdefault(board, self._normalize_model(model))
+
+            self.cpu_generations.setdefault(record.cpu_generation, set()).add(model)
+            self.max_os_supported.setdefault(record.max_os_supported, set()).add(model)
+            for gpu in record.stock_gpus:
+                self.stock_gpus.setdefault(gpu, set()).add(model)
+
+
+    def _normalize_model(self, model: str) -> str:
+        if model.endswith("_v2") or model.endswith("_v3") or model.endswith("_v4"):
+            # smbios_data has duplicate SMBIOS to handle multiple board IDs
+            model = model[:-3]
+        if model == "MacPro4,1":
+            # 4,1 and 5,1 have the same board ID, best to return the newer ID
+            model = "MacPro5,1"
+        return model
+
+
+    def find_model_off_board(self, board: str) -> Optional[str]:
+        """
+        Find model based off Board ID or SecureBootModel
+
+        Returns:
+            str: Model, None if unknown
+        """
+
+        # Strip extra data from Target Types (ap, uppercase)
+        if not (board.startswith("Mac-") or board.startswith("VMM-")):
+            if board.lower().endswith("ap"):
+                board = board[:-2]
+            board = board.lower()
+
+        return self.board_ids.get(board)
+
+
+    def find_board_off_model(self, model: str) -> Optional[str]:
+        """
+        Find Board ID based off model
+
+        Returns:
+            str: Board ID, None if unknown model or model without a Board ID
+        """
+
+        record = self.models.get(model)
+        return None if record is None else record.board_id
+
+
+    def query(self, cpu_generation: cpu_data.CPUGen = None, stock_gpu: enum.Enum = None, max_os_before: os_data.os_data = None, max_os_at_least: os_data.os_data = None, include_variants: bool = True) -> list:
+        """
+        Find models matching all provided criteria
+
+        Parameters:
+            cpu_generation   (CPUGen):  Stock CPU generation
+            stock_gpu        (Enum):    Stock GPU architecture (ie. pci_devices.NVIDIA.Archs.Kepler)
+            max_os_before    (os_data): Support dropped before this OS
+            max_os_at_least  (os_data): Supported up to at least this OS
+            include_variants (bool):    Include alternate Board ID and internal entries
+
+        Returns:
+            list: SMBIOSModel entries, in dictionary order
+        """
+
+        candidates = None
+
+        def _intersect(models: set) -> None:
+            nonlocal candidates
+            candidates = models if candidates is None else candidates & models
+
+        if cpu_generation is not None:
+            _intersect(self.cpu_generations.get(cpu_generation, set()))
+        if stock_gpu is not None:
+            _intersect(self.stock_gpus.get(stock_gpu, set()))
+        if max_os_before is not None or max_os_at_least is not None:
+            _intersect(set().union(*[
+                models for max_os, models in self.max_os_supported.items()
+                if (max_os_before is None or max_os < max_os_before) and (max_os_at_least is None or max_os >= max_os_at_least)
+            ]))
+
+        return [
+            record for model, record in self.models.items()
+            if (candidates is None or model in candidates) and (include_variants or not record.is_variant)
+        ]
+
+
+_index: SMBIOSIndex = None
+
+
+def index() -> SMBIOSIndex:
+    """
+    Shared index of smbios_data.smbios_dictionary, compiled on first use
+    """
+    global _index
+    if _index is None:
+        _index = SMBIOSIndex(smbios_data.smbios_dictionary)
+    return _index
+
+
+def find_model_off_board(board: str) -> Optional[str]:
+    return index().find_model_off_board(board)
+
+
+def find_board_off_model(model: str) -> Optional[str]:
+    return index().find_board_off_model(model)
+
+
+def query(**kwargs) -> list:
+    return index().query(**kwargs)
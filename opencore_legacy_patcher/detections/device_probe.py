@@ -10,20 +10,46 @@ import hashlib
 
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Optional, Type, Union
+from typing import Optional
 
-from . import ioreg
-
-from ..support import utilities
+from . import (
+    ioreg,
+    pci_devices
+)
 
-from ..datasets import (
-    pci_data,
-    usb_data
+from .pci_devices import (  # noqa: F401 # Re-exported, device classes are referenced as device_probe.<class>
+    class_code_to_bytes,
+    PCIDevice,
+    GPU,
+    WirelessCard,
+    NVMeController,
+    EthernetController,
+    SATAController,
+    SASController,
+    XHCIController,
+    EHCIController,
+    OHCIController,
+    UHCIController,
+    SDXCController,
+    NVIDIA,
+    NVIDIAEthernet,
+    AMD,
+    Intel,
+    IntelEthernet,
+    Broadcom,
+    BroadcomEthernet,
+    Atheros,
+    Aquantia,
+    Marvell,
+    SysKonnect,
+    DEVICE_ID_TABLE,
+    classify_device_ids,
+    PCIRegistryEntry,
 )
 
+from ..support import utilities
 
-def class_code_to_bytes(class_code: int) -> bytes:
-    return class_code.to_bytes(4, byteorder="little")
+from ..datasets import usb_data
 
 
 @dataclass
@@ -125,497 +151,108 @@ class USBDevice:
         VENDOR_SPEC       = 0xFF
 
 
-@dataclass
-class PCIDevice:
-    VENDOR_ID: ClassVar[int]  # Default vendor id, for subclasses.
-    CLASS_CODES: ClassVar[list[int]]  # Default class codes, for subclasses.
-
-    vendor_id:  int  # The vendor ID of this PCI device
-    device_id:  int  # The device ID of this PCI device
-    class_code: int  # The class code of this PCI device - https://pci-ids.ucw.cz/read/PD
-
-    name:                Optional[str]  = None  # Name of IORegistryEntry
-    model:               Optional[str]  = None  # model property
-    acpi_path:           Optional[str]  = None  # ACPI Device Path
-    pci_path:            Optional[str]  = None  # PCI Device Path
-    disable_metal:       Optional[bool] = False # 'disable-metal' property
-    force_compatible:    Optional[bool] = False # 'force-compat' property
-    vendor_id_unspoofed: Optional[int]  = -1    # Unspoofed vendor ID of this PCI device
-    device_id_unspoofed: Optional[int]  = -1    # Unspoofed device ID of this PCI device
-
-    @classmethod
-    def class_code_matching_dict(cls) -> dict:
-        return {
-            "IOProviderClass": "IOPCIDevice",
-            "IOPropertyMatch": [{"class-code": class_code_to_bytes(class_code)} for class_code in cls.CLASS_CODES]
-        }
-
-    @classmethod
-    def from_ioregistry(cls, entry: ioreg.io_registry_entry_t, anti_spoof=False):
-        properties: dict = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperties(entry, None, ioreg.kCFAllocatorDefault, ioreg.kNilOptions)[1])  # type: ignore
-
-        vendor_id = None
-        device_id = None
-        vendor_id_unspoofed = None
-        device_id_unspoofed = None
-
-        if "IOName" in properties:
-            ioname = properties["IOName"]
-            if type(ioname) is bytes:
-                ioname = ioname.strip(b"\0").decode()
-
-            if ioname.startswith("pci") and "," in ioname:
-                vendor_id_unspoofed, device_id_unspoofed = (int(i, 16) for i in ioname[3:].split(","))
-                if anti_spoof:
-                    vendor_id = vendor_id_unspoofed
-                    device_id = device_id_unspoofed
-
-        if vendor_id is None and device_id is None:
-            vendor_id, device_id = [int.from_bytes(properties[i][:4], byteorder="little") for i in ["vendor-id", "device-id"]]
-
-        if vendor_id_unspoofed is None and device_id_unspoofed is None:
-            vendor_id_unspoofed = vendor_id
-            device_id_unspoofed = device_id
-
-        device = cls(vendor_id, device_id, int.from_bytes(properties["class-code"][:6], byteorder="little"), name=ioreg.io_name_t_to_str(ioreg.IORegistryEntryGetName(entry, None)[1]))
-        if "model" in properties:
-            model = properties["model"]
-            if isinstance(model, bytes):
-                model = model.strip(b"\0").decode()
-            device.model = model
-        if "acpi-path" in properties:
-            device.acpi_path = properties["acpi-path"]
-        if "disable-metal" in properties:
-            device.disable_metal = True
-        if "force-compat" in properties:
-            device.force_compatible = True
-
-        device.vendor_id_unspoofed = vendor_id_unspoofed
-        device.device_id_unspoofed = device_id_unspoofed
-        device.populate_pci_path(entry)
-        return device
-
-    def vendor_detect(self, *, inherits: Optional[Type["PCIDevice"]] = None, classes: Optional[list] = None):
-        for i in classes or itertools.chain.from_iterable([subclass.__subclasses__() for subclass in PCIDevice.__subclasses__()]):
-            if issubclass(i, inherits or object) and i.detect(self):
-                return i
-        return None
-
-    @classmethod
-    def detect(cls, device):
-        return device.vendor_id == cls.VENDOR_ID and ((device.class_code in cls.CLASS_CODES) if getattr(cls, "CLASS_CODES", None) else True) and ((device.class_code == cls.CLASS_CODE) if getattr(cls, "CLASS_CODE", None) else True)  # type: ignore  # pylint: disable=no-member
-
-    def populate_pci_path(self, original_entry: ioreg.io_registry_entry_t):
-        # Based off gfxutil logic, seems to work.
-        paths = []
-        entry = original_entry
-        while entry:
-            if ioreg.IOObjectConformsTo(entry, "IOPCIDevice".encode()):
-                # Virtual PCI devices provide a botched IOService path (us.electronic.kext.vusb)
-                # We only care about physical devices, so skip them
-                try:
-                    location = [hex(int(i, 16)) for i in ioreg.io_name_t_to_str(ioreg.IORegistryEntryGetLocationInPlane(entry, "IOService".encode(), None)[1]).split(",") + ["0"]]
-                    paths.append(f"Pci({location[0]},{location[1]})")
-                except ValueError:
-                    break
-            elif ioreg.IOObjectConformsTo(entry, "IOACPIPlatformDevice".encode()):
-                paths.append(f"PciRoot({hex(int(ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(entry, '_UID', ioreg.kCFAllocatorDefault, ioreg.kNilOptions)) or 0))})")  # type: ignore
-                break
-            elif ioreg.IOObjectConformsTo(entry, "IOPCIBridge".encode()):
-                pass
-            else:
-                # There's something in between that's not PCI! Abort
-                paths = []
+# Registry entry ID -> PCI path components from that entry upward, see _pci_path()
+_pci_path_cache: dict = {}
+
+
+def _pci_path(original_entry: ioreg.io_registry_entry_t) -> str:
+    # Based off gfxutil logic, seems to work.
+    # Sibling devices share parents, thus components above each visited entry are memoized by registry entry ID
+    # None represents an invalid path (something in between that's not PCI)
+    visited = []
+    components = ()
+    entry = original_entry
+    while entry:
+        entry_id = ioreg.IORegistryEntryGetRegistryEntryID(entry, None)[1]
+        if entry_id in _pci_path_cache:
+            components = _pci_path_cache[entry_id]
+            break
+        if ioreg.IOObjectConformsTo(entry, "IOPCIDevice".encode()):
+            # Virtual PCI devices provide a botched IOService path (us.electronic.kext.vusb)
+            # We only care about physical devices, so skip them
+            try:
+                location = [hex(int(i, 16)) for i in ioreg.io_name_t_to_str(ioreg.IORegistryEntryGetLocationInPlane(entry, "IOService".encode(), None)[1]).split(",") + ["0"]]
+                visited.append((entry_id, (f"Pci({location[0]},{location[1]})",)))
+            except ValueError:
+                _pci_path_cache[entry_id] = ()
                 break
-            parent = ioreg.IORegistryEntryGetParentEntry(entry, "IOService".encode(), None)[1]
-            if entry != original_entry:
-                ioreg.IOObjectRelease(entry)
-            entry = parent
-        self.pci_path = "/".join(reversed(paths))
-
-
-@dataclass
-class GPU(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x030000, 0x038000]
-    arch: enum.Enum = field(init=False)  # The architecture, see subclasses.
-
-    def __post_init__(self):
-        self.detect_arch()
-
-    def detect_arch(self):
-        raise NotImplementedError
-
-
-@dataclass
-class WirelessCard(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x028000]
-    country_code: str = field(init=False)
-    chipset: enum.Enum = field(init=False)
-
-    def __post_init__(self):
-        self.detect_chipset()
-
-    @classmethod
-    def from_ioregistry(cls, entry: ioreg.io_registry_entry_t, anti_spoof=True):
-        device = super().from_ioregistry(entry, anti_spoof=anti_spoof)
-
-        matching_dict = {
-            "IOParentMatch": ioreg.corefoundation_to_native(ioreg.IORegistryEntryIDMatching(ioreg.IORegistryEntryGetRegistryEntryID(entry, None)[1])),
-            "IOProviderClass": "IO80211Interface",
-        }
-
-        interface = next(ioreg.ioiterator_to_list(ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, matching_dict, None)[1]), None)
-        if interface:
-            device.country_code = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(interface, "IO80211CountryCode", ioreg.kCFAllocatorDefault, ioreg.kNilOptions))  # type: ignore # If not present, will be None anyways
-        else:
-            device.country_code = None  # type: ignore
-
-        return device
-
-    def detect_chipset(self):
-        raise NotImplementedError
-
-
-@dataclass
-class NVMeController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [
-        0x010802,
-        # I don't know if this is a typo or what, but Apple controllers are 01:80:02, not 01:08:02
-        0x018002
-    ]
-
-    aspm: Optional[int] = None
-    # parent_aspm: Optional[int] = None
-
-    @classmethod
-    def from_ioregistry(cls, entry: ioreg.io_registry_entry_t, anti_spoof=True):
-        device = super().from_ioregistry(entry, anti_spoof=anti_spoof)
-
-        device.aspm: Union[int, bytes] = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(entry, "pci-aspm-default", ioreg.kCFAllocatorDefault, ioreg.kNilOptions)) or 0  # type: ignore
-        if isinstance(device.aspm, bytes):
-            device.aspm = int.from_bytes(device.aspm, byteorder="little")
-
-        return device
-
-
-@dataclass
-class EthernetController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x020000]
-
-    chipset: enum.Enum = field(init=False)
-
-    def __post_init__(self):
-        self.detect_chipset()
-
-    def detect_chipset(self):
-        raise NotImplementedError
-
-@dataclass
-class SATAController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x010601]
-
-@dataclass
-class SASController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x010400]
-
-@dataclass
-class XHCIController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x0c0330]
-
-@dataclass
-class EHCIController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x0c0320]
-
-@dataclass
-class OHCIController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x0c0310]
-
-@dataclass
-class UHCIController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x0c0300]
-
-@dataclass
-class SDXCController(PCIDevice):
-    CLASS_CODES: ClassVar[list[int]] = [0x080501]
-
-@dataclass
-class NVIDIA(GPU):
-    VENDOR_ID: ClassVar[int] = 0x10DE
-
-    class Archs(enum.Enum):
-        # pylint: disable=invalid-name
-        Curie = "Curie"
-        Fermi = "Fermi"
-        Tesla = "Tesla"
-        Kepler = "Kepler"
-        Maxwell = "Maxwell"
-        Pascal = "Pascal"
-        Unknown = "Unknown"
-
-    arch: Archs = field(init=False)
-
-    def detect_arch(self):
-        # G80/G80GL
-        if self.device_id in pci_data.nvidia_ids.curie_ids:
-            self.arch = NVIDIA.Archs.Curie
-        elif self.device_id in pci_data.nvidia_ids.tesla_ids:
-            self.arch = NVIDIA.Archs.Tesla
-        elif self.device_id in pci_data.nvidia_ids.fermi_ids:
-            self.arch = NVIDIA.Archs.Fermi
-        elif self.device_id in pci_data.nvidia_ids.kepler_ids:
-            self.arch = NVIDIA.Archs.Kepler
-        elif self.device_id in pci_data.nvidia_ids.maxwell_ids:
-            self.arch = NVIDIA.Archs.Maxwell
-        elif self.device_id in pci_data.nvidia_ids.pascal_ids:
-            self.arch = NVIDIA.Archs.Pascal
-        else:
-            self.arch = NVIDIA.Archs.Unknown
-
-@dataclass
-class NVIDIAEthernet(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x10DE
-
-    class Chipsets(enum.Enum):
-        nForceEthernet = "nForceEthernet"
-
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        # nForce driver matches against Vendor ID, thus making all nForce chipsets supported
-        self.chipset = NVIDIAEthernet.Chipsets.nForceEthernet
-
-@dataclass
-class AMD(GPU):
-    VENDOR_ID: ClassVar[int] = 0x1002
-
-    class Archs(enum.Enum):
-        # pylint: disable=invalid-name
-        R500 = "R500"
-        TeraScale_1 = "TeraScale 1"
-        TeraScale_2 = "TeraScale 2"
-        Legacy_GCN_7000 = "Legacy GCN v1"
-        Legacy_GCN_8000 = "Legacy GCN v2"
-        Legacy_GCN_9000 = "Legacy GCN v3"
-        Polaris = "Polaris"
-        Polaris_Spoof = "Polaris (Spoofed)"
-        Vega = "Vega"
-        Navi = "Navi"
-        Unknown = "Unknown"
-
-    arch: Archs = field(init=False)
-
-    def detect_arch(self):
-        if self.device_id in pci_data.amd_ids.r500_ids:
-            self.arch = AMD.Archs.R500
-        elif self.device_id in pci_data.amd_ids.gcn_7000_ids:
-            self.arch = AMD.Archs.Legacy_GCN_7000
-        elif self.device_id in pci_data.amd_ids.gcn_8000_ids:
-            self.arch = AMD.Archs.Legacy_GCN_8000
-        elif self.device_id in pci_data.amd_ids.gcn_9000_ids:
-            self.arch = AMD.Archs.Legacy_GCN_9000
-        elif self.device_id in pci_data.amd_ids.terascale_1_ids:
-            self.arch = AMD.Archs.TeraScale_1
-        elif self.device_id in pci_data.amd_ids.terascale_2_ids:
-            self.arch = AMD.Archs.TeraScale_2
-        elif self.device_id in pci_data.amd_ids.polaris_ids:
-            self.arch = AMD.Archs.Polaris
-        elif self.device_id in pci_data.amd_ids.polaris_spoof_ids:
-            self.arch = AMD.Archs.Polaris_Spoof
-        elif self.device_id in pci_data.amd_ids.vega_ids:
-            self.arch = AMD.Archs.Vega
-        elif self.device_id in pci_data.amd_ids.navi_ids:
-            self.arch = AMD.Archs.Navi
-        else:
-            self.arch = AMD.Archs.Unknown
-
-
-@dataclass
-class Intel(GPU):
-    VENDOR_ID: ClassVar[int] = 0x8086
-
-    class Archs(enum.Enum):
-        # pylint: disable=invalid-name
-        GMA_950 = "GMA 950"
-        GMA_X3100 = "GMA X3100"
-        Iron_Lake = "Iron Lake"
-        Sandy_Bridge = "Sandy Bridge"
-        Ivy_Bridge = "Ivy Bridge"
-        Haswell = "Haswell"
-        Broadwell = "Broadwell"
-        Skylake = "Skylake"
-        Kaby_Lake = "Kaby Lake"
-        Coffee_Lake = "Coffee Lake"
-        Comet_Lake = "Comet Lake"
-        Ice_Lake = "Ice Lake"
-        Unknown = "Unknown"
-
-    arch: Archs = field(init=False)
-
-    def detect_arch(self):
-        if self.device_id in pci_data.intel_ids.gma_950_ids:
-            self.arch = Intel.Archs.GMA_950
-        elif self.device_id in pci_data.intel_ids.gma_x3100_ids:
-            self.arch = Intel.Archs.GMA_X3100
-        elif self.device_id in pci_data.intel_ids.iron_ids:
-            self.arch = Intel.Archs.Iron_Lake
-        elif self.device_id in pci_data.intel_ids.sandy_ids:
-            self.arch = Intel.Archs.Sandy_Bridge
-        elif self.device_id in pci_data.intel_ids.ivy_ids:
-            self.arch = Intel.Archs.Ivy_Bridge
-        elif self.device_id in pci_data.intel_ids.haswell_ids:
-            self.arch = Intel.Archs.Haswell
-        elif self.device_id in pci_data.intel_ids.broadwell_ids:
-            self.arch = Intel.Archs.Broadwell
-        elif self.device_id in pci_data.intel_ids.skylake_ids:
-            self.arch = Intel.Archs.Skylake
-        elif self.device_id in pci_data.intel_ids.kaby_lake_ids:
-            self.arch = Intel.Archs.Kaby_Lake
-        elif self.device_id in pci_data.intel_ids.coffee_lake_ids:
-            self.arch = Intel.Archs.Coffee_Lake
-        elif self.device_id in pci_data.intel_ids.comet_lake_ids:
-            self.arch = Intel.Archs.Comet_Lake
-        elif self.device_id in pci_data.intel_ids.ice_lake_ids:
-            self.arch = Intel.Archs.Ice_Lake
-        else:
-            self.arch = Intel.Archs.Unknown
-
-@dataclass
-class IntelEthernet(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x8086
-
-    class Chipsets(enum.Enum):
-        AppleIntel8254XEthernet = "AppleIntel8254XEthernet Supported"
-        AppleIntelI210Ethernet = "AppleIntelI210Ethernet Supported"
-        Intel82574L = "Intel82574L Supported"
-        Unknown = "Unknown"
-
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        if self.device_id in pci_data.intel_ids.AppleIntel8254XEthernet:
-            self.chipset = IntelEthernet.Chipsets.AppleIntel8254XEthernet
-        elif self.device_id in pci_data.intel_ids.AppleIntelI210Ethernet:
-            self.chipset = IntelEthernet.Chipsets.AppleIntelI210Ethernet
-        elif self.device_id in pci_data.intel_ids.Intel82574L:
-            self.chipset = IntelEthernet.Chipsets.Intel82574L
-        else:
-            self.chipset = IntelEthernet.Chipsets.Unknown
-
-@dataclass
-class Broadcom(WirelessCard):
-    VENDOR_ID: ClassVar[int] = 0x14E4
-
-    class Chipsets(enum.Enum):
-        # pylint: disable=invalid-name
-        AppleBCMWLANBusInterfacePCIe = "AppleBCMWLANBusInterfacePCIe supported"
-        AirportBrcmNIC = "AirportBrcmNIC supported"
-        AirPortBrcmNICThirdParty = "AirPortBrcmNICThirdParty supported"
-        AirPortBrcm4360 = "AirPortBrcm4360 supported"
-        AirPortBrcm4331 = "AirPortBrcm4331 supported"
-        AirPortBrcm43224 = "AppleAirPortBrcm43224 supported"
-        Unknown = "Unknown"
-
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        if self.device_id in pci_data.broadcom_ids.AppleBCMWLANBusInterfacePCIe:
-            self.chipset = Broadcom.Chipsets.AppleBCMWLANBusInterfacePCIe
-        elif self.device_id in pci_data.broadcom_ids.AirPortBrcmNIC:
-            self.chipset = Broadcom.Chipsets.AirportBrcmNIC
-        elif self.device_id in pci_data.broadcom_ids.AirPortBrcmNICThirdParty:
-            self.chipset = Broadcom.Chipsets.AirPortBrcmNICThirdParty
-        elif self.device_id in pci_data.broadcom_ids.AirPortBrcm4360:
-            self.chipset = Broadcom.Chipsets.AirPortBrcm4360
-        elif self.device_id in pci_data.broadcom_ids.AirPortBrcm4331:
-            self.chipset = Broadcom.Chipsets.AirPortBrcm4331
-        elif self.device_id in pci_data.broadcom_ids.AppleAirPortBrcm43224:
-            self.chipset = Broadcom.Chipsets.AirPortBrcm43224
-        else:
-            self.chipset = Broadcom.Chipsets.Unknown
-
-@dataclass
-class BroadcomEthernet(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x14E4
-
-    class Chipsets(enum.Enum):
-        AppleBCM5701Ethernet = "AppleBCM5701Ethernet supported"
-        Unknown = "Unknown"
-
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        if self.device_id in pci_data.broadcom_ids.AppleBCM5701Ethernet:
-            self.chipset = BroadcomEthernet.Chipsets.AppleBCM5701Ethernet
+        elif ioreg.IOObjectConformsTo(entry, "IOACPIPlatformDevice".encode()):
+            components = (f"PciRoot({hex(int(ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(entry, '_UID', ioreg.kCFAllocatorDefault, ioreg.kNilOptions)) or 0))})",)  # type: ignore
+            _pci_path_cache[entry_id] = components
+            break
+        elif ioreg.IOObjectConformsTo(entry, "IOPCIBridge".encode()):
+            visited.append((entry_id, ()))
         else:
-            self.chipset = BroadcomEthernet.Chipsets.Unknown
-
-@dataclass
-class Atheros(WirelessCard):
-    VENDOR_ID: ClassVar[int] = 0x168C
-
-    class Chipsets(enum.Enum):
-        # pylint: disable=invalid-name
-        # Well there's only one model but
-        AirPortAtheros40 = "AirPortAtheros40 supported"
-        Unknown = "Unknown"
-
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        if self.device_id in pci_data.atheros_ids.AtherosWifi:
-            self.chipset = Atheros.Chipsets.AirPortAtheros40
-        else:
-            self.chipset = Atheros.Chipsets.Unknown
+            # There's something in between that's not PCI! Abort
+            components = None
+            _pci_path_cache[entry_id] = components
+            break
+        parent = ioreg.IORegistryEntryGetParentEntry(entry, "IOService".encode(), None)[1]
+        if entry != original_entry:
+            ioreg.IOObjectRelease(entry)
+        entry = parent
+
+    if entry and entry != original_entry:
+        ioreg.IOObjectRelease(entry)
 
+    for entry_id, component in reversed(visited):
+        components = None if components is None else component + components
+        _pci_path_cache[entry_id] = components
 
-@dataclass
-class Aquantia(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x1D6A
+    return "" if components is None else "/".join(reversed(components))
 
-    class Chipsets(enum.Enum):
-        # pylint: disable=invalid-name
-        AppleEthernetAquantiaAqtion = "AppleEthernetAquantiaAqtion supported"
-        Unknown = "Unknown"
 
-    chipset: Chipsets = field(init=False)
+def _country_code(entry: ioreg.io_registry_entry_t) -> Optional[str]:
+    matching_dict = {
+        "IOParentMatch": ioreg.corefoundation_to_native(ioreg.IORegistryEntryIDMatching(ioreg.IORegistryEntryGetRegistryEntryID(entry, None)[1])),
+        "IOProviderClass": "IO80211Interface",
+    }
 
-    def detect_chipset(self):
-        if self.device_id in pci_data.aquantia_ids.AppleEthernetAquantiaAqtion:
-            self.chipset = Aquantia.Chipsets.AppleEthernetAquantiaAqtion
-        else:
-            self.chipset = Aquantia.Chipsets.Unknown
-
-@dataclass
-class Marvell(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x11AB
-
-    class Chipsets(enum.Enum):
-        MarvelYukonEthernet = "MarvelYukonEthernet supported"
-        Unknown = "Unknown"
+    interface = next(ioreg.ioiterator_to_list(ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, matching_dict, None)[1]), None)
+    if not interface:
+        return None
 
-    chipset: Chipsets = field(init=False)
+    country_code = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(interface, "IO80211CountryCode", ioreg.kCFAllocatorDefault, ioreg.kNilOptions))  # type: ignore # If not present, will be None anyways
+    ioreg.IOObjectRelease(interface)
+    return country_code
 
-    def detect_chipset(self):
-        if self.device_id in pci_data.marvell_ids.MarvelYukonEthernet:
-            self.chipset = Marvell.Chipsets.MarvelYukonEthernet
-        else:
-            self.chipset = Marvell.Chipsets.Unknown
 
 @dataclass
-class SysKonnect(EthernetController):
-    VENDOR_ID: ClassVar[int] = 0x1148
+class PCIRegistry(pci_devices.PCIRegistry):
+    """
+    All IOPCIDevice entries, enumerated in a single IORegistry pass
 
-    class Chipsets(enum.Enum):
-        MarvelYukonEthernet = "MarvelYukonEthernet supported"
-        Unknown = "Unknown"
+    Entries hold their registry entry until release(), classification itself is done by pci_devices.PCIRegistry
+    """
 
-    chipset: Chipsets = field(init=False)
-
-    def detect_chipset(self):
-        if self.device_id in pci_data.syskonnect_ids.MarvelYukonEthernet:
-            self.chipset = SysKonnect.Chipsets.MarvelYukonEthernet
-        else:
-            self.chipset = SysKonnect.Chipsets.Unknown
+    @classmethod
+    def from_ioregistry(cls) -> "PCIRegistry":
+        registry = cls()
+        wireless_class_codes = [class_code_to_bytes(class_code) for class_code in WirelessCard.CLASS_CODES]
+        devices = ioreg.ioiterator_to_list(
+            ioreg.IOServiceGetMatchingServices(
+                ioreg.kIOMasterPortDefault, {"IOProviderClass": "IOPCIDevice"}, None
+            )[1]
+        )
+        for index, device in enumerate(devices):
+            properties: dict = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperties(device, None, ioreg.kCFAllocatorDefault, ioreg.kNilOptions)[1])  # type: ignore
+            if not isinstance(properties.get("class-code"), bytes):
+                ioreg.IOObjectRelease(device)
+                continue
+            registry.add(PCIRegistryEntry(
+                index,
+                ioreg.io_name_t_to_str(ioreg.IORegistryEntryGetName(device, None)[1]),
+                properties,
+                _pci_path(device),
+                _country_code(device) if properties["class-code"] in wireless_class_codes else None,
+                device,
+            ))
+        return registry
+
+    def release(self):
+        for device in itertools.chain.from_iterable(self.devices.values()):
+            ioreg.IOObjectRelease(device.entry)
+        self.devices = {}
 
 
 @dataclass
@@ -658,14 +295,18 @@ class Computer:
     @staticmethod
     def probe():
         computer = Computer()
-        computer.gpu_probe()
-        computer.dgpu_probe()
-        computer.igpu_probe()
-        computer.wifi_probe()
-        computer.storage_probe()
-        computer.usb_controller_probe()
-        computer.sdxc_controller_probe()
-        computer.ethernet_probe()
+        registry = PCIRegistry.from_ioregistry()
+        try:
+            computer.gpu_probe(registry)
+            computer.dgpu_probe(registry)
+            computer.igpu_probe(registry)
+            computer.wifi_probe(registry)
+            computer.storage_probe(registry)
+            computer.usb_controller_probe(registry)
+            computer.sdxc_controller_probe(registry)
+            computer.ethernet_probe(registry)
+        finally:
+            registry.release()
         computer.smbios_probe()
         computer.usb_device_probe()
         computer.cpu_probe()
@@ -694,57 +335,17 @@ class Computer:
             ioreg.IOObjectRelease(device)
 
 
-    def gpu_probe(self):
-        # Chain together two iterators: one for class code 03:00:00, the other for class code 03:80:00
-        devices = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault, GPU.class_code_matching_dict(), None
-            )[1]
-        )
+    def gpu_probe(self, registry: PCIRegistry):
+        self.gpus = registry.gpus()
 
-        for device in devices:
-            vendor: Type[GPU] = PCIDevice.from_ioregistry(device).vendor_detect(inherits=GPU)  # type: ignore
-            if vendor:
-                self.gpus.append(vendor.from_ioregistry(device))  # type: ignore
-            ioreg.IOObjectRelease(device)
-
-    def dgpu_probe(self):
-        device = next(ioreg.ioiterator_to_list(ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, ioreg.IOServiceNameMatching("GFX0".encode()), None)[1]), None)
-        if not device:
-            # No devices
-            return
+    def dgpu_probe(self, registry: PCIRegistry):
+        self.dgpu = registry.gpu("GFX0")
 
-        vendor: Type[GPU] = PCIDevice.from_ioregistry(device).vendor_detect(inherits=GPU)  # type: ignore
-        if vendor:
-            self.dgpu = vendor.from_ioregistry(device)  # type: ignore
-        ioreg.IOObjectRelease(device)
-
-    def igpu_probe(self):
-        device = next(ioreg.ioiterator_to_list(ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, ioreg.IOServiceNameMatching("IGPU".encode()), None)[1]), None)
-        if not device:
-            # No devices
-            return
+    def igpu_probe(self, registry: PCIRegistry):
+        self.igpu = registry.gpu("IGPU")
 
-        vendor: Type[GPU] = PCIDevice.from_ioregistry(device).vendor_detect(inherits=GPU)  # type: ignore
-        if vendor:
-            self.igpu = vendor.from_ioregistry(device)  # type: ignore
-        ioreg.IOObjectRelease(device)
-
-    def wifi_probe(self):
-        devices = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                WirelessCard.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-
-        for device in devices:
-            vendor: Type[WirelessCard] = PCIDevice.from_ioregistry(device, anti_spoof=True).vendor_detect(inherits=WirelessCard)  # type: ignore
-            if vendor:
-                self.wifi = vendor.from_ioregistry(device, anti_spoof=True)  # type: ignore
-                break
-            ioreg.IOObjectRelease(device)
+    def wifi_probe(self, registry: PCIRegistry):
+        self.wifi = registry.wifi()
 
     def ambient_light_sensor_probe(self):
         device = next(ioreg.ioiterator_to_list(ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, ioreg.IOServiceNameMatching("ALS0".encode()), None)[1]), None)
@@ -759,111 +360,17 @@ class Computer:
             self.pcie_webcam = True
             ioreg.IOObjectRelease(device)
 
-    def sdxc_controller_probe(self):
-        sdxc_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                SDXCController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
+    def sdxc_controller_probe(self, registry: PCIRegistry):
+        self.sdxc_controller = registry.sdxc_controllers()
 
-        for device in sdxc_controllers:
-            self.sdxc_controller.append(SDXCController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
+    def usb_controller_probe(self, registry: PCIRegistry):
+        self.usb_controllers = registry.usb_controllers()
 
-    def usb_controller_probe(self):
-        xhci_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                XHCIController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-        ehci_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                EHCIController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-        ohci_controllers  = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                OHCIController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-
-        uhci_controllers  = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                UHCIController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-        for device in xhci_controllers:
-            self.usb_controllers.append(XHCIController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
-        for device in ehci_controllers:
-            self.usb_controllers.append(EHCIController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
-        for device in ohci_controllers:
-            self.usb_controllers.append(OHCIController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
-        for device in uhci_controllers:
-            self.usb_controllers.append(UHCIController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
+    def ethernet_probe(self, registry: PCIRegistry):
+        self.ethernet = registry.ethernet()
 
-    def ethernet_probe(self):
-        ethernet_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                EthernetController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-
-        for device in ethernet_controllers:
-            vendor: Type[EthernetController] = PCIDevice.from_ioregistry(device).vendor_detect(inherits=EthernetController)  # type: ignore
-            if vendor:
-                self.ethernet.append(vendor.from_ioregistry(device))  # type: ignore
-            ioreg.IOObjectRelease(device)
-
-    def storage_probe(self):
-        sata_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                SATAController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-        sas_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                SASController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-
-        nvme_controllers = ioreg.ioiterator_to_list(
-            ioreg.IOServiceGetMatchingServices(
-                ioreg.kIOMasterPortDefault,
-                NVMeController.class_code_matching_dict(),
-                None,
-            )[1]
-        )
-        for device in sata_controllers:
-            self.storage.append(SATAController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
-
-        for device in sas_controllers:
-            self.storage.append(SASController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
-
-        for device in nvme_controllers:
-            self.storage.append(NVMeController.from_ioregistry(device))
-            ioreg.IOObjectRelease(device)
+    def storage_probe(self, registry: PCIRegistry):
+        self.storage = registry.storage()
 
     def smbios_probe(self):
         # Reported model
@@ -0,0 +1,256 @@
+"""
+device_snapshot.py: Serializable hardware snapshots for device_probe.Computer
+
+Computer.probe() walks the IORegistry many times over, with identical results
+for the remainder of a boot session. Snapshots allow the probe to be cached
+between launches, and replayed offline (ie. fleet snapshots for testing
+detection and builds, similar to the example_data fixtures).
+
+Usage:
+>>> from detections import device_snapshot
+
+>>> # Round trip
+>>> data     = device_snapshot.to_json(computer)
+>>> computer = device_snapshot.from_json(data)
+
+>>> # Probe, reusing the cached snapshot when the boot session and PCI topology are unchanged
+>>> computer = device_snapshot.HardwareSnapshotCache(patcher_version).probe()
+"""
+
+import enum
+import json
+import hashlib
+import logging
+import subprocess
+import dataclasses
+
+from pathlib import Path
+
+from . import (
+    ioreg,
+    device_probe
+)
+
+
+SNAPSHOT_VERSION: int  = 1
+CACHE_PATH:       Path = Path.home() / "Library/Caches/com.dortania.opencore-legacy-patcher/Hardware-Snapshot.json"
+
+
+def _resolve(qualified_name: str) -> type:
+    """
+    Resolve a class name (ie. 'NVIDIA.Archs') within device_probe
+    Only dataclasses and enums are permitted
+    """
+
+    resolved = device_probe
+    for name in qualified_name.split("."):
+        resolved = getattr(resolved, name, None)
+        if resolved is None:
+            raise ValueError(f"Unknown snapshot type: {qualified_name}")
+
+    if not isinstance(resolved, type) or not (dataclasses.is_dataclass(resolved) or issubclass(resolved, enum.Enum)):
+        raise ValueError(f"Unsupported snapshot type: {qualified_name}")
+
+    return resolved
+
+
+def _encode(value, references: dict):
+    if dataclasses.is_dataclass(value):
+        # Preserve shared instances (ie. Computer.dgpu referencing an entry in Computer.gpus)
+        if id(value) in references:
+            return {"__ref__": references[id(value)]}
+        references[id(value)] = len(references)
+
+        encoded = {"__class__": type(value).__qualname__, "__id__": references[id(value)]}
+        for item in dataclasses.fields(value):
+            if hasattr(value, item.name):
+                encoded[item.name] = _encode(getattr(value, item.name), references)
+        return encoded
+
+    if isinstance(value, enum.Enum):
+        return {"__enum__": type(value).__qualname__, "name": value.name}
+    if isinstance(value, bytes):
+        return {"__bytes__": value.hex()}
+    if isinstance(value, list):
+        return [_encode(item, references) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item, references) for key, item in value.items()}
+
+    return value
+
+
+def _decode(value, references: dict):
+    if isinstance(value, list):
+        return [_decode(item, references) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if "__ref__" in value:
+        return references[value["__ref__"]]
+    if "__enum__" in value:
+        return _resolve(value["__enum__"])[value["name"]]
+    if "__bytes__" in value:
+        return bytes.fromhex(value["__bytes__"])
+    if "__class__" not in value:
+        return {key: _decode(item, references) for key, item in value.items()}
+
+    cls = _resolve(value["__class__"])
+    if not dataclasses.is_dataclass(cls):
+        raise ValueError(f"Unsupported snapshot type: {value['__class__']}")
+
+    # Bypass __init__/__post_init__, derived fields (ie. arch, chipset) are part of the snapshot
+    decoded = cls.__new__(cls)
+    references[value["__id__"]] = decoded
+    for item in dataclasses.fields(cls):
+        if item.name in value:
+            setattr(decoded, item.name, _decode(value[item.name], references))
+        elif item.default is not dataclasses.MISSING:
+            setattr(decoded, item.name, item.default)
+        elif item.default_factory is not dataclasses.MISSING:
+            setattr(decoded, item.name, item.default_factory())
+
+    return decoded
+
+
+def to_json(computer: device_probe.Computer) -> str:
+    """
+    Serialize a probed Computer to JSON
+    """
+    return json.dumps({"Version": SNAPSHOT_VERSION, "Computer": _encode(computer, {})}, indent=4)
+
+
+def from_json(data: str) -> device_probe.Computer:
+    """
+    Deserialize a Computer from JSON, see to_json()
+    """
+
+    snapshot = json.loads(data)
+    if snapshot.get("Version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {snapshot.get('Version')}")
+
+    computer = _decode(snapshot["Computer"], {})
+    if not isinstance(computer, device_probe.Computer):
+        raise ValueError("Snapshot does not contain a Computer")
+    return computer
+
+
+class HardwareSnapshotCache:
+    """
+    Cache Computer.probe() results between launches
+
+    Snapshots are keyed by patcher version, boot session UUID and a hash of the PCI
+    topology, thus are discarded on reboot, patcher update or PCI topology change.
+    State which may change within a boot session (root patch status, Rosetta, USB
+    devices and properties derived from them) is re-probed on every load
+
+    Parameters:
+        patcher_version (str):  Current patcher version
+        cache_path      (Path): Location of the cached snapshot
+    """
+
+    def __init__(self, patcher_version: str, cache_path: Path = CACHE_PATH) -> None:
+        self.patcher_version = patcher_version
+        self.cache_path      = Path(cache_path)
+
+
+    def _boot_session_uuid(self) -> str:
+        return subprocess.run(["/usr/sbin/sysctl", "-n", "kern.bootsessionuuid"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT).stdout.decode().strip()
+
+
+    def _pci_topology_hash(self) -> str:
+        """
+        Hash identity and location of every PCI device, using a single IORegistry query
+        """
+
+        entries = []
+        devices = ioreg.ioiterator_to_list(
+            ioreg.IOServiceGetMatchingServices(ioreg.kIOMasterPortDefault, {"IOProviderClass": "IOPCIDevice"}, None)[1]
+        )
+        for device in devices:
+            properties: dict = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperties(device, None, ioreg.kCFAllocatorDefault, ioreg.kNilOptions)[1])  # type: ignore
+            location = ioreg.io_name_t_to_str(ioreg.IORegistryEntryGetLocationInPlane(device, "IOService".encode(), None)[1])
+            identity = [properties.get(key, b"") for key in ["vendor-id", "device-id", "class-code", "subsystem-id"]]
+            entries.append(location + ":" + ",".join(x.hex() if isinstance(x, bytes) else str(x) for x in identity))
+            ioreg.IOObjectRelease(device)
+
+        return hashlib.sha256("\n".join(sorted(entries)).encode()).hexdigest()
+
+
+    def _cache_key(self) -> str:
+        return f"{self.patcher_version}-{self._boot_session_uuid()}-{self._pci_topology_hash()}"
+
+
+    def load(self, cache_key: str) -> device_probe.Computer:
+        """
+        Load cached snapshot
+
+        Returns:
+            device_probe.Computer: Cached Computer, or None if missing or stale
+        """
+
+        if not self.cache_path.exists():
+            return None
+
+        try:
+            cached = json.loads(self.cache_path.read_text())
+            if cached.get("Key") != cache_key:
+                return None
+            return from_json(cached["Snapshot"])
+        except Exception as e:
+            logging.warning(f"Failed to load hardware snapshot: {e}")
+            return None
+
+
+    def save(self, cache_key: str, computer: device_probe.Computer) -> None:
+        """
+        Save snapshot, failures are non-fatal
+        """
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            temp_path.write_text(json.dumps({"Key": cache_key, "Snapshot": to_json(computer)}))
+            temp_path.replace(self.cache_path)
+        except Exception as e:
+            logging.warning(f"Failed to save hardware snapshot: {e}")
+
+
+    def probe(self) -> device_probe.Computer:
+        """
+        Probe hardware, reusing the cached snapshot if still valid
+        """
+
+        try:
+            cache_key = self._cache_key()
+        except Exception as e:
+            logging.warning(f"Failed to generate hardware snapshot key, probing: {e}")
+            return device_probe.Computer.probe()
+
+        computer = self.load(cache_key)
+        if computer is None:
+            computer = device_probe.Computer.probe()
+            self.save(cache_key, computer)
+            return computer
+
+        logging.info("Using cached hardware snapshot")
+
+        # Root volume patch status and Rosetta may change within a boot session
+        computer.oclp_sys_version = None
+        computer.oclp_sys_date    = None
+        computer.oclp_sys_url     = None
+        computer.oclp_sys_signed  = False
+        computer.oclp_sys_patch_probe()
+        computer.check_rosetta()
+
+        # USB devices may be hot-plugged (ie. Bluetooth dongles), thus are not covered by the cache key
+        computer.usb_devices            = []
+        computer.bluetooth_chipset      = None
+        computer.internal_keyboard_type = None
+        computer.trackpad_type          = None
+        computer.t1_chip                = False
+        computer.usb_device_probe()
+        computer.bluetooth_probe()
+        computer.topcase_probe()
+        computer.t1_probe()
+
+        return computer
@@ -0,0 +1,630 @@
+"""
+pci_devices.py: PCI device classification, independent of IOKit
+
+Devices are classified from their IORegistry properties, as enumerated by
+device_probe.PCIRegistry.from_ioregistry(). Registries may also be loaded
+from recorded dumps, allowing classification to be exercised on any platform.
+
+Usage:
+>>> from detections import pci_devices, device_probe
+
+>>> # Record on macOS
+>>> plistlib.dump(device_probe.PCIRegistry.from_ioregistry().dump(), file)
+
+>>> # Classify anywhere
+>>> registry = pci_devices.PCIRegistry.from_dump(plistlib.load(file))
+>>> gpus     = registry.gpus()
+>>> wifi     = registry.wifi()
+"""
+
+import enum
+import logging
+import itertools
+import types
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterable, Optional, Type
+
+from ..datasets import pci_data
+
+
+def class_code_to_bytes(class_code: int) -> bytes:
+    return class_code.to_bytes(4, byteorder="little")
+
+
+@dataclass
+class PCIDevice:
+    VENDOR_ID: ClassVar[int]  # Default vendor id, for subclasses.
+    CLASS_CODES: ClassVar[list[int]]  # Default class codes, for subclasses.
+
+    vendor_id:  int  # The vendor ID of this PCI device
+    device_id:  int  # The device ID of this PCI device
+    class_code: int  # The class code of this PCI device - https://pci-ids.ucw.cz/read/PD
+
+    name:                Optional[str]  = None  # Name of IORegistryEntry
+    model:               Optional[str]  = None  # model property
+    acpi_path:           Optional[str]  = None  # ACPI Device Path
+    pci_path:            Optional[str]  = None  # PCI Device Path
+    disable_metal:       Optional[bool] = False # 'disable-metal' property
+    force_compatible:    Optional[bool] = False # 'force-compat' property
+    vendor_id_unspoofed: Optional[int]  = -1    # Unspoofed vendor ID of this PCI device
+    device_id_unspoofed: Optional[int]  = -1    # Unspoofed device ID of this PCI device
+
+    # (vendor ID, class code, inherits) -> vendor subclass, see vendor_detect()
+    _vendor_table: ClassVar[dict] = {}
+
+    @classmethod
+    def class_code_matching_dict(cls) -> dict:
+        return {
+            "IOProviderClass": "IOPCIDevice",
+            "IOPropertyMatch": [{"class-code": class_code_to_bytes(class_code)} for class_code in cls.CLASS_CODES]
+        }
+
+    @classmethod
+    def from_properties(cls, properties: dict, name: Optional[str] = None, anti_spoof=False):
+        vendor_id = None
+        device_id = None
+        vendor_id_unspoofed = None
+        device_id_unspoofed = None
+
+        if "IOName" in properties:
+            ioname = properties["IOName"]
+            if type(ioname) is bytes:
+                ioname = ioname.strip(b"\0").decode()
+
+            if ioname.startswith("pci") and "," in ioname:
+                vendor_id_unspoofed, device_id_unspoofed = (int(i, 16) for i in ioname[3:].split(","))
+                if anti_spoof:
+                    vendor_id = vendor_id_unspoofed
+                    device_id = device_id_unspoofed
+
+        if vendor_id is None and device_id is None:
+            vendor_id, device_id = [int.from_bytes(properties[i][:4], byteorder="little") for i in ["vendor-id", "device-id"]]
+
+        if vendor_id_unspoofed is None and device_id_unspoofed is None:
+            vendor_id_unspoofed = vendor_id
+            device_id_unspoofed = device_id
+
+        device = cls(vendor_id, device_id, int.from_bytes(properties["class-code"][:6], byteorder="little"), name=name)
+        if "model" in properties:
+            model = properties["model"]
+            if isinstance(model, bytes):
+                model = model.strip(b"\0").decode()
+            device.model = model
+        if "acpi-path" in properties:
+            device.acpi_path = properties["acpi-path"]
+        if "disable-metal" in properties:
+            device.disable_metal = True
+        if "force-compat" in properties:
+            device.force_compatible = True
+
+        device.vendor_id_unspoofed = vendor_id_unspoofed
+        device.device_id_unspoofed = device_id_unspoofed
+        return device
+
+    @classmethod
+    def from_registry_entry(cls, entry: "PCIRegistryEntry", anti_spoof=False):
+        device = cls.from_properties(entry.properties, name=entry.name, anti_spoof=anti_spoof)
+        device.pci_path = entry.pci_path
+        return device
+
+    def vendor_detect(self, *, inherits: Optional[Type["PCIDevice"]] = None, classes: Optional[list] = None):
+        if classes is not None:
+            return self._vendor_scan(inherits, classes)
+
+        # detect() only depends on the vendor ID and class code, thus results are shared between devices
+        key = (self.vendor_id, self.class_code, inherits)
+        if key not in PCIDevice._vendor_table:
+            PCIDevice._vendor_table[key] = self._vendor_scan(inherits, None)
+        return PCIDevice._vendor_table[key]
+
+    def _vendor_scan(self, inherits: Optional[Type["PCIDevice"]], classes: Optional[list]):
+        for i in classes or itertools.chain.from_iterable([subclass.__subclasses__() for subclass in PCIDevice.__subclasses__()]):
+            if issubclass(i, inherits or object) and i.detect(self):
+                return i
+        return None
+
+    def lookup_device_id(self, default: enum.Enum) -> enum.Enum:
+        """
+        Resolve architecture or chipset from DEVICE_ID_TABLE, falling back to default
+        """
+        match = DEVICE_ID_TABLE.get((self.VENDOR_ID, self.device_id))
+        return match if isinstance(match, type(default)) else default
+
+    @classmethod
+    def detect(cls, device):
+        return device.vendor_id == cls.VENDOR_ID and ((device.class_code in cls.CLASS_CODES) if getattr(cls, "CLASS_CODES", None) else True) and ((device.class_code == cls.CLASS_CODE) if getattr(cls, "CLASS_CODE", None) else True)  # type: ignore  # pylint: disable=no-member
+
+
+@dataclass
+class GPU(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x030000, 0x038000]
+    arch: enum.Enum = field(init=False)  # The architecture, see subclasses.
+
+    def __post_init__(self):
+        self.detect_arch()
+
+    def detect_arch(self):
+        raise NotImplementedError
+
+
+@dataclass
+class WirelessCard(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x028000]
+    country_code: str = field(init=False)
+    chipset: enum.Enum = field(init=False)
+
+    def __post_init__(self):
+        self.detect_chipset()
+
+    @classmethod
+    def from_registry_entry(cls, entry: "PCIRegistryEntry", anti_spoof=True):
+        device = super().from_registry_entry(entry, anti_spoof=anti_spoof)
+        device.country_code = entry.country_code  # type: ignore # If not present, will be None anyways
+        return device
+
+    def detect_chipset(self):
+        raise NotImplementedError
+
+
+@dataclass
+class NVMeController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [
+        0x010802,
+        # I don't know if this is a typo or what, but Apple controllers are 01:80:02, not 01:08:02
+        0x018002
+    ]
+
+    aspm: Optional[int] = None
+    # parent_aspm: Optional[int] = None
+
+    @classmethod
+    def from_registry_entry(cls, entry: "PCIRegistryEntry", anti_spoof=True):
+        device = super().from_registry_entry(entry, anti_spoof=anti_spoof)
+
+        device.aspm = entry.properties.get("pci-aspm-default") or 0
+        if isinstance(device.aspm, bytes):
+            device.aspm = int.from_bytes(device.aspm, byteorder="little")
+
+        return device
+
+
+@dataclass
+class EthernetController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x020000]
+
+    chipset: enum.Enum = field(init=False)
+
+    def __post_init__(self):
+        self.detect_chipset()
+
+    def detect_chipset(self):
+        raise NotImplementedError
+
+@dataclass
+class SATAController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x010601]
+
+@dataclass
+class SASController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x010400]
+
+@dataclass
+class XHCIController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x0c0330]
+
+@dataclass
+class EHCIController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x0c0320]
+
+@dataclass
+class OHCIController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x0c0310]
+
+@dataclass
+class UHCIController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x0c0300]
+
+@dataclass
+class SDXCController(PCIDevice):
+    CLASS_CODES: ClassVar[list[int]] = [0x080501]
+
+@dataclass
+class NVIDIA(GPU):
+    VENDOR_ID: ClassVar[int] = 0x10DE
+
+    class Archs(enum.Enum):
+        # pylint: disable=invalid-name
+        Curie = "Curie"
+        Fermi = "Fermi"
+        Tesla = "Tesla"
+        Kepler = "Kepler"
+        Maxwell = "Maxwell"
+        Pascal = "Pascal"
+        Unknown = "Unknown"
+
+    arch: Archs = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Archs.Curie:   pci_data.nvidia_ids.curie_ids,
+        Archs.Tesla:   pci_data.nvidia_ids.tesla_ids,
+        Archs.Fermi:   pci_data.nvidia_ids.fermi_ids,
+        Archs.Kepler:  pci_data.nvidia_ids.kepler_ids,
+        Archs.Maxwell: pci_data.nvidia_ids.maxwell_ids,
+        Archs.Pascal:  pci_data.nvidia_ids.pascal_ids,
+    }
+
+    def detect_arch(self):
+        self.arch = self.lookup_device_id(NVIDIA.Archs.Unknown)
+
+@dataclass
+class NVIDIAEthernet(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x10DE
+
+    class Chipsets(enum.Enum):
+        nForceEthernet = "nForceEthernet"
+
+    chipset: Chipsets = field(init=False)
+
+    def detect_chipset(self):
+        # nForce driver matches against Vendor ID, thus making all nForce chipsets supported
+        self.chipset = NVIDIAEthernet.Chipsets.nForceEthernet
+
+@dataclass
+class AMD(GPU):
+    VENDOR_ID: ClassVar[int] = 0x1002
+
+    class Archs(enum.Enum):
+        # pylint: disable=invalid-name
+        R500 = "R500"
+        TeraScale_1 = "TeraScale 1"
+        TeraScale_2 = "TeraScale 2"
+        Legacy_GCN_7000 = "Legacy GCN v1"
+        Legacy_GCN_8000 = "Legacy GCN v2"
+        Legacy_GCN_9000 = "Legacy GCN v3"
+        Polaris = "Polaris"
+        Polaris_Spoof = "Polaris (Spoofed)"
+        Vega = "Vega"
+        Navi = "Navi"
+        Unknown = "Unknown"
+
+    arch: Archs = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Archs.R500:            pci_data.amd_ids.r500_ids,
+        Archs.Legacy_GCN_7000: pci_data.amd_ids.gcn_7000_ids,
+        Archs.Legacy_GCN_8000: pci_data.amd_ids.gcn_8000_ids,
+        Archs.Legacy_GCN_9000: pci_data.amd_ids.gcn_9000_ids,
+        Archs.TeraScale_1:     pci_data.amd_ids.terascale_1_ids,
+        Archs.TeraScale_2:     pci_data.amd_ids.terascale_2_ids,
+        Archs.Polaris:         pci_data.amd_ids.polaris_ids,
+        Archs.Polaris_Spoof:   pci_data.amd_ids.polaris_spoof_ids,
+        Archs.Vega:            pci_data.amd_ids.vega_ids,
+        Archs.Navi:            pci_data.amd_ids.navi_ids,
+    }
+
+    def detect_arch(self):
+        self.arch = self.lookup_device_id(AMD.Archs.Unknown)
+
+
+@dataclass
+class Intel(GPU):
+    VENDOR_ID: ClassVar[int] = 0x8086
+
+    class Archs(enum.Enum):
+        # pylint: disable=invalid-name
+        GMA_950 = "GMA 950"
+        GMA_X3100 = "GMA X3100"
+        Iron_Lake = "Iron Lake"
+        Sandy_Bridge = "Sandy Bridge"
+        Ivy_Bridge = "Ivy Bridge"
+        Haswell = "Haswell"
+        Broadwell = "Broadwell"
+        Skylake = "Skylake"
+        Kaby_Lake = "Kaby Lake"
+        Coffee_Lake = "Coffee Lake"
+        Comet_Lake = "Comet Lake"
+        Ice_Lake = "Ice Lake"
+        Unknown = "Unknown"
+
+    arch: Archs = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Archs.GMA_950:      pci_data.intel_ids.gma_950_ids,
+        Archs.GMA_X3100:    pci_data.intel_ids.gma_x3100_ids,
+        Archs.Iron_Lake:    pci_data.intel_ids.iron_ids,
+        Archs.Sandy_Bridge: pci_data.intel_ids.sandy_ids,
+        Archs.Ivy_Bridge:   pci_data.intel_ids.ivy_ids,
+        Archs.Haswell:      pci_data.intel_ids.haswell_ids,
+        Archs.Broadwell:    pci_data.intel_ids.broadwell_ids,
+        Archs.Skylake:      pci_data.intel_ids.skylake_ids,
+        Archs.Kaby_Lake:    pci_data.intel_ids.kaby_lake_ids,
+        Archs.Coffee_Lake:  pci_data.intel_ids.coffee_lake_ids,
+        Archs.Comet_Lake:   pci_data.intel_ids.comet_lake_ids,
+        Archs.Ice_Lake:     pci_data.intel_ids.ice_lake_ids,
+    }
+
+    def detect_arch(self):
+        self.arch = self.lookup_device_id(Intel.Archs.Unknown)
+
+@dataclass
+class IntelEthernet(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x8086
+
+    class Chipsets(enum.Enum):
+        AppleIntel8254XEthernet = "AppleIntel8254XEthernet Supported"
+        AppleIntelI210Ethernet = "AppleIntelI210Ethernet Supported"
+        Intel82574L = "Intel82574L Supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.AppleIntel8254XEthernet: pci_data.intel_ids.AppleIntel8254XEthernet,
+        Chipsets.AppleIntelI210Ethernet:  pci_data.intel_ids.AppleIntelI210Ethernet,
+        Chipsets.Intel82574L:             pci_data.intel_ids.Intel82574L,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(IntelEthernet.Chipsets.Unknown)
+
+@dataclass
+class Broadcom(WirelessCard):
+    VENDOR_ID: ClassVar[int] = 0x14E4
+
+    class Chipsets(enum.Enum):
+        # pylint: disable=invalid-name
+        AppleBCMWLANBusInterfacePCIe = "AppleBCMWLANBusInterfacePCIe supported"
+        AirportBrcmNIC = "AirportBrcmNIC supported"
+        AirPortBrcmNICThirdParty = "AirPortBrcmNICThirdParty supported"
+        AirPortBrcm4360 = "AirPortBrcm4360 supported"
+        AirPortBrcm4331 = "AirPortBrcm4331 supported"
+        AirPortBrcm43224 = "AppleAirPortBrcm43224 supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.AppleBCMWLANBusInterfacePCIe: pci_data.broadcom_ids.AppleBCMWLANBusInterfacePCIe,
+        Chipsets.AirportBrcmNIC:               pci_data.broadcom_ids.AirPortBrcmNIC,
+        Chipsets.AirPortBrcmNICThirdParty:     pci_data.broadcom_ids.AirPortBrcmNICThirdParty,
+        Chipsets.AirPortBrcm4360:              pci_data.broadcom_ids.AirPortBrcm4360,
+        Chipsets.AirPortBrcm4331:              pci_data.broadcom_ids.AirPortBrcm4331,
+        Chipsets.AirPortBrcm43224:             pci_data.broadcom_ids.AppleAirPortBrcm43224,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(Broadcom.Chipsets.Unknown)
+
+@dataclass
+class BroadcomEthernet(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x14E4
+
+    class Chipsets(enum.Enum):
+        AppleBCM5701Ethernet = "AppleBCM5701Ethernet supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.AppleBCM5701Ethernet: pci_data.broadcom_ids.AppleBCM5701Ethernet,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(BroadcomEthernet.Chipsets.Unknown)
+
+@dataclass
+class Atheros(WirelessCard):
+    VENDOR_ID: ClassVar[int] = 0x168C
+
+    class Chipsets(enum.Enum):
+        # pylint: disable=invalid-name
+        # Well there's only one model but
+        AirPortAtheros40 = "AirPortAtheros40 supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.AirPortAtheros40: pci_data.atheros_ids.AtherosWifi,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(Atheros.Chipsets.Unknown)
+
+
+@dataclass
+class Aquantia(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x1D6A
+
+    class Chipsets(enum.Enum):
+        # pylint: disable=invalid-name
+        AppleEthernetAquantiaAqtion = "AppleEthernetAquantiaAqtion supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.AppleEthernetAquantiaAqtion: pci_data.aquantia_ids.AppleEthernetAquantiaAqtion,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(Aquantia.Chipsets.Unknown)
+
+@dataclass
+class Marvell(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x11AB
+
+    class Chipsets(enum.Enum):
+        MarvelYukonEthernet = "MarvelYukonEthernet supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.MarvelYukonEthernet: pci_data.marvell_ids.MarvelYukonEthernet,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(Marvell.Chipsets.Unknown)
+
+@dataclass
+class SysKonnect(EthernetController):
+    VENDOR_ID: ClassVar[int] = 0x1148
+
+    class Chipsets(enum.Enum):
+        MarvelYukonEthernet = "MarvelYukonEthernet supported"
+        Unknown = "Unknown"
+
+    chipset: Chipsets = field(init=False)
+
+    DEVICE_IDS: ClassVar[dict] = {
+        Chipsets.MarvelYukonEthernet: pci_data.syskonnect_ids.MarvelYukonEthernet,
+    }
+
+    def detect_chipset(self):
+        self.chipset = self.lookup_device_id(SysKonnect.Chipsets.Unknown)
+
+
+def _compile_device_id_table() -> types.MappingProxyType:
+    """
+    Compile DEVICE_IDS of all vendor subclasses into a single table, keyed by (vendor ID, device ID)
+
+    A device ID assigned to multiple architectures or chipsets is logged, and resolves
+    to its first assignment (matching DEVICE_IDS order). tests/test_pci_devices.py
+    ensures pci_data has no such conflicts
+    """
+
+    table = {}
+    for vendor in itertools.chain.from_iterable([subclass.__subclasses__() for subclass in PCIDevice.__subclasses__()]):
+        for value, device_ids in getattr(vendor, "DEVICE_IDS", {}).items():
+            for device_id in device_ids:
+                key = (vendor.VENDOR_ID, device_id)
+                if key in table:
+                    if table[key] is not value:
+                        logging.warning(f"Device ID {vendor.VENDOR_ID:04X}:{device_id:04X} assigned to both {table[key]} and {value}, using {table[key]}")
+                    continue
+                table[key] = value
+
+    return types.MappingProxyType(table)
+
+
+# (vendor ID, device ID) -> architecture or chipset enum
+DEVICE_ID_TABLE: types.MappingProxyType = _compile_device_id_table()
+
+
+def classify_device_ids(devices: Iterable[tuple[int, int]]) -> dict:
+    """
+    Classify PCI devices in bulk, ie. a fleet's PCI inventory
+
+    Parameters:
+        devices (Iterable[tuple[int, int]]): (vendor ID, device ID) pairs
+
+    Returns:
+        dict: (vendor ID, device ID) -> architecture or chipset enum, None if unknown
+    """
+    return {device: DEVICE_ID_TABLE.get(device) for device in devices}
+
+
+
+@dataclass
+class PCIRegistryEntry:
+    index:        int            # Position in registry order
+    name:         str            # Name of IORegistryEntry
+    properties:   dict           # IORegistryEntryCreateCFProperties() of the entry
+    pci_path:     str = ""       # PCI Device Path, empty if not resolvable
+    country_code: Optional[str] = None  # IO80211CountryCode of a child IO80211Interface, wireless cards only
+    entry:        Any = None     # io_registry_entry_t, None if loaded from a dump
+
+
+@dataclass
+class PCIRegistry:
+    """
+    All IOPCIDevice entries, bucketed by class code
+
+    Populated in a single IORegistry pass by device_probe, or from a recorded dump (see dump() and from_dump())
+    """
+
+    devices: dict = field(default_factory=dict)  # class-code property (bytes) -> list[PCIRegistryEntry]
+
+    @classmethod
+    def from_dump(cls, dump: list) -> "PCIRegistry":
+        """
+        Load a registry recorded with dump()
+
+        Parameters:
+            dump (list): Recorded entries, in registry order
+
+        Returns:
+            PCIRegistry: Registry without IORegistry backing
+        """
+        registry = cls()
+        for index, device in enumerate(dump):
+            registry.add(PCIRegistryEntry(index, device["name"], device["properties"], device.get("pci-path", ""), device.get("country-code")))
+        return registry
+
+    def dump(self) -> list:
+        """
+        Record all entries as a plist/JSON friendly list, in registry order
+        """
+        dump = []
+        for device in sorted(itertools.chain.from_iterable(self.devices.values()), key=lambda device: device.index):
+            recorded = {"name": device.name, "properties": device.properties, "pci-path": device.pci_path}
+            if device.country_code is not None:
+                recorded["country-code"] = device.country_code
+            dump.append(recorded)
+        return dump
+
+    def add(self, device: PCIRegistryEntry) -> None:
+        self.devices.setdefault(device.properties["class-code"], []).append(device)
+
+    def match(self, class_codes: list[int]) -> list[PCIRegistryEntry]:
+        """
+        Equivalent to IOServiceGetMatchingServices() with class_code_matching_dict(), preserving registry order
+        """
+        return sorted(
+            itertools.chain.from_iterable(self.devices.get(class_code_to_bytes(class_code), []) for class_code in class_codes),
+            key=lambda device: device.index
+        )
+
+    def match_name(self, name: str, class_codes: list[int]) -> Optional[PCIRegistryEntry]:
+        return next((device for device in self.match(class_codes) if device.name == name), None)
+
+    def _classify(self, device: PCIRegistryEntry, inherits: Type[PCIDevice], anti_spoof=False) -> Optional[PCIDevice]:
+        vendor: Type[PCIDevice] = PCIDevice.from_registry_entry(device, anti_spoof=anti_spoof).vendor_detect(inherits=inherits)  # type: ignore
+        if vendor:
+            return vendor.from_registry_entry(device, anti_spoof=anti_spoof)
+        return None
+
+    def gpus(self) -> list[GPU]:
+        # Class codes 03:00:00 and 03:80:00
+        return [gpu for gpu in (self._classify(device, GPU) for device in self.match(GPU.CLASS_CODES)) if gpu]  # type: ignore
+
+    def gpu(self, name: str) -> Optional[GPU]:
+        """
+        GPU by ACPI name, ie. 'GFX0' for dGPU and 'IGPU' for iGPU
+        """
+        device = self.match_name(name, GPU.CLASS_CODES)
+        if not device:
+            # No devices
+            return None
+        return self._classify(device, GPU)  # type: ignore
+
+    def wifi(self) -> Optional[WirelessCard]:
+        for device in self.match(WirelessCard.CLASS_CODES):
+            card = self._classify(device, WirelessCard, anti_spoof=True)
+            if card:
+                return card  # type: ignore
+        return None
+
+    def sdxc_controllers(self) -> list[PCIDevice]:
+        return [SDXCController.from_registry_entry(device) for device in self.match(SDXCController.CLASS_CODES)]
+
+    def usb_controllers(self) -> list[PCIDevice]:
+        return [controller.from_registry_entry(device) for controller in [XHCIController, EHCIController, OHCIController, UHCIController] for device in self.match(controller.CLASS_CODES)]
+
+    def ethernet(self) -> list[EthernetController]:
+        return [controller for controller in (self._classify(device, EthernetController) for device in self.match(EthernetController.CLASS_CODES)) if controller]  # type: ignore
+
+    def storage(self) -> list[PCIDevice]:
+        return [controller.from_registry_entry(device) for controller in [SATAController, SASController, NVMeController] for device in self.match(controller.CLASS_CODES)]
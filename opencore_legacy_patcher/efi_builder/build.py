@@ -6,7 +6,6 @@ import copy
 import pickle
 import shutil
 import logging
-import zipfile
 import plistlib
 
 from pathlib import Path
@@ -28,7 +27,8 @@ from . import (
     storage,
     smbios,
     security,
-    misc
+    misc,
+    opencore_cache
 )
 
 
@@ -108,15 +108,16 @@ class BuildOpenCore:
             logging.info("Deleting old copy of OpenCore folder")
             shutil.rmtree(self.constants.opencore_release_folder, onerror=rmtree_handler, ignore_errors=True)
 
+        template_cache = opencore_cache.OpenCoreTemplateCache(self.constants)
+
         logging.info("")
         logging.info(f"- Adding OpenCore v{self.constants.opencore_version} {'DEBUG' if self.constants.opencore_debug is True else 'RELEASE'}")
-        shutil.copy(self.constants.opencore_zip_source, self.constants.build_path)
-        zipfile.ZipFile(self.constants.opencore_zip_copied).extractall(self.constants.build_path)
+        template_cache.materialize(self.constants.build_path)
 
         # Setup config.plist for editing
+        # Written to disk by _save_config()
         logging.info("- Adding config.plist for OpenCore")
-        shutil.copy(self.constants.plist_template, self.constants.oc_folder)
-        self.config = plistlib.load(Path(self.constants.plist_path).open("rb"))
+        self.config = support.IndexedConfig(template_cache.config())
 
 
     def _set_revision(self) -> None:
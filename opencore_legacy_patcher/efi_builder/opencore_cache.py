@@ -0,0 +1,197 @@
+"""
+opencore_cache.py: Cached OpenCore base tree and config.plist template
+
+Extracting OpenCorePkg and parsing the config.plist template produce identical
+results for every build of a given OpenCore version and variant. Both are
+prepared once, each build then receives a clone of the extracted tree
+(copy-on-write on APFS) and a deep copy of the parsed template.
+
+Extracted trees record a manifest of their files and hashes once complete, which
+is validated before each reuse. Incomplete or modified trees are re-extracted.
+
+Usage:
+>>> cache = OpenCoreTemplateCache(constants)
+>>> cache.materialize(constants.build_path)
+>>> config = cache.config()
+"""
+
+import os
+import copy
+import json
+import shutil
+import hashlib
+import logging
+import zipfile
+import plistlib
+import tempfile
+import threading
+import subprocess
+
+from pathlib import Path
+
+from .. import constants
+from ..volume import generate_copy_arguments
+
+
+MANIFEST_FILE: str = ".OpenCore-Legacy-Patcher-Cache.json"
+
+
+class OpenCoreTemplateCache:
+    """
+    Parameters:
+        global_constants (constants.Constants): Constants
+    """
+
+    _templates: dict = {}  # Parsed config.plist templates, keyed by path and modification time
+    _lock:      threading.Lock = threading.Lock()
+
+
+    def __init__(self, global_constants: constants.Constants) -> None:
+        self.constants: constants.Constants = global_constants
+
+
+    def _cache_path(self) -> Path:
+        """
+        Location of the extracted base tree for the current OpenCore version and variant
+
+        Zip size and modification time are included, as development builds may update
+        OpenCorePkg without bumping the version
+        """
+
+        zip_stat = Path(self.constants.opencore_zip_source).stat()
+        variant  = "DEBUG" if self.constants.opencore_debug is True else "RELEASE"
+
+        return Path(tempfile.gettempdir()) / f"OpenCore-Legacy-Patcher-Cache-{os.getuid()}" / f"OpenCore-{self.constants.opencore_version}-{variant}-{zip_stat.st_size}-{int(zip_stat.st_mtime)}"
+
+
+    @staticmethod
+    def _tree_files(path: Path) -> dict:
+        """
+        Hash every file within path, excluding the manifest
+
+        Returns:
+            dict: Relative path -> [size, SHA-256]
+        """
+
+        files = {}
+        for root, _, names in os.walk(path):
+            for name in names:
+                file_path = Path(root) / name
+                relative  = file_path.relative_to(path).as_posix()
+                if relative == MANIFEST_FILE:
+                    continue
+                files[relative] = [file_path.stat().st_size, hashlib.sha256(file_path.read_bytes()).hexdigest()]
+
+        return files
+
+
+    def _is_valid(self, cache_path: Path) -> bool:
+        """
+        Check whether the extracted tree is complete and unmodified, according to its manifest
+        """
+
+        try:
+            manifest = json.loads((cache_path / MANIFEST_FILE).read_text())
+            return manifest == self._tree_files(cache_path)
+        except Exception as e:
+            logging.info(f"- Failed to validate cached OpenCore base tree: {e}")
+            return False
+
+
+    def _discard(self, cache_path: Path) -> None:
+        """
+        Move an invalid tree out of the way before removing it, thus concurrent builds never see it half-deleted
+        """
+
+        discard_path = Path(tempfile.mkdtemp(dir=cache_path.parent))
+        try:
+            cache_path.rename(discard_path)
+        except OSError:
+            # Another build discarded it first
+            pass
+        finally:
+            shutil.rmtree(discard_path, ignore_errors=True)
+
+
+    def base_tree(self) -> Path:
+        """
+        Retrieve the extracted OpenCore base tree, extracting on first use
+
+        Safe to call from multiple processes, extraction is staged and atomically renamed into place.
+        Trees are only reused once validated against their manifest, otherwise re-extracted
+
+        Returns:
+            Path: Directory containing the extracted zip contents
+        """
+
+        cache_path = self._cache_path()
+        if cache_path.exists():
+            if self._is_valid(cache_path):
+                return cache_path
+            logging.info(f"- Cached OpenCore v{self.constants.opencore_version} base tree is incomplete or modified, discarding")
+            self._discard(cache_path)
+
+        logging.info(f"- Caching OpenCore v{self.constants.opencore_version} base tree")
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(dir=cache_path.parent))
+
+        try:
+            with zipfile.ZipFile(self.constants.opencore_zip_source) as zip_file:
+                zip_file.extractall(staging_path)
+            # Written last, thus its presence marks a complete extraction
+            (staging_path / MANIFEST_FILE).write_text(json.dumps(self._tree_files(staging_path)))
+            staging_path.rename(cache_path)
+        except OSError:
+            # Another build finished extracting first
+            if not cache_path.exists():
+                raise
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+        return cache_path
+
+
+    def materialize(self, build_path: Path) -> None:
+        """
+        Populate build_path with a copy of the OpenCore base tree
+
+        Clones are used where supported, thus files are only duplicated once modified
+
+        Parameters:
+            build_path (Path): Build folder, equivalent to extracting the OpenCore zip into it
+        """
+
+        for item in self.base_tree().iterdir():
+            if item.name == MANIFEST_FILE:
+                continue
+            destination = Path(build_path) / item.name
+            try:
+                result = subprocess.run(generate_copy_arguments(str(item), str(destination)), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                if result.returncode == 0:
+                    continue
+                logging.info(f"- Failed to clone {item.name}, falling back to copying: {result.stdout.decode().strip()}")
+            except OSError as e:
+                # ie. '/bin/cp' or getattrlist unavailable
+                logging.info(f"- Failed to clone {item.name}, falling back to copying: {e}")
+
+            if item.is_dir():
+                shutil.copytree(item, destination, symlinks=True, dirs_exist_ok=True)
+            else:
+                shutil.copy2(item, destination)
+
+
+    def config(self) -> dict:
+        """
+        Retrieve a copy of the parsed config.plist template
+
+        Returns:
+            dict: Template contents, safe to modify
+        """
+
+        template = Path(self.constants.plist_template)
+        key = (str(template), template.stat().st_mtime_ns)
+
+        with self._lock:
+            if key not in self._templates:
+                self._templates[key] = plistlib.load(template.open("rb"))
+            return copy.deepcopy(self._templates[key])
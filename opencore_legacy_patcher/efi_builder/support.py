@@ -2,6 +2,7 @@
 support.py: Utility class for build functions
 """
 
+import os
 import shutil
 import typing
 import logging
@@ -14,6 +15,19 @@ from pathlib import Path
 from .. import constants
 
 
+class IndexedConfig(dict):
+    """
+    config.plist contents, carrying lookup indexes for its arrays
+
+    Behaves as a regular dict (ie. for plistlib), indexes are only used by BuildSupport.
+    Builders construct many short-lived BuildSupport instances, thus indexes live with the config
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.indexes: dict = {}  # (id(array), key) -> (array, {value: item})
+
+
 class BuildSupport:
     """
     Support Library for build.py and related libraries
@@ -45,6 +59,79 @@ class BuildSupport:
         return item
 
 
+    def _index(self, iterable: list, key: str) -> typing.Optional[dict]:
+        """
+        Retrieve the config's index of iterable by key, building it on first use
+
+        Returns:
+            dict: Value -> item, first entry wins (matching get_item_by_kv()). None if config is not an IndexedConfig
+        """
+
+        if not isinstance(self.config, IndexedConfig):
+            return None
+
+        cached = self.config.indexes.get((id(iterable), key))
+        if cached is None or cached[0] is not iterable:
+            index = {}
+            for i in iterable:
+                index.setdefault(i[key], i)
+            cached = (iterable, index)
+            self.config.indexes[(id(iterable), key)] = cached
+
+        return cached[1]
+
+
+    def _get_indexed_item(self, iterable: list, key: str, value: typing.Any) -> dict:
+        """
+        Gets an item from a config.plist array by key and value, using the config's index
+
+        Equivalent to get_item_by_kv(). Entries should be removed with remove_item() to keep indexes current,
+        misses and keys modified in place fall back to a scan
+
+        Parameters:
+            iterable (list): List of dicts, within self.config
+            key       (str): Key to search for
+            value     (any): Value to search for
+        """
+
+        index = self._index(iterable, key)
+        if index is None:
+            return self.get_item_by_kv(iterable, key, value)
+
+        item = index.get(value)
+        if item is not None and item[key] == value:
+            return item
+
+        # Added outside of BuildSupport or key modified in place
+        item = self.get_item_by_kv(iterable, key, value)
+        if item is not None:
+            index[value] = item
+        return item
+
+
+    def remove_item(self, iterable: list, item: dict) -> None:
+        """
+        Remove an entry from a config.plist array, updating the config's indexes
+
+        Parameters:
+            iterable (list): List of dicts, within self.config
+            item     (dict): Entry to remove
+        """
+
+        iterable.remove(item)
+        if not isinstance(self.config, IndexedConfig):
+            return
+
+        for (_, key), (array, index) in self.config.indexes.items():
+            if array is not iterable or index.get(item.get(key)) is not item:
+                continue
+            del index[item[key]]
+            # Promote the next entry sharing the value, if any
+            replacement = self.get_item_by_kv(iterable, key, item[key])
+            if replacement is not None:
+                index[item[key]] = replacement
+
+
     def get_kext_by_bundle_path(self, bundle_path: str) -> dict:
         """
         Gets a kext by bundle path
@@ -53,7 +140,7 @@ class BuildSupport:
             bundle_path (str): Relative bundle path of the kext in the EFI folder
         """
 
-        kext: dict = self.get_item_by_kv(self.config["Kernel"]["Add"], "BundlePath", bundle_path)
+        kext: dict = self._get_indexed_item(self.config["Kernel"]["Add"], "BundlePath", bundle_path)
         if not kext:
             logging.info(f"- Could not find kext {bundle_path}!")
             raise IndexError
@@ -70,7 +157,7 @@ class BuildSupport:
             efi_type    (str): Type of EFI binary (Drivers, Tools)
         """
 
-        efi_binary: dict = self.get_item_by_kv(self.config[entry_type][efi_type], "Path", bundle_name)
+        efi_binary: dict = self._get_indexed_item(self.config[entry_type][efi_type], "Path", bundle_name)
         if not efi_binary:
             logging.info(f"- Could not find {efi_type}: {bundle_name}!")
             raise IndexError
@@ -115,81 +202,129 @@ class BuildSupport:
             logging.info(stdout_line.strip())
         logging.info("=========================================")
 
+    def _index_directory(self, directory: Path) -> dict:
+        """
+        Walk directory once, recording the contents of every folder
+
+        Returns:
+            dict: Folder path relative to directory ("" for directory itself) -> set of entry names
+        """
+
+        listing = {}
+        for folder, folder_names, file_names in os.walk(directory):
+            relative = Path(folder).relative_to(directory).as_posix()
+            listing["" if relative == "." else relative] = set(folder_names) | set(file_names)
+        return listing
+
+
+    @staticmethod
+    def _is_listed(listing: dict, relative_path: str) -> bool:
+        """
+        Check whether a path exists within an indexed directory
+
+        Parameters:
+            listing       (dict): Result of _index_directory()
+            relative_path (str):  Path relative to the indexed directory
+        """
+
+        relative_path = os.path.normpath(relative_path)
+        if relative_path == ".":
+            return True
+        parent, name = os.path.split(relative_path)
+        return name in listing.get(parent, ())
+
+
     def validate_pathing(self) -> None:
         """
         Validate whether all files are accounted for on-disk
 
         This ensures that OpenCore won't hit a critical error and fail to boot
+
+        The EFI folder is walked once and validated against the in-memory config,
+        all problems are reported together
         """
 
         logging.info("- Validating generated config")
-        if not Path(self.constants.opencore_release_folder / Path("EFI/OC/config.plist")):
+        if not Path(self.constants.plist_path).exists():
             logging.info("- OpenCore config file missing!!!")
             raise Exception("OpenCore config file missing")
 
-        config_plist = plistlib.load(Path(self.constants.opencore_release_folder / Path("EFI/OC/config.plist")).open("rb"))
-
-        for acpi in config_plist["ACPI"]["Add"]:
-            if not Path(self.constants.opencore_release_folder / Path("EFI/OC/ACPI") / Path(acpi["Path"])).exists():
-                logging.info(f"- Missing ACPI Table: {acpi['Path']}")
-                raise Exception(f"Missing ACPI Table: {acpi['Path']}")
-
-        for kext in config_plist["Kernel"]["Add"]:
-            kext_path = Path(self.constants.opencore_release_folder / Path("EFI/OC/Kexts") / Path(kext["BundlePath"]))
-            kext_binary_path = Path(kext_path / Path(kext["ExecutablePath"]))
-            kext_plist_path = Path(kext_path / Path(kext["PlistPath"]))
-            if not kext_path.exists():
-                logging.info(f"- Missing kext: {kext_path}")
-                raise Exception(f"Missing {kext_path}")
-            if not kext_binary_path.exists():
-                logging.info(f"- Missing {kext['BundlePath']}'s binary: {kext_binary_path}")
-                raise Exception(f"Missing {kext_binary_path}")
-            if not kext_plist_path.exists():
-                logging.info(f"- Missing {kext['BundlePath']}'s plist: {kext_plist_path}")
-                raise Exception(f"Missing {kext_plist_path}")
-
-        for tool in config_plist["Misc"]["Tools"]:
-            if not Path(self.constants.opencore_release_folder / Path("EFI/OC/Tools") / Path(tool["Path"])).exists():
-                logging.info(f"- Missing tool: {tool['Path']}")
-                raise Exception(f"Missing tool: {tool['Path']}")
-
-        for driver in config_plist["UEFI"]["Drivers"]:
-            if not Path(self.constants.opencore_release_folder / Path("EFI/OC/Drivers") / Path(driver["Path"])).exists():
-                logging.info(f"- Missing driver: {driver['Path']}")
-                raise Exception(f"Missing driver: {driver['Path']}")
+        listing = self._index_directory(self.constants.oc_folder)
+        errors  = []
+
+        for acpi in self.config["ACPI"]["Add"]:
+            if not self._is_listed(listing, f"ACPI/{acpi['Path']}"):
+                errors.append(f"Missing ACPI Table: {acpi['Path']}")
+
+        for kext in self.config["Kernel"]["Add"]:
+            kext_path = f"Kexts/{kext['BundlePath']}"
+            if not self._is_listed(listing, kext_path):
+                errors.append(f"Missing kext: {kext['BundlePath']}")
+                continue
+            if not self._is_listed(listing, f"{kext_path}/{kext['ExecutablePath']}"):
+                errors.append(f"Missing {kext['BundlePath']}'s binary: {kext['ExecutablePath']}")
+            if not self._is_listed(listing, f"{kext_path}/{kext['PlistPath']}"):
+                errors.append(f"Missing {kext['BundlePath']}'s plist: {kext['PlistPath']}")
+
+        tools   = {tool["Path"] for tool in self.config["Misc"]["Tools"]}
+        drivers = {driver["Path"] for driver in self.config["UEFI"]["Drivers"]}
+
+        for tool in sorted(tools):
+            if not self._is_listed(listing, f"Tools/{tool}"):
+                errors.append(f"Missing tool: {tool}")
+
+        for driver in sorted(drivers):
+            if not self._is_listed(listing, f"Drivers/{driver}"):
+                errors.append(f"Missing driver: {driver}")
 
         # Validating local files
         # Report if they have no associated config.plist entry (i.e. they're not being used)
-        for tool_files in Path(self.constants.opencore_release_folder / Path("EFI/OC/Tools")).glob("*"):
-            if tool_files.name not in [x["Path"] for x in config_plist["Misc"]["Tools"]]:
-                logging.info(f"- Missing tool from config: {tool_files.name}")
-                raise Exception(f"Missing tool from config: {tool_files.name}")
+        for tool_file in sorted(listing.get("Tools", ())):
+            if tool_file not in tools:
+                errors.append(f"Missing tool from config: {tool_file}")
 
-        for driver_file in Path(self.constants.opencore_release_folder / Path("EFI/OC/Drivers")).glob("*"):
-            if driver_file.name not in [x["Path"] for x in config_plist["UEFI"]["Drivers"]]:
-                logging.info(f"- Found extra driver: {driver_file.name}")
-                raise Exception(f"Found extra driver: {driver_file.name}")
+        for driver_file in sorted(listing.get("Drivers", ())):
+            if driver_file not in drivers:
+                errors.append(f"Found extra driver: {driver_file}")
 
-        self._validate_malformed_kexts(self.constants.opencore_release_folder / Path("EFI/OC/Kexts"))
+        errors += self._validate_malformed_kexts(listing, "Kexts")
 
+        if errors:
+            for error in errors:
+                logging.info(f"- {error}")
+            raise Exception(f"Failed to validate EFI ({len(errors)} issues):\n" + "\n".join(errors))
 
-    def _validate_malformed_kexts(self, directory: str | Path) -> None:
+
+    def _validate_malformed_kexts(self, listing: dict, directory: str) -> list:
         """
         Validate Info.plist and executable pathing for kexts
+
+        Parameters:
+            listing   (dict): Result of _index_directory() for the OC folder
+            directory (str):  Folder containing kexts, relative to the OC folder
+
+        Returns:
+            list: Problems found
         """
-        for kext_folder in Path(directory).glob("*.kext"):
-            if not Path(kext_folder / Path("Contents/Info.plist")).exists():
+
+        errors = []
+
+        for kext_name in sorted(listing.get(directory, ())):
+            if not kext_name.endswith(".kext"):
+                continue
+            kext_folder = f"{directory}/{kext_name}"
+            if not self._is_listed(listing, f"{kext_folder}/Contents/Info.plist"):
                 continue
 
-            kext_data = plistlib.load(Path(kext_folder / Path("Contents/Info.plist")).open("rb"))
+            kext_data = plistlib.load(Path(self.constants.oc_folder / kext_folder / "Contents/Info.plist").open("rb"))
             if "CFBundleExecutable" in kext_data:
-                expected_executable = Path(kext_folder / Path("Contents/MacOS") / Path(kext_data["CFBundleExecutable"]))
-                if not expected_executable.exists():
-                    logging.info(f"- Missing executable for {kext_folder.name}: Contents/MacOS/{expected_executable.name}")
-                    raise Exception(f" - Missing executable for {kext_folder.name}: Contents/MacOS/{expected_executable.name}")
+                if not self._is_listed(listing, f"{kext_folder}/Contents/MacOS/{kext_data['CFBundleExecutable']}"):
+                    errors.append(f"Missing executable for {kext_name}: Contents/MacOS/{kext_data['CFBundleExecutable']}")
+
+            if self._is_listed(listing, f"{kext_folder}/Contents/PlugIns"):
+                errors += self._validate_malformed_kexts(listing, f"{kext_folder}/Contents/PlugIns")
 
-            if Path(kext_folder / Path("Contents/PlugIns")).exists():
-                self._validate_malformed_kexts(kext_folder / Path("Contents/PlugIns"))
+        return errors
 
 
     def cleanup(self) -> None:
@@ -211,7 +346,7 @@ class BuildSupport:
             for sub_entry in entries_to_clean[entry]:
                 for item in list(self.config[entry][sub_entry]):
                     if item["Enabled"] is False:
-                        self.config[entry][sub_entry].remove(item)
+                        self.remove_item(self.config[entry][sub_entry], item)
 
         for kext in self.constants.kexts_path.rglob("*.zip"):
             with zipfile.ZipFile(kext) as zip_file:
@@ -249,4 +384,4 @@ class BuildSupport:
                         raise Exception(f" - Unknown plugin found: {plugin.name}")
                     shutil.rmtree(plugin)
 
-        Path(self.constants.opencore_zip_copied).unlink()
\ No newline at end of file
+        Path(self.constants.opencore_zip_copied).unlink(missing_ok=True)
\ No newline at end of file
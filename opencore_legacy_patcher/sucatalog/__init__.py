@@ -104,8 +104,35 @@ By default, `CatalogProducts` will only return InstallAssistants. To get all pro
         'Version': '9.4.3'
     }
 ]
+
+### Fetch and parse Software Update Catalog
+
+`CatalogURL.contents()` fetches the catalog and parses it incrementally. With `install_assistants_only=True`,
+non-InstallAssistant products are discarded while parsing, avoiding materializing the full catalog in memory.
+
+>>> import sucatalog
+
+>>> catalog  = sucatalog.CatalogURL().contents(install_assistants_only=True)
+>>> products = sucatalog.CatalogProducts(catalog).products
+
+### Local catalog mirror
+
+`CatalogMirror` snapshots the catalog and product metadata into a local directory. Subsequent syncs only re-fetch products whose PostDate changed.
+The directory can be read directly, or served over HTTP to other machines.
+
+>>> import sucatalog
+
+>>> url = sucatalog.CatalogURL().url
+>>> sucatalog.CatalogMirror("/Volumes/Shared/sucatalog").sync(url)
+
+>>> catalog  = sucatalog.CatalogURL(mirror="/Volumes/Shared/sucatalog").url_contents
+>>> products = sucatalog.CatalogProducts(catalog, mirror="/Volumes/Shared/sucatalog").products
+
+From the CLI, '--sync_catalog_mirror <directory>' syncs a mirror, and '--set_catalog_mirror <directory or URL>'
+points the macOS Installer download at it (an empty string resets to Apple's catalog).
 """
 
 from .url       import CatalogURL
 from .constants import CatalogVersion, SeedType
-from .products  import CatalogProducts
\ No newline at end of file
+from .products  import CatalogProducts
+from .mirror    import CatalogMirror
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""
+mirror.py: Local mirror of the Software Update Catalog and product metadata
+
+Allows multiple machines to parse a LAN copy of the sucatalog instead of
+each fetching the catalog and per-product metadata from Apple
+
+Mirror layout follows the remote URL, ie.
+    https://swscan.apple.com/content/catalogs/others/index-15.merged-1.sucatalog
+is stored as:
+    <mirror>/swscan.apple.com/content/catalogs/others/index-15.merged-1.sucatalog
+
+Thus a mirror directory can be served as-is by any static HTTP server
+
+Usage:
+>>> import sucatalog
+
+>>> # Snapshot catalog and metadata into a local directory
+>>> sucatalog.CatalogMirror("/Volumes/Shared/sucatalog").sync(sucatalog.CatalogURL().url)
+
+>>> # Parse from the mirror (local directory or HTTP stand-in)
+>>> catalog  = sucatalog.CatalogURL(mirror="http://10.0.0.2:8000").url_contents
+>>> products = sucatalog.CatalogProducts(catalog, mirror="http://10.0.0.2:8000").products
+"""
+
+import logging
+import concurrent.futures
+
+from pathlib      import Path
+from urllib.parse import urlparse
+
+from .        import parser
+from ..support import network_handler
+
+
+class CatalogMirror:
+    """
+    Args:
+        location (str): Local directory, or base URL of an HTTP server serving the mirror directory
+    """
+    def __init__(self, location: str) -> None:
+        self.location:  str  = str(location)
+        self.is_remote: bool = self.location.startswith(("http://", "https://"))
+
+
+    def _relative_path(self, url: str) -> str:
+        """
+        Convert remote URL to path relative to the mirror root
+        """
+        parsed = urlparse(url)
+        return f"{parsed.netloc}{parsed.path}"
+
+
+    def _local_path(self, url: str) -> Path:
+        """
+        Convert remote URL to path inside local mirror
+        """
+        return Path(self.location) / self._relative_path(url)
+
+
+    def _metadata_urls(self, product: dict) -> list:
+        """
+        List metadata URLs CatalogProducts may fetch for a product
+        """
+
+        urls = []
+
+        for package in product.get("Packages", []):
+            if "URL" not in package:
+                continue
+            if Path(package["URL"]).name in ["Info.plist", "com_apple_MobileAsset_MacSoftwareUpdate.plist"]:
+                urls.append(package["URL"])
+
+        if "Distributions" in product:
+            if "English" in product["Distributions"]:
+                urls.append(product["Distributions"]["English"])
+            elif "en" in product["Distributions"]:
+                urls.append(product["Distributions"]["en"])
+
+        if "ServerMetadataURL" in product:
+            urls.append(product["ServerMetadataURL"])
+
+        return urls
+
+
+    def fetch(self, url: str) -> bytes:
+        """
+        Fetch contents of a remote URL from the mirror
+
+        Returns:
+            bytes: Contents, or None if not mirrored
+        """
+
+        if self.is_remote:
+            result = network_handler.NetworkUtilities().get(f"{self.location.rstrip('/')}/{self._relative_path(url)}")
+            if result.status_code != 200:
+                logging.error(f"Failed to fetch {url} from mirror (status: {result.status_code})")
+                return None
+            return result.content
+
+        path = self._local_path(url)
+        if not path.exists():
+            logging.error(f"Failed to fetch {url} from mirror: {path} missing")
+            return None
+        return path.read_bytes()
+
+
+    def _write(self, url: str, contents: bytes) -> None:
+        """
+        Atomically write contents of a remote URL into the mirror
+        """
+
+        path = self._local_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_bytes(contents)
+        temp_path.replace(path)
+
+
+    def _download(self, url: str) -> bool:
+        """
+        Download a remote URL into the mirror
+        """
+
+        result = network_handler.NetworkUtilities().get(url)
+        if result.status_code != 200:
+            logging.error(f"Failed to download {url} (status: {result.status_code})")
+            return False
+
+        self._write(url, result.content)
+        return True
+
+
+    def sync(self, catalog_url: str, install_assistants_only: bool = True, max_workers: int = 8) -> bool:
+        """
+        Snapshot the catalog and referenced product metadata into the local mirror
+
+        Only products whose PostDate changed since the last sync (or with missing files) are re-fetched
+        The catalog itself is written last, so an interrupted sync is retried on the next run
+
+        Args:
+            catalog_url             (str):  URL of the Software Update Catalog to mirror
+            install_assistants_only (bool): Only mirror metadata for InstallAssistant products
+            max_workers             (int):  Maximum number of concurrent downloads
+
+        Returns:
+            bool: True if all files were mirrored, False otherwise
+        """
+
+        # Avoid circular import, products.py uses CatalogMirror
+        from .products import is_install_assistant
+
+        if self.is_remote:
+            logging.error("Cannot sync to a remote mirror, provide a local directory")
+            return False
+
+        logging.info(f"Syncing catalog mirror: {catalog_url} -> {self.location}")
+
+        result = network_handler.NetworkUtilities().get(catalog_url)
+        if result.status_code != 200:
+            logging.error(f"Failed to download catalog (status: {result.status_code})")
+            return False
+
+        try:
+            catalog = parser.parse_catalog(result.content, install_assistants_only)
+        except Exception as e:
+            logging.error(f"Failed to parse catalog: {e}")
+            return False
+
+        previous_products = {}
+        previous_catalog = self._local_path(catalog_url)
+        if previous_catalog.exists():
+            try:
+                previous_products = parser.parse_catalog(previous_catalog.read_bytes(), install_assistants_only).get("Products", {})
+            except Exception as e:
+                logging.warning(f"Failed to parse previous mirrored catalog, performing full sync: {e}")
+
+        pending = []
+        skipped = 0
+        for product_id, product in catalog.get("Products", {}).items():
+            if install_assistants_only and not is_install_assistant(product):
+                continue
+
+            unchanged = product_id in previous_products and previous_products[product_id].get("PostDate") == product.get("PostDate")
+            for url in self._metadata_urls(product):
+                if unchanged and self._local_path(url).exists():
+                    skipped += 1
+                    continue
+                pending.append(url)
+
+        logging.info(f"- {len(pending)} files to download, {skipped} unchanged")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._download, pending))
+
+        if not all(results):
+            logging.error(f"- Failed to download {results.count(False)} files, catalog not updated")
+            return False
+
+        self._write(catalog_url, result.content)
+        logging.info("- Catalog mirror synced")
+
+        return True
@@ -0,0 +1,211 @@
+"""
+parser.py: Incremental parser for the Software Update Catalog
+
+The sucatalog is a multi-megabyte XML plist, where the majority of products
+are not InstallAssistants. Rather than loading the entire plist with plistlib,
+products are parsed one at a time and non-InstallAssistant products can be
+discarded without converting them to Python objects.
+
+Usage:
+>>> from sucatalog import parser
+
+>>> for product_id, product in parser.iter_products(data, install_assistants_only=True):
+...     print(product_id, product["PostDate"])
+
+>>> # Same structure as plistlib.loads(), limited to InstallAssistants
+>>> catalog = parser.parse_catalog(data, install_assistants_only=True)
+"""
+
+import io
+import re
+import base64
+import datetime
+import plistlib
+
+import xml.etree.ElementTree as ET
+
+from typing import Iterator
+
+
+# Element depths within the catalog plist
+# <plist> -> <dict> -> <key>Products</key><dict> -> <key>ID</key><dict> -> product contents
+_ROOT_DEPTH:     int = 2
+_PRODUCTS_DEPTH: int = 3
+_PRODUCT_DEPTH:  int = 4
+
+_DATE_PATTERN = re.compile(r"(?P<year>\d\d\d\d)(?:-(?P<month>\d\d)(?:-(?P<day>\d\d)(?:T(?P<hour>\d\d)(?::(?P<minute>\d\d)(?::(?P<second>\d\d))?)?)?)?)?Z", re.ASCII)
+
+
+def _parse_date(value: str) -> datetime.datetime:
+    """
+    Parse plist date, matching plistlib's behaviour
+    """
+    match = _DATE_PATTERN.match(value)
+    components = [int(x) for x in match.groups() if x is not None]
+    return datetime.datetime(*components)
+
+
+def _convert(element: ET.Element):
+    """
+    Convert plist XML element to its Python equivalent, matching plistlib's types
+    """
+
+    tag = element.tag
+    if tag == "dict":
+        children = list(element)
+        return {children[i].text or "": _convert(children[i + 1]) for i in range(0, len(children) - 1, 2)}
+    if tag == "array":
+        return [_convert(child) for child in element]
+    if tag == "string":
+        return element.text or ""
+    if tag == "integer":
+        value = element.text.strip()
+        if value.lower().startswith(("0x", "-0x")):
+            return int(value, 16)
+        return int(value)
+    if tag == "real":
+        return float(element.text)
+    if tag == "true":
+        return True
+    if tag == "false":
+        return False
+    if tag == "date":
+        return _parse_date(element.text)
+    if tag == "data":
+        return base64.b64decode(element.text or "")
+
+    raise ValueError(f"Unsupported plist element: {tag}")
+
+
+def _is_install_assistant(extended_meta_info: dict) -> bool:
+    """
+    Determine whether a product's ExtendedMetaInfo identifies an InstallAssistant
+    """
+    return "SharedSupport" in extended_meta_info.get("InstallAssistantPackageIdentifiers", {})
+
+
+def _iter_catalog(data: bytes, install_assistants_only: bool) -> Iterator[tuple]:
+    """
+    Walk the catalog plist, yielding ("product", id, value) for each product
+    and ("root", key, value) for all other top-level keys
+
+    Products are preceded by ("root", "Products", None)
+    """
+
+    depth:       int  = 0
+    products:    ET.Element = None
+    root_key:    str  = None
+    product_id:  str  = None
+    product_key: str  = None
+    in_products: bool = False
+    skip:        bool = False
+    installer:   bool = False  # ExtendedMetaInfo identified the current product as an InstallAssistant
+
+    for event, element in ET.iterparse(io.BytesIO(data), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == _PRODUCTS_DEPTH and element.tag == "dict" and root_key == "Products":
+                in_products = True
+                products = element
+                yield ("root", root_key, None)
+            elif depth == _PRODUCT_DEPTH and in_products and element.tag == "dict":
+                product_key = None
+                skip        = False
+                installer   = False
+            continue
+
+        # End event
+        if depth == _ROOT_DEPTH + 1 and not in_products:
+            if element.tag == "key":
+                root_key = element.text
+            else:
+                yield ("root", root_key, _convert(element))
+                element.clear()
+
+        elif depth == _PRODUCTS_DEPTH and in_products:
+            # Reset product state, otherwise a skipped final product would clear top-level keys following Products
+            in_products = False
+            root_key    = None
+            product_id  = None
+            product_key = None
+            skip        = False
+            installer   = False
+            element.clear()
+
+        elif depth == _PRODUCT_DEPTH and in_products:
+            if element.tag == "key":
+                product_id = element.text
+            else:
+                # Products without ExtendedMetaInfo cannot be InstallAssistants, thus are discarded unconverted
+                if installer or not install_assistants_only:
+                    yield ("product", product_id, _convert(element))
+                # Drop parsed products from the tree
+                products.clear()
+                product_key = None
+                skip        = False
+                installer   = False
+
+        elif depth == _PRODUCT_DEPTH + 1 and in_products:
+            if element.tag == "key":
+                product_key = element.text
+            elif install_assistants_only and product_key == "ExtendedMetaInfo":
+                # Non-InstallAssistant products are discarded as the rest of their contents stream in
+                installer = _is_install_assistant(_convert(element))
+                skip      = not installer
+
+            if skip:
+                element.clear()
+
+        elif skip and depth > _PRODUCT_DEPTH + 1:
+            element.clear()
+
+        depth -= 1
+
+
+def iter_products(data: bytes, install_assistants_only: bool = False) -> Iterator[tuple[str, dict]]:
+    """
+    Incrementally parse products from the catalog
+
+    Parameters:
+        data                    (bytes): Raw catalog contents
+        install_assistants_only (bool):  Only yield InstallAssistant products
+
+    Returns:
+        Iterator of (product ID, product) tuples, in catalog order
+    """
+
+    for kind, key, value in _iter_catalog(data, install_assistants_only):
+        if kind == "product":
+            yield key, value
+
+
+def parse_catalog(data: bytes, install_assistants_only: bool = False) -> dict:
+    """
+    Parse the catalog, returning the same structure as plistlib.loads()
+
+    Non-XML catalogs (ie. binary plists) fall back to plistlib
+
+    Parameters:
+        data                    (bytes): Raw catalog contents
+        install_assistants_only (bool):  Only include InstallAssistant products
+
+    Returns:
+        dict: Catalog contents
+    """
+
+    if not data.lstrip()[:5] == b"<?xml" and not data.lstrip()[:6] == b"<plist":
+        catalog = plistlib.loads(data)
+        if install_assistants_only and "Products" in catalog:
+            catalog["Products"] = {k: v for k, v in catalog["Products"].items() if _is_install_assistant(v.get("ExtendedMetaInfo", {}))}
+        return catalog
+
+    catalog = {}
+    for kind, key, value in _iter_catalog(data, install_assistants_only):
+        if kind == "product":
+            catalog["Products"][key] = value
+        elif key == "Products":
+            catalog["Products"] = {}
+        else:
+            catalog[key] = value
+
+    return catalog
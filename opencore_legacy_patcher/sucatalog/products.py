@@ -4,6 +4,7 @@ products.py: Parse products from Software Update Catalog
 
 import re
 import plistlib
+import concurrent.futures
 
 import packaging.version
 import xml.etree.ElementTree as ET
@@ -12,11 +13,30 @@ from pathlib   import Path
 from functools import cached_property
 
 from .url       import CatalogURL
+from .mirror    import CatalogMirror
 from .constants import CatalogVersion, SeedType
 
 from ..support import network_handler
 
 
+def is_install_assistant(product: dict) -> bool:
+    """
+    Determine whether a sucatalog product is an InstallAssistant (macOS Installer)
+
+    Args:
+        product (dict): Product entry from the sucatalog
+    """
+
+    # InstallAssistants.pkgs (macOS Installers) will have the following keys:
+    if "ExtendedMetaInfo" not in product:
+        return False
+    if "InstallAssistantPackageIdentifiers" not in product["ExtendedMetaInfo"]:
+        return False
+    if "SharedSupport" not in product["ExtendedMetaInfo"]["InstallAssistantPackageIdentifiers"]:
+        return False
+    return True
+
+
 class CatalogProducts:
     """
     Args:
@@ -24,18 +44,33 @@ class CatalogProducts:
         install_assistants_only       (bool): Only list InstallAssistant products
         only_vmm_install_assistants   (bool): Only list VMM-x86_64-compatible InstallAssistant products
         max_install_assistant_version (CatalogVersion): Maximum InstallAssistant version to list
+        max_workers                   (int): Maximum number of concurrent metadata fetches
+        mirror                        (str): Local mirror directory or URL to fetch product metadata from (see CatalogMirror)
     """
     def __init__(self,
                  catalog: dict,
                  install_assistants_only: bool = True,
                  only_vmm_install_assistants: bool = True,
-                 max_install_assistant_version: CatalogVersion = CatalogVersion.SEQUOIA
+                 max_install_assistant_version: CatalogVersion = CatalogVersion.SEQUOIA,
+                 max_workers: int = 8,
+                 mirror: str = None
                 ) -> None:
         self.catalog:             dict = catalog
         self.ia_only:             bool = install_assistants_only
         self.vmm_only:            bool = only_vmm_install_assistants
         self.max_ia_version: packaging = packaging.version.parse(f"{max_install_assistant_version.value}.99.99")
         self.max_ia_catalog: CatalogVersion = max_install_assistant_version
+        self.max_workers:          int = max_workers
+        self.mirror:     CatalogMirror = CatalogMirror(mirror) if mirror else None
+
+
+    def _fetch(self, url: str) -> bytes:
+        """
+        Fetch product metadata, from the mirror if configured
+        """
+        if self.mirror:
+            return self.mirror.fetch(url)
+        return network_handler.NetworkUtilities().get(url, cache=True).content
 
 
     def _legacy_parse_info_plist(self, data: dict) -> dict:
@@ -259,155 +294,158 @@ class CatalogProducts:
         return products_copy
 
 
-    @cached_property
-    def products(self) -> None:
-        """
-        Returns a list of products from the sucatalog
+    def _parse_product(self, product: str) -> dict:
         """
+        Parses a single product from the sucatalog, fetching its metadata
 
-        catalog = self.catalog
+        Parameters:
+            product (str): Product ID
 
-        _products = []
+        Returns:
+            dict: Product map, or None if the product should not be listed
+        """
 
-        for product in catalog["Products"]:
+        product_info = self.catalog["Products"][product]
 
-            # InstallAssistants.pkgs (macOS Installers) will have the following keys:
-            if self.ia_only:
-                if "ExtendedMetaInfo" not in catalog["Products"][product]:
-                    continue
-                if "InstallAssistantPackageIdentifiers" not in catalog["Products"][product]["ExtendedMetaInfo"]:
-                    continue
-                if "SharedSupport" not in catalog["Products"][product]["ExtendedMetaInfo"]["InstallAssistantPackageIdentifiers"]:
-                    continue
+        if self.ia_only:
+            if not is_install_assistant(product_info):
+                return None
 
-            _product_map = {
-                "ProductID": product,
-                "PostDate":  catalog["Products"][product]["PostDate"],
-                "Title":     None,
-                "Build":     None,
-                "Version":   None,
-                "Catalog":   None,
-
-                # Optional keys if not InstallAssistant only:
-                # "Packages": None,
-
-                # Optional keys if InstallAssistant found:
-                # "InstallAssistant": {
-                #     "URL":       None,
-                #     "Size":      None,
-                #     "XNUMajor":  None,
-                #     "IntegrityDataURL":  None,
-                #     "IntegrityDataSize": None
-                # },
-            }
+        _product_map = {
+            "ProductID": product,
+            "PostDate":  product_info["PostDate"],
+            "Title":     None,
+            "Build":     None,
+            "Version":   None,
+            "Catalog":   None,
+
+            # Optional keys if not InstallAssistant only:
+            # "Packages": None,
+
+            # Optional keys if InstallAssistant found:
+            # "InstallAssistant": {
+            #     "URL":       None,
+            #     "Size":      None,
+            #     "XNUMajor":  None,
+            #     "IntegrityDataURL":  None,
+            #     "IntegrityDataSize": None
+            # },
+        }
 
-            # InstallAssistant logic
-            if "Packages" in catalog["Products"][product]:
-                # Add packages to product map if not InstallAssistant only
-                if self.ia_only is False:
-                    _product_map["Packages"] = catalog["Products"][product]["Packages"]
-                for package in catalog["Products"][product]["Packages"]:
-                    if "URL" in package:
-                        if Path(package["URL"]).name == "InstallAssistant.pkg":
-                            _product_map["InstallAssistant"] = {
-                                "URL":               package["URL"],
-                                "Size":              package["Size"],
-                                "IntegrityDataURL":  package["IntegrityDataURL"],
-                                "IntegrityDataSize": package["IntegrityDataSize"]
-                            }
-
-                        if Path(package["URL"]).name not in ["Info.plist", "com_apple_MobileAsset_MacSoftwareUpdate.plist"]:
-                            continue
-
-                        net_obj = network_handler.NetworkUtilities().get(package["URL"])
-                        if net_obj is None:
-                            continue
-
-                        contents = net_obj.content
-                        try:
-                            plist_contents = plistlib.loads(contents)
-                        except plistlib.InvalidFileException:
-                            continue
-
-                        if plist_contents:
-                            if Path(package["URL"]).name == "Info.plist":
-                                result = self._legacy_parse_info_plist(plist_contents)
-                            else:
-                                result = self._parse_mobile_asset_plist(plist_contents)
-
-                            if result == {"Missing VMM Support": True}:
-                                _product_map = {}
-                                break
-
-                            _product_map.update(result)
-
-            if _product_map == {}:
-                continue
+        # InstallAssistant logic
+        if "Packages" in product_info:
+            # Add packages to product map if not InstallAssistant only
+            if self.ia_only is False:
+                _product_map["Packages"] = product_info["Packages"]
+            for package in product_info["Packages"]:
+                if "URL" in package:
+                    if Path(package["URL"]).name == "InstallAssistant.pkg":
+                        _product_map["InstallAssistant"] = {
+                            "URL":               package["URL"],
+                            "Size":              package["Size"],
+                            "IntegrityDataURL":  package["IntegrityDataURL"],
+                            "IntegrityDataSize": package["IntegrityDataSize"]
+                        }
+
+                    if Path(package["URL"]).name not in ["Info.plist", "com_apple_MobileAsset_MacSoftwareUpdate.plist"]:
+                        continue
+
+                    contents = self._fetch(package["URL"])
+                    if contents is None:
+                        continue
 
-            if _product_map["Version"] is not None:
-                _product_map["Title"] = self._build_installer_name(_product_map["Version"], _product_map["Catalog"])
+                    try:
+                        plist_contents = plistlib.loads(contents)
+                    except plistlib.InvalidFileException:
+                        continue
 
-            # Fall back to English distribution if no version is found
-            if _product_map["Version"] is None:
-                url = None
-                if "Distributions" in catalog["Products"][product]:
-                    if "English" in catalog["Products"][product]["Distributions"]:
-                        url = catalog["Products"][product]["Distributions"]["English"]
-                    elif "en" in catalog["Products"][product]["Distributions"]:
-                        url = catalog["Products"][product]["Distributions"]["en"]
-
-                if url is None:
-                    continue
+                    if plist_contents:
+                        if Path(package["URL"]).name == "Info.plist":
+                            result = self._legacy_parse_info_plist(plist_contents)
+                        else:
+                            result = self._parse_mobile_asset_plist(plist_contents)
 
-                net_obj = network_handler.NetworkUtilities().get(url)
-                if net_obj is None:
-                    continue
+                        if result == {"Missing VMM Support": True}:
+                            _product_map = {}
+                            break
 
-                contents = net_obj.content
+                        _product_map.update(result)
 
-                _product_map.update(self._parse_english_distributions(contents))
+        if _product_map == {}:
+            return None
 
-                if _product_map["Version"] is None:
-                    if "ServerMetadataURL" in catalog["Products"][product]:
-                        server_metadata_url = catalog["Products"][product]["ServerMetadataURL"]
+        if _product_map["Version"] is not None:
+            _product_map["Title"] = self._build_installer_name(_product_map["Version"], _product_map["Catalog"])
 
-                        net_obj = network_handler.NetworkUtilities().get(server_metadata_url)
-                        if net_obj is None:
-                            continue
+        # Fall back to English distribution if no version is found
+        if _product_map["Version"] is None:
+            url = None
+            if "Distributions" in product_info:
+                if "English" in product_info["Distributions"]:
+                    url = product_info["Distributions"]["English"]
+                elif "en" in product_info["Distributions"]:
+                    url = product_info["Distributions"]["en"]
 
-                        server_metadata_contents = net_obj.content
+            if url is None:
+                return None
 
-                        try:
-                            server_metadata_plist = plistlib.loads(server_metadata_contents)
-                        except plistlib.InvalidFileException:
-                            pass
+            contents = self._fetch(url)
+            if contents is None:
+                return None
 
-                        if "CFBundleShortVersionString" in server_metadata_plist:
-                            _product_map["Version"] = server_metadata_plist["CFBundleShortVersionString"]
+            _product_map.update(self._parse_english_distributions(contents))
 
+            if _product_map["Version"] is None:
+                if "ServerMetadataURL" in product_info:
+                    server_metadata_url = product_info["ServerMetadataURL"]
 
-            if _product_map["Version"] is not None:
-                # Check if version is newer than the max version
-                if self.ia_only:
-                    try:
-                        if packaging.version.parse(_product_map["Version"]) > self.max_ia_version:
-                            continue
-                    except packaging.version.InvalidVersion:
-                        pass
+                    server_metadata_contents = self._fetch(server_metadata_url)
+                    if server_metadata_contents is None:
+                        return None
 
-            if _product_map["Build"] is not None:
-                if "InstallAssistant" in _product_map:
                     try:
-                        # Grab first 2 characters of build
-                        _product_map["InstallAssistant"]["XNUMajor"] = int(_product_map["Build"][:2])
-                    except ValueError:
+                        server_metadata_plist = plistlib.loads(server_metadata_contents)
+                    except plistlib.InvalidFileException:
                         pass
 
-            # If version is still None, set to 0.0.0
-            if _product_map["Version"] is None:
-                _product_map["Version"] = "0.0.0"
+                    if "CFBundleShortVersionString" in server_metadata_plist:
+                        _product_map["Version"] = server_metadata_plist["CFBundleShortVersionString"]
+
+
+        if _product_map["Version"] is not None:
+            # Check if version is newer than the max version
+            if self.ia_only:
+                try:
+                    if packaging.version.parse(_product_map["Version"]) > self.max_ia_version:
+                        return None
+                except packaging.version.InvalidVersion:
+                    pass
+
+        if _product_map["Build"] is not None:
+            if "InstallAssistant" in _product_map:
+                try:
+                    # Grab first 2 characters of build
+                    _product_map["InstallAssistant"]["XNUMajor"] = int(_product_map["Build"][:2])
+                except ValueError:
+                    pass
+
+        # If version is still None, set to 0.0.0
+        if _product_map["Version"] is None:
+            _product_map["Version"] = "0.0.0"
+
+        return _product_map
+
+
+    @cached_property
+    def products(self) -> None:
+        """
+        Returns a list of products from the sucatalog
+
+        Product metadata is fetched concurrently, results are kept in catalog order
+        """
 
-            _products.append(_product_map)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            _products = [product for product in executor.map(self._parse_product, self.catalog["Products"]) if product is not None]
 
         _products = sorted(_products, key=lambda x: x["Version"])
 
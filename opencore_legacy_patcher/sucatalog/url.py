@@ -8,7 +8,6 @@ https://swscan.apple.com/content/catalogs/others/index-15seed-15-14-13-12-10.16-
 """
 
 import logging
-import plistlib
 
 from .constants import (
     SeedType,
@@ -16,6 +15,9 @@ from .constants import (
     CatalogExtension
 )
 
+from .        import parser
+from .mirror  import CatalogMirror
+
 from ..support import network_handler
 
 
@@ -27,15 +29,18 @@ class CatalogURL:
         version   (CatalogVersion):    Version of macOS
         seed      (SeedType):          Seed type
         extension (CatalogExtension):  Extension for the catalog URL
+        mirror    (str):               Local mirror directory or URL to fetch the catalog from (see CatalogMirror)
     """
     def __init__(self,
                  version: CatalogVersion = CatalogVersion.SEQUOIA,
                  seed: SeedType = SeedType.PublicRelease,
-                 extension: CatalogExtension = CatalogExtension.PLIST
+                 extension: CatalogExtension = CatalogExtension.PLIST,
+                 mirror: str = None
                  ) -> None:
         self.version   = version
         self.seed      = seed
         self.extension = extension
+        self.mirror    = CatalogMirror(mirror) if mirror else None
 
         self.seed    = self._fix_seed_type()
         self.version = self._fix_version()
@@ -168,8 +173,22 @@ class CatalogURL:
         """
         Return URL contents
         """
+        return self.contents()
+
+
+    def contents(self, install_assistants_only: bool = False) -> dict:
+        """
+        Return URL contents, from the mirror if configured
+
+        Args:
+            install_assistants_only (bool): Only parse InstallAssistant products, skipping all others
+        """
         try:
-            return plistlib.loads(network_handler.NetworkUtilities().get(self.url).content)
+            if self.mirror:
+                data = self.mirror.fetch(self.url)
+            else:
+                data = network_handler.NetworkUtilities().get(self.url, cache=True).content
+            return parser.parse_catalog(data, install_assistants_only)
         except Exception as e:
             logging.error(f"Failed to fetch URL contents: {e}")
             return None
@@ -15,11 +15,6 @@ from . import subprocess_wrapper
 
 from .. import constants
 
-from ..wx_gui import gui_entry
-from ..efi_builder import build
-from ..sys_patch import sys_patch
-from ..sys_patch.auto_patcher import StartAutomaticPatching
-
 from ..datasets import (
     model_array,
     os_data
@@ -28,9 +23,12 @@ from ..datasets import (
 from . import (
     utilities,
     defaults,
-    validation
+    global_settings
 )
 
+# Build, root patching, validation and GUI modules are imported by their handlers,
+# thus each invocation only loads what it uses
+
 
 
 # Generic building args
@@ -65,6 +63,10 @@ class arguments:
             self._sys_unpatch_handler()
             return
 
+        if self.args.plan_sys_vol:
+            self._sys_patch_plan_handler()
+            return
+
         if self.args.prepare_for_update:
             self._prepare_for_update_handler()
             return
@@ -77,11 +79,20 @@ class arguments:
             self._sys_patch_auto_handler()
             return
 
+        if self.args.sync_catalog_mirror:
+            self._catalog_mirror_handler()
+            return
+
+        if self.args.set_catalog_mirror is not None:
+            self._set_catalog_mirror_handler()
+            return
+
 
     def _validation_handler(self) -> None:
         """
         Enter validation mode
         """
+        from . import validation
         logging.info("Set Validation Mode")
         validation.PatcherValidation(self.constants)
 
@@ -91,6 +102,7 @@ class arguments:
         Start root volume patching
         """
 
+        from ..sys_patch import sys_patch
         logging.info("Set System Volume patching")
         if "Library/InstallerSandboxes/" in str(self.constants.payload_path):
             logging.info("- Running from Installer Sandbox, blocking OS updaters")
@@ -107,19 +119,69 @@ class arguments:
         """
         Start root volume unpatching
         """
+        from ..sys_patch import sys_patch
         logging.info("Set System Volume unpatching")
         sys_patch.PatchSysVolume(self.constants.custom_model or self.constants.computer.real_model, self.constants, None).start_unpatch()
 
 
+    def _sys_patch_plan_handler(self) -> None:
+        """
+        Write root volume patch plan to JSON, without patching
+        """
+        from ..sys_patch import sys_patch
+        logging.info(f"Set System Volume patch plan: {self.args.plan_sys_vol}")
+        plan = sys_patch.PatchSysVolume(self.constants.custom_model or self.constants.computer.real_model, self.constants, None).generate_plan()
+        if plan is None:
+            logging.info("- No Root Patches required for your machine!")
+            return
+
+        Path(self.args.plan_sys_vol).write_text(plan.to_json())
+        logging.info(f"- Wrote {len(plan.operations)} planned operations")
+
+
     def _sys_patch_auto_handler(self) -> None:
         """
         Start root volume auto patching
         """
 
+        from ..sys_patch.auto_patcher import StartAutomaticPatching
         logging.info("Set Auto patching")
         StartAutomaticPatching(self.constants).start_auto_patch()
 
 
+    def _catalog_mirror_handler(self) -> None:
+        """
+        Sync local Software Update Catalog mirror
+        """
+        from .. import sucatalog
+        logging.info(f"Set Catalog Mirror sync: {self.args.sync_catalog_mirror}")
+
+        # Mirror the catalog used by the macOS Installer download frame
+        catalog_url = sucatalog.CatalogURL(seed=sucatalog.SeedType.DeveloperSeed).url
+        if sucatalog.CatalogMirror(self.args.sync_catalog_mirror).sync(catalog_url) is False:
+            sys.exit(1)
+
+
+    def _set_catalog_mirror_handler(self) -> None:
+        """
+        Set or reset the catalog mirror used by the macOS Installer download
+        """
+        if self.args.set_catalog_mirror == "":
+            logging.info("Reset Catalog Mirror, fetching from Apple")
+            global_settings.GlobalEnviromentSettings().delete_property("CatalogMirror")
+            return
+
+        mirror = self.args.set_catalog_mirror
+        if not mirror.startswith(("http://", "https://")):
+            mirror = str(Path(mirror).expanduser().resolve())
+            if not Path(mirror).is_dir():
+                logging.error(f"Catalog Mirror directory does not exist: {mirror}")
+                sys.exit(1)
+
+        logging.info(f"Set Catalog Mirror: {mirror}")
+        global_settings.GlobalEnviromentSettings().write_property("CatalogMirror", mirror)
+
+
     def _prepare_for_update_handler(self) -> None:
         """
         Prepare host for macOS update
@@ -143,6 +205,7 @@ class arguments:
         """
         Fetch KDK for incoming OS
         """
+        from ..wx_gui import gui_entry
         results = subprocess.run(["/bin/ps", "-ax"], stdout=subprocess.PIPE)
         if results.stdout.decode("utf-8").count("OpenCore-Patcher --cache_os") > 1:
             logging.info("Another instance of OS caching is running, exiting")
@@ -180,6 +243,7 @@ class arguments:
         """
         Start config building process
         """
+        from ..efi_builder import build
         logging.info("Set OpenCore Build")
 
         if self.args.model:
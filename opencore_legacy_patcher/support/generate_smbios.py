@@ -8,6 +8,7 @@ from . import utilities
 
 from ..datasets import (
     smbios_data,
+    smbios_index,
     os_data,
     cpu_data
 )
@@ -88,29 +89,10 @@ def generate_fw_features(model, custom):
 def find_model_off_board(board):
     # Find model based off Board ID provided
     # Return none if unknown
-
-    # Strip extra data from Target Types (ap, uppercase)
-    if not (board.startswith("Mac-") or board.startswith("VMM-")):
-        if board.lower().endswith("ap"):
-            board = board[:-2]
-        board = board.lower()
-
-    for key in smbios_data.smbios_dictionary:
-        if board in [smbios_data.smbios_dictionary[key]["Board ID"], smbios_data.smbios_dictionary[key]["SecureBootModel"]]:
-            if key.endswith("_v2") or key.endswith("_v3") or key.endswith("_v4"):
-                # smbios_data has duplicate SMBIOS to handle multiple board IDs
-                key = key[:-3]
-            if key == "MacPro4,1":
-                # 4,1 and 5,1 have the same board ID, best to return the newer ID
-                key = "MacPro5,1"
-            return key
-    return None
+    return smbios_index.find_model_off_board(board)
 
 def find_board_off_model(model):
-    if model in smbios_data.smbios_dictionary:
-        return smbios_data.smbios_dictionary[model]["Board ID"]
-    else:
-        return None
+    return smbios_index.find_board_off_model(model)
 
 
 def check_firewire(model):
@@ -5,11 +5,16 @@ Based off of chunklist.py:
 - https://gist.github.com/dhinakg/cbe30edf31ddc153fd0b0c0570c9b041
 """
 
+import os
+import mmap
 import enum
+import queue
+import bisect
 import hashlib
 import logging
 import binascii
 import threading
+import concurrent.futures
 
 from typing import Union
 from pathlib import Path
@@ -44,6 +49,9 @@ class ChunklistVerification:
 
         >>> if chunk_obj.status == ChunklistStatus.FAILURE:
         ...     print(chunk_obj.error_msg)
+
+        Passing parallel=True to validate() hashes chunks on multiple cores:
+        >>> chunk_obj.validate(parallel=True)
     """
 
     def __init__(self, file_path: Path, chunklist_path: Union[Path, bytes]) -> None:
@@ -93,25 +101,53 @@ class ChunklistVerification:
         return chunks
 
 
-    def _validate(self) -> None:
+    def _validate_file(self) -> bool:
         """
-        Validates provided file against chunklist
+        Validates chunklist and file are usable
+
+        Returns:
+            bool: True if usable, False otherwise
         """
 
         if self.chunks is None:
             self.status = ChunklistStatus.FAILURE
-            return
+            return False
 
         if not Path(self.file_path).exists():
             self.error_msg = f"File {self.file_path} does not exist"
             self.status = ChunklistStatus.FAILURE
             logging.info(self.error_msg)
-            return
+            return False
 
         if not Path(self.file_path).is_file():
             self.error_msg = f"File {self.file_path} is not a file"
             self.status = ChunklistStatus.FAILURE
             logging.info(self.error_msg)
+            return False
+
+        return True
+
+
+    def _report_failure(self, chunk: dict, checksum: bytes) -> None:
+        """
+        Set failure status for mismatched chunk at current_chunk
+
+        Parameters:
+            chunk    (dict):  Chunk entry from the chunklist
+            checksum (bytes): Calculated checksum
+        """
+
+        self.error_msg = f"Chunk {self.current_chunk} checksum status FAIL: chunk sum {binascii.hexlify(chunk['checksum']).decode()}, calculated sum {binascii.hexlify(checksum).decode()}"
+        self.status = ChunklistStatus.FAILURE
+        logging.info(self.error_msg)
+
+
+    def _validate(self) -> None:
+        """
+        Validates provided file against chunklist
+        """
+
+        if not self._validate_file():
             return
 
         with self.file_path.open("rb") as f:
@@ -119,16 +155,270 @@ class ChunklistVerification:
                 self.current_chunk += 1
                 status = hashlib.sha256(f.read(chunk["length"])).digest()
                 if status != chunk["checksum"]:
-                    self.error_msg = f"Chunk {self.current_chunk} checksum status FAIL: chunk sum {binascii.hexlify(chunk['checksum']).decode()}, calculated sum {binascii.hexlify(status).decode()}"
-                    self.status = ChunklistStatus.FAILURE
-                    logging.info(self.error_msg)
+                    self._report_failure(chunk, status)
                     return
 
         self.status = ChunklistStatus.SUCCESS
 
 
-    def validate(self) -> None:
+    def _validate_parallel(self) -> None:
+        """
+        Validates provided file against chunklist using multiple threads
+
+        The file is memory mapped and chunks are hashed on a thread pool,
+        hashlib releases the GIL while hashing. Results are consumed in order,
+        so current_chunk progresses and fails identically to _validate()
+        """
+
+        if not self._validate_file():
+            return
+
+        offsets = []
+        offset = 0
+        for chunk in self.chunks:
+            offsets.append(offset)
+            offset += chunk["length"]
+
+        if offset == 0 or Path(self.file_path).stat().st_size < offset:
+            # Truncated files would fault on mmap access, fall back to regular reads
+            self._validate()
+            return
+
+        with self.file_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+                try:
+                    results = executor.map(
+                        lambda i: hashlib.sha256(view[offsets[i]:offsets[i] + self.chunks[i]["length"]]).digest(),
+                        range(len(self.chunks))
+                    )
+                    for chunk, status in zip(self.chunks, results):
+                        self.current_chunk += 1
+                        if status != chunk["checksum"]:
+                            self._report_failure(chunk, status)
+                            return
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+            finally:
+                view.release()
+
+        self.status = ChunklistStatus.SUCCESS
+
+
+    def validate(self, parallel: bool = False) -> None:
         """
         Spawns _validate() thread
+
+        Parameters:
+            parallel (bool): Hash chunks on multiple threads
+        """
+        threading.Thread(target=self._validate_parallel if parallel else self._validate).start()
+
+
+class StreamingChunklistVerification(ChunklistVerification):
+    """
+    Validates a file against its chunklist while the file is being written,
+    avoiding a second full read of the file once the download completes
+
+    Data is handed over with update() and hashed on a worker thread. Chunks
+    not received in order (ie. resumed or segmented downloads) are read back
+    from disk by finish()
+
+    Parameters:
+        file_path      (Path): Path to the file to validate
+        chunklist_path (Path): Path to the chunklist file
+        queue_depth    (int):  Maximum number of pending updates before update() blocks
+
+    Usage:
+        >>> chunk_obj = StreamingChunklistVerification("InstallAssistant.pkg", chunklist_bytes)
+        >>> chunk_obj.start()
+        >>> chunk_obj.update(offset, data)
+        >>> chunk_obj.finish()
+
+        >>> if chunk_obj.status == ChunklistStatus.FAILURE:
+        ...     print(chunk_obj.error_msg)
+    """
+
+    def __init__(self, file_path: Path, chunklist_path: Union[Path, bytes], queue_depth: int = 16) -> None:
+        super().__init__(file_path, chunklist_path)
+
+        self.chunk_offsets: list = []
+        self.total_size:    int  = 0
+        for chunk in self.chunks or []:
+            self.chunk_offsets.append(self.total_size)
+            self.total_size += chunk["length"]
+
+        self._verified: list = [False] * len(self.chunks or [])
+        self._deferred: set  = set()
+        self._hashers:  dict = {}
+
+        self._queue:  queue.Queue      = queue.Queue(maxsize=queue_depth)
+        self._worker: threading.Thread = None
+
+
+    def chunk_boundary(self, offset: int) -> int:
+        """
+        Get the first chunk boundary at or after the provided offset
+
+        Parameters:
+            offset (int): Offset in the file
+
+        Returns:
+            int: Offset of the chunk boundary
+        """
+
+        index = bisect.bisect_left(self.chunk_offsets, offset)
+        if index >= len(self.chunk_offsets):
+            return self.total_size
+        return self.chunk_offsets[index]
+
+
+    def start(self) -> None:
+        """
+        Spawns worker thread, must be called before update()
+        """
+
+        if self.chunks is None:
+            self.error_msg = "Invalid chunklist"
+            self.status = ChunklistStatus.FAILURE
+            return
+
+        if self._worker:
+            return
+
+        self._worker = threading.Thread(target=self._worker_loop)
+        self._worker.start()
+
+
+    def update(self, offset: int, data: bytes) -> None:
+        """
+        Queue newly written data for verification
+
+        Parameters:
+            offset (int):   Offset the data was written to
+            data   (bytes): Data written
         """
-        threading.Thread(target=self._validate).start()
+
+        if self._worker is None or self.status == ChunklistStatus.FAILURE:
+            return
+
+        self._queue.put((offset, data))
+
+
+    def stop(self) -> None:
+        """
+        Stop the worker thread, waiting for queued data to be processed
+        """
+
+        if self._worker is None:
+            return
+
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+
+
+    def finish(self) -> None:
+        """
+        Complete verification once the file has been fully written
+
+        Chunks that were not streamed in order are read back from disk
+        """
+
+        self.stop()
+
+        if self.chunks is None or self.status == ChunklistStatus.FAILURE:
+            self.status = ChunklistStatus.FAILURE
+            return
+
+        remaining = [i for i, verified in enumerate(self._verified) if not verified]
+        if remaining:
+            logging.info(f"Validating {len(remaining)} chunks not verified during download")
+            with self.file_path.open("rb") as f:
+                for index in remaining:
+                    f.seek(self.chunk_offsets[index])
+                    if not self._check_chunk(index, hashlib.sha256(f.read(self.chunks[index]["length"])).digest()):
+                        return
+
+        self.status = ChunklistStatus.SUCCESS
+
+
+    def _worker_loop(self) -> None:
+        """
+        Hash queued data until stopped
+        """
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            # Keep draining the queue on failure, so update() never blocks
+            if self.status == ChunklistStatus.FAILURE:
+                continue
+            try:
+                self._process(*item)
+            except Exception as e:
+                self.error_msg = f"Failed to validate data at offset {item[0]}: {e}"
+                self.status = ChunklistStatus.FAILURE
+                logging.info(self.error_msg)
+
+
+    def _process(self, offset: int, data: bytes) -> None:
+        """
+        Feed data to the hashers of the chunks it covers
+
+        Parameters:
+            offset (int):   Offset the data was written to
+            data   (bytes): Data written
+        """
+
+        data  = memoryview(data)
+        index = bisect.bisect_right(self.chunk_offsets, offset) - 1
+
+        while len(data) > 0 and 0 <= index < len(self.chunks):
+            length   = self.chunks[index]["length"]
+            relative = offset - self.chunk_offsets[index]
+            piece    = data[:length - relative]
+
+            if not self._verified[index] and index not in self._deferred:
+                hasher, position = self._hashers.pop(index, (None, 0))
+                if position != relative:
+                    # Data arrived out of order, verify from disk in finish()
+                    self._deferred.add(index)
+                else:
+                    hasher = hasher or hashlib.sha256()
+                    hasher.update(piece)
+                    position += len(piece)
+                    if position == length:
+                        if not self._check_chunk(index, hasher.digest()):
+                            return
+                    else:
+                        self._hashers[index] = (hasher, position)
+
+            data    = data[len(piece):]
+            offset += len(piece)
+            index  += 1
+
+
+    def _check_chunk(self, index: int, checksum: bytes) -> bool:
+        """
+        Compare calculated checksum against chunklist
+
+        Parameters:
+            index    (int):   Index of the chunk
+            checksum (bytes): Calculated checksum
+
+        Returns:
+            bool: True if checksum matches, False otherwise
+        """
+
+        chunk = self.chunks[index]
+        if checksum != chunk["checksum"]:
+            self.current_chunk = index + 1
+            self._report_failure(chunk, checksum)
+            return False
+
+        self._verified[index] = True
+        self.current_chunk += 1
+        return True
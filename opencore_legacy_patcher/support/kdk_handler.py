@@ -19,7 +19,8 @@ from ..volume   import generate_copy_arguments
 
 from . import (
     network_handler,
-    subprocess_wrapper
+    subprocess_wrapper,
+    kdk_validation
 )
 
 KDK_INSTALL_PATH: str  = "/Library/Developer/KDKs"
@@ -111,6 +112,7 @@ class KernelDebugKitObject:
         try:
             results = network_handler.NetworkUtilities().get(
                 KDK_API_LINK,
+                cache=True,
                 headers={
                     "User-Agent": f"OCLP/{self.constants.patcher_version}"
                 },
@@ -315,6 +317,7 @@ class KernelDebugKitObject:
         similar to how Install macOS.app is deleted during OS updates
 
         Uses Apple's pkg receipt system to verify the original contents of the KDK
+        Results are cached until the KDK changes, see kdk_validation.py
 
         Parameters:
             kdk_path (Path): Path to KDK
@@ -337,6 +340,10 @@ class KernelDebugKitObject:
 
         kdk_build = kdk_plist_data["ProductBuildVersion"]
 
+        validation = kdk_validation.index()
+        if validation.is_cached_valid(kdk_path):
+            return True
+
         # Check pkg receipts for this build, will give a canonical list if all files that should be present
         result = subprocess.run(["/usr/sbin/pkgutil", "--files", f"com.apple.pkg.KDK.{kdk_build}"], capture_output=True)
         if result.returncode != 0:
@@ -344,15 +351,16 @@ class KernelDebugKitObject:
             logging.info(f"pkg receipt missing for {kdk_path.name}, falling back to legacy validation")
             return self._local_kdk_valid_legacy(kdk_path)
 
-        # Go through each line of the pkg receipt and ensure it exists
-        for line in result.stdout.decode("utf-8").splitlines():
-            if not line.startswith("System/Library/Extensions"):
-                continue
-            if not Path(f"{kdk_path}/{line}").exists():
-                logging.info(f"Corrupted KDK found ({kdk_path.name}), removing due to missing file: {line}")
-                self._remove_kdk(kdk_path)
-                return False
+        # Ensure every file in the pkg receipt exists
+        missing = validation.missing_files(kdk_path, result.stdout.decode("utf-8").splitlines())
+        if missing:
+            logging.info(f"Corrupted KDK found ({kdk_path.name}), removing due to missing file: {missing[0]}")
+            if len(missing) > 1:
+                logging.info(f"- {len(missing) - 1} additional files missing")
+            self._remove_kdk(kdk_path)
+            return False
 
+        validation.record_valid(kdk_path)
         return True
 
 
@@ -476,6 +484,7 @@ class KernelDebugKitObject:
             subprocess_wrapper.log(result)
             return
 
+        kdk_validation.index().forget(kdk_path)
         logging.info(f"Successfully removed KDK: {kdk_path}")
 
 
@@ -0,0 +1,256 @@
+"""
+kdk_validation.py: Validation index for installed Kernel Debug Kits
+
+macOS may delete files from installed KDKs during OS updates, thus KDKs are validated
+against their pkg receipt before use. Rather than testing each receipt entry one by one,
+the KDK's Extensions folder is walked once (in parallel, per top-level entry), and
+compared against the receipt as a set difference.
+
+Valid results are cached alongside the modification time of every directory walked.
+As removing a file updates its parent directory's modification time, a KDK may be
+considered unchanged (and thus still valid) by re-checking directories alone.
+
+Usage:
+>>> from support import kdk_validation
+>>> validation = kdk_validation.index()
+>>> if validation.is_cached_valid(kdk_path):
+...     # Skip validation
+>>> missing = validation.missing_files(kdk_path, receipt)
+>>> if not missing:
+...     validation.record_valid(kdk_path)
+"""
+
+import os
+import json
+import stat
+import logging
+import threading
+import concurrent.futures
+
+from pathlib import Path
+
+
+CACHE_VERSION:   int  = 1
+CACHE_PATH:      Path = Path.home() / "Library/Caches/com.dortania.opencore-legacy-patcher/KDK-Validation.json"
+EXTENSIONS_PATH: str  = "System/Library/Extensions"
+
+
+class KernelDebugKitValidationIndex:
+    """
+    Parameters:
+        cache_path  (Path): Location of the cached validation results
+        max_workers (int):  Maximum number of concurrent directory walks
+    """
+
+    def __init__(self, cache_path: Path = CACHE_PATH, max_workers: int = None) -> None:
+        self.cache_path  = Path(cache_path)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+        self._lock:      threading.Lock = threading.Lock()
+        self._cache:     dict = None  # KDK path -> {relative directory: modification time}
+        self._snapshots: dict = {}    # KDK path -> (present paths, directory modification times), from the last walk
+
+
+    def _load(self) -> dict:
+        if self._cache is not None:
+            return self._cache
+
+        self._cache = {}
+        if not self.cache_path.exists():
+            return self._cache
+
+        try:
+            cached = json.loads(self.cache_path.read_text())
+            if cached.get("Version") == CACHE_VERSION:
+                self._cache = cached["KDKs"]
+        except Exception as e:
+            logging.warning(f"Failed to load KDK validation cache: {e}")
+
+        return self._cache
+
+
+    def _save(self) -> None:
+        """
+        Save cache, failures are non-fatal
+        """
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            temp_path.write_text(json.dumps({"Version": CACHE_VERSION, "KDKs": self._cache}))
+            temp_path.replace(self.cache_path)
+        except Exception as e:
+            logging.warning(f"Failed to save KDK validation cache: {e}")
+
+
+    def _walk(self, root: str, relative: str) -> tuple:
+        """
+        Walk a single entry of the Extensions folder
+
+        Symbolic links are reported as present if their target exists, though
+        never descended into, matching the receipt which lists links themselves
+
+        Returns:
+            tuple: (present paths, directory modification times), relative to the KDK
+        """
+
+        present     = []
+        directories = {}
+
+        try:
+            root_stat = os.stat(root)
+        except OSError:
+            # Dangling symlinks are considered missing, matching Path.exists()
+            return present, directories
+
+        present.append(relative)
+        if not stat.S_ISDIR(root_stat.st_mode) or os.path.islink(root):
+            return present, directories
+
+        pending = [(root, relative, root_stat.st_mtime_ns)]
+        while pending:
+            current, current_relative, mtime = pending.pop()
+            directories[current_relative] = mtime
+            try:
+                with os.scandir(current) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                entry_relative = f"{current_relative}/{entry.name}"
+                present.append(entry_relative)
+                if stat.S_ISDIR(entry_stat.st_mode) and entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, entry_relative, entry_stat.st_mtime_ns))
+
+        return present, directories
+
+
+    def scan(self, kdk_path: Path) -> set:
+        """
+        Walk the KDK's Extensions folder, one worker per top-level entry
+
+        Parameters:
+            kdk_path (Path): Path to KDK
+
+        Returns:
+            set: Paths present within the Extensions folder, relative to the KDK (ie. 'System/Library/Extensions/apfs.kext')
+        """
+
+        extensions = Path(kdk_path) / EXTENSIONS_PATH
+        present     = set()
+        directories = {}
+
+        try:
+            extensions_mtime = os.stat(extensions).st_mtime_ns
+            with os.scandir(extensions) as iterator:
+                entries = [entry.name for entry in iterator]
+        except OSError:
+            with self._lock:
+                self._snapshots[str(kdk_path)] = (present, directories)
+            return present
+
+        present.add(EXTENSIONS_PATH)
+        directories[EXTENSIONS_PATH] = extensions_mtime
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda name: self._walk(str(extensions / name), f"{EXTENSIONS_PATH}/{name}"), entries)
+            for entry_present, entry_directories in results:
+                present.update(entry_present)
+                directories.update(entry_directories)
+
+        with self._lock:
+            self._snapshots[str(kdk_path)] = (present, directories)
+
+        return present
+
+
+    def missing_files(self, kdk_path: Path, receipt: list) -> list:
+        """
+        Compare the KDK against its pkg receipt
+
+        Parameters:
+            kdk_path (Path): Path to KDK
+            receipt  (list): Output of 'pkgutil --files', one path per entry
+
+        Returns:
+            list: Extensions entries listed in the receipt though missing from the KDK, in receipt order
+        """
+
+        expected = [line.rstrip("/") for line in receipt if line.startswith(EXTENSIONS_PATH)]
+        missing  = set(expected) - self.scan(kdk_path)
+        if not missing:
+            return []
+
+        return [line for line in expected if line in missing]
+
+
+    def is_cached_valid(self, kdk_path: Path) -> bool:
+        """
+        Check whether the KDK was previously validated, and is unchanged since
+
+        Parameters:
+            kdk_path (Path): Path to KDK
+
+        Returns:
+            bool: True if validated and unchanged
+        """
+
+        with self._lock:
+            cached = self._load().get(str(kdk_path))
+        if not cached:
+            return False
+
+        # Directories only, a fraction of the entries scan() visits
+        for directory, mtime in cached.items():
+            try:
+                if os.stat(f"{kdk_path}/{directory}").st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+
+    def record_valid(self, kdk_path: Path) -> None:
+        """
+        Cache KDK as valid, using the state captured by the last scan()
+
+        Parameters:
+            kdk_path (Path): Path to KDK
+        """
+
+        with self._lock:
+            snapshot = self._snapshots.pop(str(kdk_path), None)
+            if snapshot is None or not snapshot[1]:
+                return
+
+            self._load()[str(kdk_path)] = snapshot[1]
+            self._save()
+
+
+    def forget(self, kdk_path: Path) -> None:
+        """
+        Discard cached results for KDK (ie. once removed)
+        """
+
+        with self._lock:
+            self._snapshots.pop(str(kdk_path), None)
+            if self._load().pop(str(kdk_path), None) is not None:
+                self._save()
+
+
+_index: KernelDebugKitValidationIndex = None
+
+
+def index() -> KernelDebugKitValidationIndex:
+    """
+    Shared validation index, cache is loaded on first use
+    """
+    global _index
+    if _index is None:
+        _index = KernelDebugKitValidationIndex()
+    return _index
@@ -72,6 +72,7 @@ class MetalLibraryObject:
         try:
             results = network_handler.NetworkUtilities().get(
                 METALLIB_API_LINK,
+                cache=True,
                 headers={
                     "User-Agent": f"OCLP/{self.constants.patcher_version}"
                 },
@@ -5,6 +5,7 @@ Primarily based around the DownloadObject class, which provides a simple
 object for libraries to query download progress and status
 """
 
+import os
 import time
 import requests
 import threading
@@ -12,13 +13,22 @@ import logging
 import enum
 import hashlib
 import atexit
+import plistlib
+import concurrent.futures
 
 from typing import Union
 from pathlib import Path
 
-from . import utilities
+from . import utilities, integrity_verification, response_cache
 
 SESSION = requests.Session()
+CACHE   = response_cache.ResponseCache()
+
+DOWNLOAD_CHUNK_SIZE:  int = 1024 * 1024 * 4
+SEGMENT_MINIMUM_SIZE: int = 1024 * 1024 * 64
+
+RESUME_STATE_SUFFIX:   str   = ".oclp_download.plist"
+RESUME_STATE_INTERVAL: float = 2.0
 
 
 class DownloadStatus(enum.Enum):
@@ -85,19 +95,57 @@ class NetworkUtilities:
             return False
 
 
-    def get(self, url: str, **kwargs) -> requests.Response:
+    def get(self, url: str, cache: bool = False, **kwargs) -> requests.Response:
         """
         Wrapper for requests's get method
         Implement additional error handling
 
         Parameters:
             url (str): URL to get
+            cache (bool): Use the persistent response cache, revalidating stale entries
+                          If the network is unavailable, stale entries are returned
             **kwargs: Additional parameters for requests.get
 
         Returns:
             requests.Response: Response object from requests.get
         """
 
+        if cache is False or kwargs.get("stream", False) is True:
+            return self._get(url, **kwargs)
+
+        if CACHE.is_fresh(url):
+            result = CACHE.response(url)
+            if result is not None:
+                return result
+
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **CACHE.conditional_headers(url)}
+
+        result = self._get(url, **kwargs)
+
+        if result.status_code == 304:
+            CACHE.revalidated(url, result.headers)
+            cached_result = CACHE.response(url)
+            if cached_result is not None:
+                return cached_result
+            # Cache entry vanished, refetch without validators
+            kwargs["headers"].pop("If-None-Match", None)
+            kwargs["headers"].pop("If-Modified-Since", None)
+            result = self._get(url, **kwargs)
+
+        if result.status_code == 200:
+            CACHE.store(url, result)
+        elif result.status_code is None and CACHE.has_entry(url):
+            logging.info(f"Network unavailable, using cached response for {url}")
+            return CACHE.response(url)
+
+        return result
+
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Uncached requests.get with error handling, see get()
+        """
+
         result: requests.Response = None
 
         try:
@@ -160,9 +208,30 @@ class DownloadObject:
 
         >>> print("Download complete"")
 
+    Segmented downloads:
+        Passing segments > 1 splits the file into multiple HTTP Range requests
+        downloaded in parallel. If the server does not advertise 'Accept-Ranges',
+        or the file size is unknown, the regular single stream download is used.
+
+        >>> download_object = DownloadObject(url, path, segments=4)
+
+    Resumable downloads:
+        While downloading, a sidecar state file (<path>.oclp_download.plist) records
+        the URL, ETag/Last-Modified, expected size and byte ranges already written.
+        If a download is interrupted, the next attempt continues from the recorded
+        ranges. Should the remote file have changed, a clean download is performed.
+
+    Integrity verification:
+        A StreamingChunklistVerification object may be passed to verify the file
+        against its chunklist while downloading. The download fails at the first
+        mismatching chunk, and no second pass over the file is needed afterwards.
+
+        >>> chunk_obj = integrity_verification.StreamingChunklistVerification(path, chunklist)
+        >>> download_object = DownloadObject(url, path, verifier=chunk_obj)
+
     """
 
-    def __init__(self, url: str, path: str) -> None:
+    def __init__(self, url: str, path: str, segments: int = 1, verifier: integrity_verification.StreamingChunklistVerification = None) -> None:
         self.url:       str = url
         self.status:    str = DownloadStatus.INACTIVE
         self.error_msg: str = ""
@@ -172,6 +241,7 @@ class DownloadObject:
 
         self.total_file_size:      float = 0.0
         self.downloaded_file_size: float = 0.0
+        self.resumed_file_size:    float = 0.0
         self.start_time:           float = time.time()
 
         self.error:             bool = False
@@ -181,6 +251,19 @@ class DownloadObject:
 
         self.active_thread: threading.Thread = None
 
+        self.verifier: integrity_verification.StreamingChunklistVerification = verifier
+
+        self.segments:        int  = max(1, segments)
+        self.supports_ranges: bool = False
+        self._progress_lock:  threading.Lock = threading.Lock()
+
+        self.etag:          str = None
+        self.last_modified: str = None
+
+        self.resume_state_path: Path  = self.filepath.with_name(self.filepath.name + RESUME_STATE_SUFFIX)
+        self._completed_ranges: list  = []
+        self._last_state_save:  float = 0.0
+
         self.should_checksum: bool = False
 
         self.checksum = None
@@ -270,12 +353,183 @@ class DownloadObject:
                 self.total_file_size = float(result.headers['Content-Length'])
             else:
                 raise Exception("Content-Length missing from headers")
+            self.supports_ranges = result.headers.get('Accept-Ranges', 'none').lower() == 'bytes'
+            self.etag            = result.headers.get('ETag', None)
+            self.last_modified   = result.headers.get('Last-Modified', None)
         except Exception as e:
             logging.error(f"Error determining file size {self.url}: {str(e)}")
             logging.error("Assuming file size is 0")
             self.total_file_size = 0.0
 
 
+    def _is_resumable(self) -> bool:
+        """
+        Determine whether the download can be resumed if interrupted
+
+        Requires the server to support byte ranges, a known file size and
+        a validator (ETag or Last-Modified) to detect remote changes
+
+        Returns:
+            bool: True if resumable, False otherwise
+        """
+
+        if self.supports_ranges is False:
+            return False
+        if self.total_file_size == 0.0:
+            return False
+        if self.etag is None and self.last_modified is None:
+            return False
+        return True
+
+
+    def _if_range_header(self) -> dict:
+        """
+        Generate If-Range header, ensuring the server only honours the range
+        if the remote file is unchanged
+
+        Returns:
+            dict: Header dictionary
+        """
+
+        if self.etag and not self.etag.startswith("W/"):
+            return {"If-Range": self.etag}
+        if self.last_modified:
+            return {"If-Range": self.last_modified}
+        return {}
+
+
+    def _restore_resume_state(self) -> bool:
+        """
+        Load the sidecar state file of a previous, interrupted download
+
+        Returns:
+            bool: True if the existing partial file can be resumed, False otherwise
+        """
+
+        if not self.resume_state_path.exists():
+            return False
+        if not self.filepath.exists():
+            return False
+        if not self._is_resumable():
+            return False
+
+        try:
+            state = plistlib.loads(self.resume_state_path.read_bytes())
+        except Exception as e:
+            logging.warning(f"Failed to parse download state {self.resume_state_path}: {e}")
+            return False
+
+        if state.get("URL") != self.url:
+            return False
+        if state.get("Size") != int(self.total_file_size):
+            logging.info(f"Remote file size changed, discarding partial download: {self.filename}")
+            return False
+        if state.get("ETag") != self.etag or state.get("Last-Modified") != self.last_modified:
+            logging.info(f"Remote file changed, discarding partial download: {self.filename}")
+            return False
+        if self.filepath.stat().st_size > self.total_file_size:
+            return False
+
+        ranges = self._merge_ranges([tuple(x) for x in state.get("Ranges", [])])
+        if any(start < 0 or end > self.total_file_size for start, end in ranges):
+            return False
+
+        self._completed_ranges    = ranges
+        self.downloaded_file_size = float(sum(end - start for start, end in ranges))
+        self.resumed_file_size    = self.downloaded_file_size
+
+        return True
+
+
+    def _save_resume_state(self, force: bool = False) -> None:
+        """
+        Write the sidecar state file, throttled to RESUME_STATE_INTERVAL
+
+        Parameters:
+            force (bool): Ignore throttling
+        """
+
+        if not self._is_resumable():
+            return
+
+        with self._progress_lock:
+            if force is False and time.time() - self._last_state_save < RESUME_STATE_INTERVAL:
+                return
+            self._last_state_save = time.time()
+
+            state = {
+                "URL":    self.url,
+                "Size":   int(self.total_file_size),
+                "Ranges": [list(x) for x in self._completed_ranges],
+            }
+            # plistlib cannot store None, omit missing validators
+            if self.etag:
+                state["ETag"] = self.etag
+            if self.last_modified:
+                state["Last-Modified"] = self.last_modified
+
+            try:
+                temp_path = self.resume_state_path.with_suffix(".tmp")
+                temp_path.write_bytes(plistlib.dumps(state))
+                temp_path.replace(self.resume_state_path)
+            except Exception as e:
+                logging.warning(f"Failed to write download state {self.resume_state_path}: {e}")
+
+
+    def _remove_resume_state(self) -> None:
+        """
+        Remove the sidecar state file
+        """
+
+        if self.resume_state_path.exists():
+            self.resume_state_path.unlink()
+
+
+    def _merge_ranges(self, ranges: list) -> list:
+        """
+        Merge overlapping or adjacent byte ranges
+
+        Parameters:
+            ranges (list): List of (start, end) tuples, end exclusive
+
+        Returns:
+            list: Sorted, merged list of (start, end) tuples
+        """
+
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+
+    def _missing_ranges(self, start: int, end: int) -> list:
+        """
+        Determine which parts of a byte range have not been written yet
+
+        Parameters:
+            start (int): First byte of the range
+            end   (int): Last byte of the range (inclusive)
+
+        Returns:
+            list: List of (start, end) tuples, end inclusive
+        """
+
+        missing = []
+        position = start
+        for done_start, done_end in self._completed_ranges:
+            if done_end <= position or done_start > end:
+                continue
+            if done_start > position:
+                missing.append((position, done_start - 1))
+            position = max(position, done_end)
+        if position <= end:
+            missing.append((position, end))
+        return missing
+
+
     def _update_checksum(self, chunk: bytes) -> None:
         """
         Update checksum with new chunk
@@ -298,6 +552,12 @@ class DownloadObject:
         """
 
         try:
+            if self._restore_resume_state():
+                logging.info(f"Resuming download of {self.filename} from {utilities.human_fmt(self.downloaded_file_size)}")
+                return True
+
+            self._remove_resume_state()
+
             if Path(path).exists():
                 logging.info(f"Deleting existing file: {path}")
                 Path(path).unlink()
@@ -324,6 +584,210 @@ class DownloadObject:
         return True
 
 
+    def _should_segment(self) -> bool:
+        """
+        Determine whether the file should be downloaded in segments
+
+        Returns:
+            bool: True if segmented download is possible and requested
+        """
+
+        if self.segments <= 1:
+            return False
+        if self.total_file_size < SEGMENT_MINIMUM_SIZE * 2:
+            return False
+        if self.supports_ranges is False:
+            logging.info(f"Server does not advertise byte ranges, falling back to single stream download: {self.filename}")
+            return False
+        return True
+
+
+    def _generate_segments(self) -> list:
+        """
+        Split the file into byte ranges for segmented downloading
+
+        Returns:
+            list: List of (start, end) tuples, end inclusive
+        """
+
+        total_size   = int(self.total_file_size)
+        segments     = min(self.segments, total_size // SEGMENT_MINIMUM_SIZE)
+        segment_size = total_size // segments
+
+        boundaries = [i * segment_size for i in range(segments)] + [total_size]
+        if self.verifier and self.verifier.chunks:
+            # Align to chunklist boundaries, letting each chunk be streamed to the verifier in order
+            boundaries = [0] + [min(self.verifier.chunk_boundary(x), total_size) for x in boundaries[1:-1]] + [total_size]
+
+        ranges = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            if end > start:
+                ranges.append((start, end - 1))
+
+        return ranges
+
+
+    def _update_progress(self, offset: int, size: int) -> None:
+        """
+        Update downloaded size and written ranges, safe to call from multiple threads
+
+        Parameters:
+            offset (int): Offset the bytes were written to
+            size   (int): Number of bytes written
+        """
+
+        with self._progress_lock:
+            self.downloaded_file_size += size
+            self._completed_ranges = self._merge_ranges(self._completed_ranges + [(offset, offset + size)])
+        self._save_resume_state()
+
+
+    def _update_verifier(self, offset: int, chunk: bytes) -> None:
+        """
+        Pass newly written data to the integrity verifier
+
+        Parameters:
+            offset (int):   Offset the bytes were written to
+            chunk  (bytes): Bytes written
+        """
+
+        if self.verifier is None:
+            return
+        if self.verifier.status == integrity_verification.ChunklistStatus.FAILURE:
+            raise Exception(f"Integrity verification failed: {self.verifier.error_msg}")
+        self.verifier.update(offset, chunk)
+
+
+    def _display_progress(self) -> None:
+        """
+        Print download progress to console
+        """
+
+        # Don't use logging here, as we'll be spamming the log file
+        if self.total_file_size == 0.0:
+            print(f"Downloaded {utilities.human_fmt(self.downloaded_file_size)} of {self.filename}")
+        else:
+            print(f"Downloaded {self.get_percent():.2f}% of {self.filename} ({utilities.human_fmt(self.get_speed())}/s) ({self.get_time_remaining():.2f} seconds remaining)")
+
+
+    def _download_stream(self, display_progress: bool = False) -> None:
+        """
+        Download the file with a single streamed request
+
+        Parameters:
+            display_progress (bool): Display progress in console
+        """
+
+        offset  = self._completed_ranges[0][1] if self._completed_ranges and self._completed_ranges[0][0] == 0 else 0
+        headers = {}
+        if offset > 0:
+            headers = {"Range": f"bytes={offset}-", **self._if_range_header()}
+
+        response = NetworkUtilities().get(self.url, stream=True, timeout=10, headers=headers)
+
+        if offset > 0 and response.status_code != 206:
+            logging.info(f"Server did not honour resume request (status: {response.status_code}), restarting download: {self.filename}")
+            offset = 0
+
+        # Single stream can only continue the leading contiguous range
+        with self._progress_lock:
+            self._completed_ranges    = [(0, offset)] if offset > 0 else []
+            self.downloaded_file_size = float(offset)
+            self.resumed_file_size    = float(offset)
+
+        with open(self.filepath, 'r+b' if offset > 0 else 'wb') as file:
+            file.seek(offset)
+            file.truncate()
+            if offset > 0 and self.should_checksum:
+                # Include previously downloaded bytes in checksum
+                with open(self.filepath, 'rb') as existing:
+                    remaining = offset
+                    while remaining > 0 and (chunk := existing.read(min(DOWNLOAD_CHUNK_SIZE, remaining))):
+                        self._update_checksum(chunk)
+                        remaining -= len(chunk)
+            for i, chunk in enumerate(response.iter_content(DOWNLOAD_CHUNK_SIZE)):
+                if self.should_stop:
+                    raise Exception("Download stopped")
+                if chunk:
+                    file.write(chunk)
+                    self._update_progress(offset, len(chunk))
+                    self._update_verifier(offset, chunk)
+                    offset += len(chunk)
+                    if self.should_checksum:
+                        self._update_checksum(chunk)
+                    if display_progress and i % 100:
+                        self._display_progress()
+
+
+    def _download_segment(self, start: int, end: int) -> None:
+        """
+        Download a single byte range into the preallocated file
+
+        Parameters:
+            start (int): First byte of the range
+            end   (int): Last byte of the range (inclusive)
+        """
+
+        response = NetworkUtilities().get(self.url, stream=True, timeout=10, headers={"Range": f"bytes={start}-{end}", **self._if_range_header()})
+        if response.status_code != 206:
+            raise Exception(f"Server did not honour range request for bytes {start}-{end} (status: {response.status_code})")
+
+        offset = start
+        fd = os.open(self.filepath, os.O_WRONLY)
+        try:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                if self.should_stop:
+                    raise Exception("Download stopped")
+                if not chunk:
+                    continue
+                if offset + len(chunk) > end + 1:
+                    raise Exception(f"Server returned more data than requested for bytes {start}-{end}")
+                os.pwrite(fd, chunk, offset)
+                self._update_progress(offset, len(chunk))
+                self._update_verifier(offset, chunk)
+                offset += len(chunk)
+        finally:
+            os.close(fd)
+
+        if offset != end + 1:
+            raise Exception(f"Incomplete segment for bytes {start}-{end}: received {offset - start} of {end - start + 1} bytes")
+
+
+    def _download_segmented(self, display_progress: bool = False) -> None:
+        """
+        Download the file with parallel HTTP Range requests
+
+        Parameters:
+            display_progress (bool): Display progress in console
+        """
+
+        segments = [missing for start, end in self._generate_segments() for missing in self._missing_ranges(start, end)]
+        logging.info(f"Downloading {self.filename} in {len(segments)} segments")
+
+        # Preallocate file, segments are written in place
+        with open(self.filepath, 'r+b' if self._completed_ranges else 'wb') as file:
+            file.truncate(int(self.total_file_size))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(segments))) as executor:
+            futures = [executor.submit(self._download_segment, start, end) for start, end in segments]
+            while True:
+                done, pending = concurrent.futures.wait(futures, timeout=1, return_when=concurrent.futures.FIRST_EXCEPTION)
+                if display_progress:
+                    self._display_progress()
+                for future in done:
+                    if future.exception():
+                        # Signal remaining segments to exit
+                        self.should_stop = True
+                        raise future.exception()
+                if not pending:
+                    break
+
+        if self.should_checksum:
+            with open(self.filepath, 'rb') as file:
+                while chunk := file.read(DOWNLOAD_CHUNK_SIZE):
+                    self._update_checksum(chunk)
+
+
     def _download(self, display_progress: bool = False) -> None:
         """
         Download the file
@@ -343,36 +807,41 @@ class DownloadObject:
             if self._prepare_working_directory(self.filepath) is False:
                 raise Exception(self.error_msg)
 
-            response = NetworkUtilities().get(self.url, stream=True, timeout=10)
-
-            with open(self.filepath, 'wb') as file:
-                atexit.register(self.stop)
-                for i, chunk in enumerate(response.iter_content(1024 * 1024 * 4)):
-                    if self.should_stop:
-                        raise Exception("Download stopped")
-                    if chunk:
-                        file.write(chunk)
-                        self.downloaded_file_size += len(chunk)
-                        if self.should_checksum:
-                            self._update_checksum(chunk)
-                        if display_progress and i % 100:
-                            # Don't use logging here, as we'll be spamming the log file
-                            if self.total_file_size == 0.0:
-                                print(f"Downloaded {utilities.human_fmt(self.downloaded_file_size)} of {self.filename}")
-                            else:
-                                print(f"Downloaded {self.get_percent():.2f}% of {self.filename} ({utilities.human_fmt(self.get_speed())}/s) ({self.get_time_remaining():.2f} seconds remaining)")
-                self.download_complete = True
-                logging.info(f"Download complete: {self.filename}")
-                logging.info("Stats:")
-                logging.info(f"- Downloaded size: {utilities.human_fmt(self.downloaded_file_size)}")
-                logging.info(f"- Time elapsed: {(time.time() - self.start_time):.2f} seconds")
-                logging.info(f"- Speed: {utilities.human_fmt(self.downloaded_file_size / (time.time() - self.start_time))}/s")
-                logging.info(f"- Location: {self.filepath}")
+            atexit.register(self.stop)
+            if self.verifier:
+                self.verifier.start()
+
+            if self._should_segment():
+                self._download_segmented(display_progress)
+            else:
+                self._download_stream(display_progress)
+
+            if self.verifier:
+                self.verifier.finish()
+                if self.verifier.status != integrity_verification.ChunklistStatus.SUCCESS:
+                    raise Exception(f"Integrity verification failed: {self.verifier.error_msg}")
+
+            self._remove_resume_state()
+            self.download_complete = True
+            logging.info(f"Download complete: {self.filename}")
+            logging.info("Stats:")
+            logging.info(f"- Downloaded size: {utilities.human_fmt(self.downloaded_file_size)}")
+            logging.info(f"- Time elapsed: {(time.time() - self.start_time):.2f} seconds")
+            logging.info(f"- Speed: {utilities.human_fmt(self.get_speed())}/s")
+            logging.info(f"- Location: {self.filepath}")
         except Exception as e:
             self.error = True
             self.error_msg = str(e)
             self.status = DownloadStatus.ERROR
             logging.error(f"Error downloading {self.url}: {self.error_msg}")
+            if self.verifier:
+                self.verifier.stop()
+                if self.verifier.status == integrity_verification.ChunklistStatus.FAILURE:
+                    # Don't resume on top of corrupted data
+                    self._completed_ranges = []
+                    self._remove_resume_state()
+            if self._completed_ranges:
+                self._save_resume_state(force=True)
 
         self.status = DownloadStatus.COMPLETE
         utilities.enable_sleep_after_running()
@@ -399,7 +868,7 @@ class DownloadObject:
             float: The download speed in bytes per second
         """
 
-        return self.downloaded_file_size / (time.time() - self.start_time)
+        return (self.downloaded_file_size - self.resumed_file_size) / (time.time() - self.start_time)
 
 
     def get_time_remaining(self) -> float:
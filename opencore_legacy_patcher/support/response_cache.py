@@ -0,0 +1,376 @@
+"""
+response_cache.py: Persistent HTTP response cache for small, frequently fetched resources
+
+Stores response bodies on disk alongside their ETag/Last-Modified validators,
+allowing conditional revalidation instead of refetching unchanged data.
+Primarily used for catalogs and manifests (sucatalog, KdkSupportPkg, MetallibSupportPkg, GitHub API)
+
+Cache hits only update access times in memory, which are persisted at most once per
+ACCESS_SAVE_INTERVAL, alongside the next store, or at exit. Saves merge with the index
+on disk, thus entries stored by other instances of the patcher are preserved.
+"""
+
+import re
+import atexit
+import time
+import hashlib
+import logging
+import plistlib
+import requests
+import threading
+
+from pathlib             import Path
+from requests.structures import CaseInsensitiveDict
+
+
+CACHE_PATH:     Path = Path.home() / "Library/Caches/com.dortania.opencore-legacy-patcher/HTTP"
+CACHE_MAX_SIZE: int  = 1024 * 1024 * 128
+CACHE_INDEX:    str  = "Index.plist"
+
+ACCESS_SAVE_INTERVAL: int = 60  # Seconds between persisting access times from cache hits
+
+
+class ResponseCache:
+    """
+    Disk backed HTTP response cache with LRU eviction
+
+    Entries are keyed by URL. Freshness follows the 'Cache-Control: max-age'
+    directive, stale entries are revalidated with If-None-Match/If-Modified-Since
+
+    Usage:
+        >>> cache = ResponseCache()
+        >>> headers = cache.conditional_headers(url)
+        >>> if cache.is_fresh(url):
+        ...     response = cache.response(url)
+
+        >>> cache.store(url, response)
+    """
+
+    def __init__(self, cache_path: Path = CACHE_PATH, max_size: int = CACHE_MAX_SIZE) -> None:
+        self.cache_path: Path = Path(cache_path)
+        self.max_size:   int  = max_size
+
+        self._index: dict = None
+        self._lock:  threading.RLock = threading.RLock()
+
+        self._access_dirty:    bool  = False  # Access times updated since the last save
+        self._last_save:       float = time.time()
+        self._exit_registered: bool  = False
+
+
+    def _key(self, url: str) -> str:
+        """
+        Generate cache key for URL
+        """
+        return hashlib.sha256(url.encode()).hexdigest()
+
+
+    def _body_path(self, key: str) -> Path:
+        """
+        Path to the cached body for key
+        """
+        return self.cache_path / f"{key}.body"
+
+
+    def _load_index(self) -> dict:
+        """
+        Load cache index from disk, once per process
+        """
+
+        if self._index is not None:
+            return self._index
+
+        self._index = {}
+        index_path = self.cache_path / CACHE_INDEX
+        if index_path.exists():
+            try:
+                self._index = plistlib.loads(index_path.read_bytes())
+            except Exception as e:
+                logging.warning(f"Failed to load response cache index, resetting: {e}")
+
+        return self._index
+
+
+    def _merge_index(self) -> None:
+        """
+        Merge entries from the index on disk, which may have been updated by another instance
+
+        Per entry, the most recently stored response and most recent access are kept.
+        Entries whose body is missing (ie. evicted or cleared by another instance) are dropped
+        """
+
+        disk_index = {}
+        index_path = self.cache_path / CACHE_INDEX
+        if index_path.exists():
+            try:
+                disk_index = plistlib.loads(index_path.read_bytes())
+            except Exception as e:
+                logging.warning(f"Failed to load response cache index for merging: {e}")
+
+        for key, disk_entry in disk_index.items():
+            entry = self._index.get(key)
+            if entry is None:
+                self._index[key] = disk_entry
+                continue
+
+            last_access = max(entry["Last Access"], disk_entry["Last Access"])
+            if disk_entry["Stored"] > entry["Stored"]:
+                entry = disk_entry
+                self._index[key] = entry
+            entry["Last Access"] = last_access
+
+        for key in [key for key in self._index if not self._body_path(key).exists()]:
+            del self._index[key]
+
+
+    def _save_index(self) -> None:
+        """
+        Merge with and write cache index to disk
+        """
+
+        self._load_index()
+        self._merge_index()
+
+        self._access_dirty = False
+        self._last_save    = time.time()
+
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path / f"{CACHE_INDEX}.tmp"
+            temp_path.write_bytes(plistlib.dumps(self._index))
+            temp_path.replace(self.cache_path / CACHE_INDEX)
+        except Exception as e:
+            logging.warning(f"Failed to save response cache index: {e}")
+
+
+    def _flush_access(self) -> None:
+        """
+        Persist access times from cache hits, if any
+        """
+
+        with self._lock:
+            if self._access_dirty:
+                self._save_index()
+
+
+    def _record_access(self, entry: dict) -> None:
+        """
+        Update entry's access time, persisting lazily
+        """
+
+        entry["Last Access"] = time.time()
+        self._access_dirty   = True
+
+        if not self._exit_registered:
+            atexit.register(self._flush_access)
+            self._exit_registered = True
+
+        if time.time() - self._last_save >= ACCESS_SAVE_INTERVAL:
+            self._save_index()
+
+
+    def _max_age(self, headers: CaseInsensitiveDict) -> int:
+        """
+        Parse max-age from Cache-Control header
+
+        Returns:
+            int: Seconds the response may be reused without revalidation, -1 if it must not be stored
+        """
+
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return -1
+        if "no-cache" in cache_control:
+            return 0
+
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        if max_age:
+            return int(max_age.group(1))
+        return 0
+
+
+    def _entry(self, url: str) -> dict:
+        """
+        Look up entry for URL, dropping entries whose body went missing
+        """
+
+        key = self._key(url)
+        entry = self._load_index().get(key)
+        if entry is None:
+            return None
+        if entry["URL"] != url or not self._body_path(key).exists():
+            self._remove(key)
+            return None
+        return entry
+
+
+    def _remove(self, key: str) -> None:
+        """
+        Remove entry and its body
+        """
+
+        self._load_index().pop(key, None)
+        body_path = self._body_path(key)
+        if body_path.exists():
+            body_path.unlink()
+
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits within max_size
+        """
+
+        index = self._load_index()
+        total_size = sum(entry["Size"] for entry in index.values())
+        for key, entry in sorted(index.items(), key=lambda x: x[1]["Last Access"]):
+            if total_size <= self.max_size:
+                break
+            logging.info(f"Evicting cached response: {entry['URL']}")
+            total_size -= entry["Size"]
+            self._remove(key)
+
+
+    def has_entry(self, url: str) -> bool:
+        """
+        Query whether a response is cached for URL
+        """
+
+        with self._lock:
+            return self._entry(url) is not None
+
+
+    def is_fresh(self, url: str) -> bool:
+        """
+        Query whether the cached response can be used without revalidation
+        """
+
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return False
+            return time.time() < entry["Stored"] + entry["Max Age"]
+
+
+    def conditional_headers(self, url: str) -> dict:
+        """
+        Generate headers to revalidate the cached response
+
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, empty if not cached
+        """
+
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return {}
+
+            headers = {}
+            if "ETag" in entry:
+                headers["If-None-Match"] = entry["ETag"]
+            if "Last-Modified" in entry:
+                headers["If-Modified-Since"] = entry["Last-Modified"]
+            return headers
+
+
+    def response(self, url: str) -> requests.Response:
+        """
+        Build a response object from the cached entry
+
+        Returns:
+            requests.Response: Cached response, None if not cached
+        """
+
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return None
+
+            key = self._key(url)
+            try:
+                content = self._body_path(key).read_bytes()
+            except Exception as e:
+                logging.warning(f"Failed to read cached response for {url}: {e}")
+                self._remove(key)
+                self._save_index()
+                return None
+
+            self._record_access(entry)
+
+        result = requests.Response()
+        result.url         = url
+        result.status_code = 200
+        result.headers     = CaseInsensitiveDict(entry["Headers"])
+        result._content    = content
+        return result
+
+
+    def revalidated(self, url: str, headers: CaseInsensitiveDict) -> None:
+        """
+        Refresh freshness of an entry after a 304 Not Modified response
+        """
+
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                return
+
+            max_age = self._max_age(headers)
+            entry["Stored"]  = time.time()
+            entry["Max Age"] = max(max_age, 0)
+            self._save_index()
+
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        Store a successful response
+        """
+
+        if response.status_code != 200:
+            return
+
+        max_age = self._max_age(response.headers)
+        if max_age < 0:
+            return
+
+        content = response.content
+        if content is None or len(content) > self.max_size:
+            return
+
+        with self._lock:
+            key = self._key(url)
+            entry = {
+                "URL":         url,
+                "Size":        len(content),
+                "Stored":      time.time(),
+                "Last Access": time.time(),
+                "Max Age":     max_age,
+                "Headers":     {k: v for k, v in response.headers.items() if k.lower() in ["content-type", "etag", "last-modified"]},
+            }
+            if "ETag" in response.headers:
+                entry["ETag"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                entry["Last-Modified"] = response.headers["Last-Modified"]
+
+            try:
+                self.cache_path.mkdir(parents=True, exist_ok=True)
+                temp_path = self._body_path(key).with_suffix(".tmp")
+                temp_path.write_bytes(content)
+                temp_path.replace(self._body_path(key))
+            except Exception as e:
+                logging.warning(f"Failed to cache response for {url}: {e}")
+                return
+
+            self._load_index()[key] = entry
+            self._evict()
+            self._save_index()
+
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses
+        """
+
+        with self._lock:
+            for key in list(self._load_index().keys()):
+                self._remove(key)
+            self._save_index()
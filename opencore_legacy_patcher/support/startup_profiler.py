@@ -0,0 +1,115 @@
+"""
+startup_profiler.py: Import-time profiling for patcher launch
+
+Equivalent to 'python3 -X importtime', though also usable from PyInstaller builds.
+Enabled by passing '--profile_startup', must be enabled before the rest of the patcher is imported.
+
+Usage:
+>>> startup_profiler.enable()
+>>> ...
+>>> logging.info(startup_profiler.report())
+"""
+
+import sys
+import time
+import threading
+import importlib.abc
+
+
+class _ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Times module execution by wrapping the loader of every spec found by the remaining finders
+    """
+
+    def __init__(self) -> None:
+        self.start:   float = time.perf_counter()
+        self.records: list  = []  # (module, depth, self time, cumulative time), in completion order
+        self._stack:  list  = []  # Time spent in nested imports, per depth
+
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            # Built-in and frozen importers are classes, thus shared by all modules
+            if spec.loader is not None and not isinstance(spec.loader, type):
+                self._wrap(spec.loader)
+            return spec
+        return None
+
+
+    def _wrap(self, loader) -> None:
+        if getattr(loader, "_startup_profiler_wrapped", False) is True:
+            return
+
+        exec_module = loader.exec_module
+
+        def _timed_exec_module(module):
+            if threading.current_thread() is not threading.main_thread():
+                return exec_module(module)
+
+            start = time.perf_counter()
+            self._stack.append(0)
+            try:
+                return exec_module(module)
+            finally:
+                cumulative = time.perf_counter() - start
+                nested = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += cumulative
+                self.records.append((module.__name__, len(self._stack), cumulative - nested, cumulative))
+
+        try:
+            loader.exec_module = _timed_exec_module
+            loader._startup_profiler_wrapped = True
+        except (AttributeError, TypeError):
+            pass
+
+
+_profiler: _ImportProfiler = None
+
+
+def enable() -> None:
+    """
+    Start recording imports
+    """
+    global _profiler
+    if _profiler is not None:
+        return
+    _profiler = _ImportProfiler()
+    sys.meta_path.insert(0, _profiler)
+
+
+def is_enabled() -> bool:
+    return _profiler is not None
+
+
+def report(limit: int = 25) -> str:
+    """
+    Generate import-time breakdown
+
+    Parameters:
+        limit (int): Number of slowest imports to summarize
+
+    Returns:
+        str: Full import tree (-X importtime format, microseconds), followed by the slowest imports
+    """
+
+    if _profiler is None:
+        return "Startup profiling not enabled"
+
+    records = list(_profiler.records)
+    lines = ["Startup import profile:", "import time: self [us] | cumulative | imported package"]
+    for module, depth, self_time, cumulative in records:
+        lines.append(f"import time: {int(self_time * 1000000):>9} | {int(cumulative * 1000000):>10} | {'  ' * depth}{module}")
+
+    lines.append(f"Slowest {limit} imports (cumulative):")
+    for module, _, self_time, cumulative in sorted(records, key=lambda x: x[3], reverse=True)[:limit]:
+        lines.append(f"  {cumulative * 1000:8.1f}ms ({self_time * 1000:6.1f}ms self) {module}")
+
+    lines.append(f"{len(records)} modules imported, {sum(x[3] for x in records if x[1] == 0) * 1000:.1f}ms in imports, {(time.perf_counter() - _profiler.start) * 1000:.1f}ms since profiling started")
+
+    return "\n".join(lines)
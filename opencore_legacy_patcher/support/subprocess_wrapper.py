@@ -3,8 +3,11 @@ subprocess_wrapper.py: Wrapper for subprocess module to better handle errors and
                        Additionally handles our Privileged Helper Tool
 """
 
+import re
 import enum
+import shlex
 import logging
+import secrets
 import subprocess
 
 from pathlib import Path
@@ -54,6 +57,183 @@ def run_as_root(*args, **kwargs) -> subprocess.CompletedProcess:
     return subprocess.run([OCLP_PRIVILEGED_HELPER] + [args[0][0]] + args[0][1:], **kwargs)
 
 
+class PrivilegedBatch:
+    """
+    Collect commands to run as root, reducing the number of Privileged Helper invocations.
+
+    Queued commands are run by a single '/bin/sh -c' invocation of the Privileged Helper.
+    The script is passed entirely as an argument, with every argument quoted, thus nothing
+    is read from disk once elevated. After each command, its exit status is reported on
+    stdout alongside a marker unique to the invocation, allowing output and status to be
+    attributed per command. Execution stops at the first failing command marked for
+    verification, matching sequential run_as_root_and_verify() calls.
+
+    Consecutive commands differing only by their trailing path (ie. chmod/chown/rm of
+    multiple files) are additionally combined into a single command.
+
+    Usage:
+        >>> batch = PrivilegedBatch()
+        >>> batch.add(["/bin/rm", "-R", "/path/to/file"])
+        >>> batch.add(["/usr/bin/rsync", "-r", "-i", "-a", "/source", "/destination/"], verify=False)
+        >>> batch.run_and_verify()
+
+    Parameters:
+        helper (str): Path to the Privileged Helper Tool, defaults to OCLP_PRIVILEGED_HELPER
+    """
+
+    # Commands accepting multiple trailing paths, with identical semantics to sequential invocations
+    COMBINABLE_COMMANDS: list = ["/bin/chmod", "/usr/sbin/chown", "/bin/rm", "/bin/mkdir"]
+    COMBINED_PATH_LIMIT: int  = 128
+
+    # Scripts exceeding this length are split across invocations, well below ARG_MAX (1 MiB on macOS)
+    SCRIPT_LENGTH_LIMIT: int  = 256 * 1024
+
+    def __init__(self, helper: str = None) -> None:
+        self.helper:     str  = helper
+        self.operations: list = []
+
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+
+    def add(self, args: list, verify: bool = True) -> None:
+        """
+        Queue command to run as root.
+
+        Note: Full path to first argument is required.
+        """
+        if not Path(args[0]).exists():
+            raise FileNotFoundError(f"File not found: {args[0]}")
+
+        self.operations.append(([str(arg) for arg in args], verify))
+
+
+    def _combine(self, operations: list) -> list:
+        """
+        Combine consecutive commands sharing all but their trailing path
+
+        Returns:
+            list: (args, verify) per command, in execution order
+        """
+        combined = []
+        for args, verify in operations:
+            if combined and args[0] in self.COMBINABLE_COMMANDS:
+                previous_args, previous_verify, prefix_length = combined[-1]
+                if (
+                    previous_verify == verify
+                    and prefix_length == len(args) - 1
+                    and previous_args[:prefix_length] == args[:-1]
+                    and len(previous_args) - prefix_length < self.COMBINED_PATH_LIMIT
+                ):
+                    previous_args.append(args[-1])
+                    continue
+            combined.append((list(args), verify, len(args) - 1))
+
+        return [(args, verify) for args, verify, _ in combined]
+
+
+    def _scripts(self, commands: list, marker: str) -> list:
+        """
+        Generate shell scripts running commands, split by SCRIPT_LENGTH_LIMIT
+
+        Returns:
+            list: (script, commands) per Privileged Helper invocation
+        """
+        scripts = []
+        lines   = []
+        length  = 0
+        current = []
+
+        for index, (args, verify) in enumerate(commands):
+            command_lines = [
+                shlex.join(args),
+                f"status=$?; printf '\\n{marker} {index} %d\\n' \"$status\"",
+            ]
+            if verify:
+                command_lines.append('[ "$status" -eq 0 ] || exit "$status"')
+            command_length = sum(len(line) + 1 for line in command_lines)
+
+            if current and length + command_length > self.SCRIPT_LENGTH_LIMIT:
+                scripts.append(("\n".join(lines), current))
+                lines, length, current = [], 0, []
+
+            lines += command_lines
+            length += command_length
+            current.append((args, verify))
+
+        if current:
+            scripts.append(("\n".join(lines), current))
+
+        return scripts
+
+
+    def _parse(self, process: subprocess.CompletedProcess, commands: list, marker: str) -> list:
+        """
+        Split a script invocation's output into per command results
+
+        Returns:
+            list: (CompletedProcess, verify) for each command reached
+        """
+        output  = process.stdout or b""
+        results = []
+        position = 0
+
+        for match in re.finditer(rb"\n" + marker.encode() + rb" (\d+) (\d+)\n", output):
+            args, verify = commands[len(results)]
+            results.append((subprocess.CompletedProcess(args, int(match.group(2)), output[position:match.start()]), verify))
+            position = match.end()
+
+        if process.returncode != 0 and len(results) < len(commands) and not (results and results[-1][1] and results[-1][0].returncode != 0):
+            # Helper or shell failed outside of a command (ie. Privileged Helper rejected the caller)
+            args, verify = commands[len(results)]
+            results.append((subprocess.CompletedProcess(args, process.returncode, output[position:]), True))
+
+        return results
+
+
+    def run(self) -> list:
+        """
+        Run queued commands, clearing the queue.
+
+        Returns:
+            list: (CompletedProcess, verify) for each command, commands not reached are omitted
+        """
+        operations = self.operations
+        self.operations = []
+        if not operations:
+            return []
+
+        commands = self._combine(operations)
+        marker   = f"OCLP-BATCH-{secrets.token_hex(8)}"
+        scripts  = self._scripts(commands, marker)
+        logging.info(f"Running {len(operations)} privileged operations in {len(scripts)} invocation{'s' if len(scripts) > 1 else ''}")
+
+        results = []
+        for script, script_commands in scripts:
+            process = subprocess.run(
+                [self.helper or OCLP_PRIVILEGED_HELPER, "/bin/sh", "-c", script, "oclp-batch"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            )
+            script_results = self._parse(process, script_commands, marker)
+            results += script_results
+            if any(verify and result.returncode != 0 for result, verify in script_results):
+                break
+
+        return results
+
+
+    def run_and_verify(self) -> None:
+        """
+        Run queued commands and verify results.
+
+        Asserts on first failure.
+        """
+        for result, should_verify in self.run():
+            if should_verify:
+                verify(result)
+
+
 def verify(process_result: subprocess.CompletedProcess) -> None:
     """
     Verify process result and raise exception if failed.
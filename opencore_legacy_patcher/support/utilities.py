@@ -603,16 +603,24 @@ def check_cli_args():
     parser.add_argument("--unpatch_sys_vol", help="Unpatches root volume, EXPERIMENTAL", action="store_true", required=False)
     parser.add_argument("--prepare_for_update", help="Prepares host for macOS update, ex. clean /Library/Extensions", action="store_true", required=False)
     parser.add_argument("--cache_os", help="Caches patcher files (ex. KDKs) for incoming OS in Preflight.plist", action="store_true", required=False)
+    parser.add_argument("--plan_sys_vol", action="store", help="Writes planned root volume patch operations to the provided JSON file, without patching", required=False)
 
     # validation args
     parser.add_argument("--validate", help="Runs Validation Tests for CI", action="store_true", required=False)
 
+    # sucatalog args
+    parser.add_argument("--sync_catalog_mirror", action="store", help="Snapshots the Software Update Catalog and installer metadata into the provided directory", required=False)
+    parser.add_argument("--set_catalog_mirror", action="store", help="Sets the catalog mirror (directory or URL) used by the macOS Installer download, pass an empty string to reset", required=False)
+
     # GUI args
     parser.add_argument("--gui_patch", help="Starts GUI in Root Patcher", action="store_true", required=False)
     parser.add_argument("--gui_unpatch", help="Starts GUI in Root Unpatcher", action="store_true", required=False)
     parser.add_argument("--auto_patch", help="Check if patches are needed and prompt user", action="store_true", required=False)
     parser.add_argument("--update_installed", help="Prompt user to finish updating via GUI", action="store_true", required=False)
 
+    # Profiling args
+    parser.add_argument("--profile_startup", "--profile-startup", help="Logs import-time breakdown of patcher launch", action="store_true", required=False)
+
     args = parser.parse_args()
     if not (
         args.build or
@@ -621,7 +629,10 @@ def check_cli_args():
         args.validate or
         args.auto_patch or
         args.prepare_for_update or
-        args.cache_os
+        args.cache_os or
+        args.plan_sys_vol or
+        args.sync_catalog_mirror or
+        args.set_catalog_mirror is not None
     ):
         return None
     else:
@@ -2,9 +2,12 @@
 validation.py: Validation class for the patcher
 """
 
+import copy
 import atexit
+import shutil
 import logging
 import subprocess
+import concurrent.futures
 
 from pathlib import Path
 
@@ -28,6 +31,68 @@ from ..sys_patch.patchsets import (
 )
 
 
+class _RecordCollector(logging.Handler):
+    """
+    Collects log records inside a worker process, for replay in the parent
+
+    Spawned workers have no logging configured, while forked workers would
+    write to the parent's handlers with concurrent builds interleaved
+    """
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format ahead of pickling, arguments may not be picklable
+        record.msg = self.format(record) if record.exc_info else record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        self.records.append(record)
+
+
+def _build_and_validate(global_constants: constants.Constants, model: str, build_path: Path) -> tuple:
+    """
+    Build and validate a single EFI inside an isolated build folder
+    Runs inside a worker process, thus global_constants is a private copy
+
+    Parameters:
+        global_constants (constants.Constants): Constants to build with
+        model            (str):  Model to build for
+        build_path       (Path): Build folder for this EFI
+
+    Returns:
+        tuple: (error output or None if validation succeeded, log records of the build)
+    """
+
+    global_constants.custom_build_path = build_path
+
+    root = logging.getLogger()
+    collector = _RecordCollector()
+    handlers, level = root.handlers[:], root.level
+    root.handlers = [collector]
+    root.setLevel(logging.INFO)
+
+    try:
+        try:
+            build.BuildOpenCore(model, global_constants)
+        except Exception as e:
+            logging.exception(f"Build failed for {model}")
+            return f"Build failed: {e}", collector.records
+
+        result = subprocess.run([global_constants.ocvalidate_path, f"{global_constants.opencore_release_folder}/EFI/OC/config.plist"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if result.returncode != 0:
+            return result.stdout.decode().strip(), collector.records
+
+        shutil.rmtree(build_path, ignore_errors=True)
+        return None, collector.records
+    finally:
+        root.handlers = handlers
+        root.setLevel(level)
+
+
 class PatcherValidation:
     """
     Validation class for the patcher
@@ -35,11 +100,16 @@ class PatcherValidation:
     Primarily for Continuous Integration
     """
 
-    def __init__(self, global_constants: constants.Constants, verify_unused_files: bool = False) -> None:
+    def __init__(self, global_constants: constants.Constants, verify_unused_files: bool = False, max_workers: int = None) -> None:
         self.constants: constants.Constants = global_constants
         self.verify_unused_files = verify_unused_files
+        self.max_workers = max_workers  # Concurrent EFI builds, defaults to CPU count
+        self._builds = []               # (description, future) for each queued EFI build
         self.active_patchset_files = []
 
+        # Source files already confirmed present, patchsets largely overlap between XNU versions
+        self._validated_files: set = set()
+
         self.constants.validate = True
 
         self.valid_dumps = [
@@ -76,43 +146,41 @@ class PatcherValidation:
         self._validate_sys_patch()
 
 
-    def _build_prebuilt(self) -> None:
+    def _submit_build(self, executor: concurrent.futures.Executor, model: str, description: str) -> tuple:
+        """
+        Queue an EFI build and validation with the current settings
+
+        Each build receives a snapshot of the constants and its own build folder,
+        allowing builds to run concurrently
+        """
+
+        build_path = self.constants.build_path / Path(f"Validation-{len(self._builds)}")
+        build_path.mkdir(parents=True, exist_ok=True)
+        future = executor.submit(_build_and_validate, copy.deepcopy(self.constants), model, build_path)
+        self._builds.append((description, future))
+
+
+    def _build_prebuilt(self, executor: concurrent.futures.Executor) -> None:
         """
         Generate a build for each predefined model
         Then validate against ocvalidate
         """
 
         for model in model_array.SupportedSMBIOS:
-            logging.info(f"Validating predefined model: {model}")
             self.constants.custom_model = model
-            build.BuildOpenCore(self.constants.custom_model, self.constants)
-            result = subprocess.run([self.constants.ocvalidate_path, f"{self.constants.opencore_release_folder}/EFI/OC/config.plist"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            if result.returncode != 0:
-                logging.info("Error on build!")
-                subprocess_wrapper.log(result)
-                raise Exception(f"Validation failed for predefined model: {model}")
-            else:
-                logging.info(f"Validation succeeded for predefined model: {model}")
+            self._submit_build(executor, model, f"predefined model: {model}")
 
 
-    def _build_dumps(self) -> None:
+    def _build_dumps(self, executor: concurrent.futures.Executor) -> None:
         """
-        Generate a build for each predefined model
+        Generate a build for each dumped model
         Then validate against ocvalidate
         """
 
         for model in self.valid_dumps:
             self.constants.computer = model
             self.constants.custom_model = ""
-            logging.info(f"Validating dumped model: {self.constants.computer.real_model}")
-            build.BuildOpenCore(self.constants.computer.real_model, self.constants)
-            result = subprocess.run([self.constants.ocvalidate_path, f"{self.constants.opencore_release_folder}/EFI/OC/config.plist"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            if result.returncode != 0:
-                logging.info("Error on build!")
-                subprocess_wrapper.log(result)
-                raise Exception(f"Validation failed for predefined model: {self.constants.computer.real_model}")
-            else:
-                logging.info(f"Validation succeeded for predefined model: {self.constants.computer.real_model}")
+            self._submit_build(executor, model.real_model, f"dumped model: {model.real_model}")
 
 
     def _validate_root_patch_files(self, major_kernel: int, minor_kernel: int) -> None:
@@ -154,12 +222,14 @@ class PatcherValidation:
                                     raise Exception(f"{install_file} used with {install_type}, are you certain this is correct?")
 
                             source_file = str(self.constants.payload_local_binaries_root_path) + "/" + patchset[patch_core][install_type][install_directory][install_file] + install_directory + "/" + install_file
+                            if source_file in self._validated_files:
+                                continue
                             if not Path(source_file).exists():
                                 logging.info(f"File not found: {source_file}")
                                 raise Exception(f"Failed to find {source_file}")
+                            self._validated_files.add(source_file)
                             if self.verify_unused_files is True:
-                                if source_file not in self.active_patchset_files:
-                                    self.active_patchset_files.append(source_file)
+                                self.active_patchset_files.append(source_file)
 
         logging.info(f"Validating against Darwin {major_kernel}.{minor_kernel}")
         if not sys_patch_helpers.SysPatchHelpers(self.constants).generate_patchset_plist(patchset, f"OpenCore-Legacy-Patcher-{major_kernel}.{minor_kernel}.plist", None, None):
@@ -314,11 +384,17 @@ class PatcherValidation:
     def _validate_configs(self) -> None:
         """
         Validates build modules
+
+        Builds run concurrently, failures are collected and reported together
         """
 
+        self._builds = []
+
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+
         # First run is with default settings
-        self._build_prebuilt()
-        self._build_dumps()
+        self._build_prebuilt(executor)
+        self._build_dumps(executor)
 
         # Second run, flip all settings
         self.constants.verbose_debug = True
@@ -337,7 +413,28 @@ class PatcherValidation:
         self.constants.software_demux = True
         self.constants.serial_settings = "Minimal"
 
-        self._build_prebuilt()
-        self._build_dumps()
+        self._build_prebuilt(executor)
+        self._build_dumps(executor)
+
+        # Results are collected in submission order, thus each build's log is replayed in model order
+        failures = []
+        for description, future in self._builds:
+            try:
+                error, records = future.result()
+            except Exception as e:
+                error, records = f"Worker failed: {e}", []
+            logging.info(f"Build log for {description}:")
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+            if error is None:
+                logging.info(f"Validation succeeded for {description}")
+                continue
+            logging.info(f"Validation failed for {description}")
+            failures.append(f"{description}\n{error}")
+
+        executor.shutdown()
+
+        subprocess.run(["/bin/rm", "-rf", self.constants.build_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
-        subprocess.run(["/bin/rm", "-rf", self.constants.build_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
\ No newline at end of file
+        if failures:
+            raise Exception(f"Validation failed for {len(failures)} of {len(self._builds)} builds:\n\n" + "\n\n".join(failures))
\ No newline at end of file
@@ -14,4 +14,11 @@ Usage:
 """
 
 from .install import InstallAutomaticPatchingServices
-from .start   import StartAutomaticPatching
\ No newline at end of file
+
+
+def __getattr__(name: str):
+    # StartAutomaticPatching requires wxPython, only import once requested (ie. not when root patching from CLI)
+    if name == "StartAutomaticPatching":
+        from .start import StartAutomaticPatching
+        return StartAutomaticPatching
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,4 +8,5 @@ Usage:
 """
 
 from .rebuild import RebuildKernelCache
+from .fingerprint import KernelCacheFingerprint
 from .kernel_collection.support import KernelCacheSupport
\ No newline at end of file
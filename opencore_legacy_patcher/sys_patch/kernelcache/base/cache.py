@@ -4,5 +4,17 @@ cache.py: Base class for kernel cache management
 
 class BaseKernelCache:
 
+    # Whether a previous rebuild may be reused when its inputs are unchanged, see fingerprint.py
+    # Caches that are cheap to rebuild, or whose rebuild has side effects beyond the cache itself, should not opt in
+    reusable: bool = False
+
+
+    def collection_paths(self) -> list[str]:
+        """
+        Cache files produced by rebuild()
+        """
+        return []
+
+
     def rebuild(self) -> None:
         raise NotImplementedError("To be implemented in subclass")
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+fingerprint.py: Kernel cache input fingerprinting
+
+Rebuilding the kernel cache (kmutil/kextcache) is the slowest step of root patching,
+yet its inputs are often unchanged between runs (ie. reapplying identical patches).
+
+Inputs (kext bundles, KDK and rebuild parameters) are fingerprinted, and recorded
+alongside the produced cache files in OpenCore-Legacy-Patcher.plist. A rebuild may
+be skipped when the fingerprint matches and the recorded cache files are untouched.
+
+Operates purely on the filesystem, thus can be exercised against fake trees.
+
+Usage:
+>>> fingerprint = KernelCacheFingerprint(mount_location, mount_location_data, parameters)
+>>> if fingerprint.matches(previous_metadata, collection_paths):
+...     # Skip rebuild
+>>> metadata = fingerprint.metadata(collection_paths)  # After a successful rebuild
+"""
+
+import os
+import stat
+import hashlib
+
+from pathlib import Path
+
+
+FINGERPRINT_VERSION: int = 1
+
+
+class KernelCacheFingerprint:
+    """
+    Parameters:
+        mount_location      (str):  Root volume mount point
+        mount_location_data (str):  Data volume mount point
+        parameters          (dict): Additional inputs affecting the rebuild (ie. OS build, KDK, kmutil arguments)
+    """
+
+    def __init__(self, mount_location: str, mount_location_data: str, parameters: dict = None) -> None:
+        self.mount_location      = str(mount_location)
+        self.mount_location_data = str(mount_location_data)
+        self.parameters          = parameters or {}
+
+        self._fingerprint: str = None
+
+
+    def _extension_directories(self) -> list:
+        return [
+            f"{self.mount_location}/System/Library/Extensions",
+            f"{self.mount_location_data}/Library/Extensions",
+        ]
+
+
+    def _hash_tree(self, hasher, root: str, relative: str) -> None:
+        """
+        Add every file within root (ie. kext bundle including PlugIns), with type, size and modification time
+        """
+
+        pending = [""]
+        while pending:
+            current = pending.pop()
+            with os.scandir(os.path.join(root, current)) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+            for entry in entries:
+                entry_relative = os.path.join(current, entry.name) if current else entry.name
+                entry_stat = entry.stat(follow_symlinks=False)
+                if stat.S_ISDIR(entry_stat.st_mode):
+                    pending.append(entry_relative)
+                    continue
+                hasher.update(f"{relative}/{entry_relative}\0{stat.S_IFMT(entry_stat.st_mode)}\0{entry_stat.st_size}\0{entry_stat.st_mtime_ns}\n".encode())
+
+
+    def _hash_directory(self, hasher, directory: str) -> None:
+        if not Path(directory).is_dir():
+            hasher.update(f"{directory}\0missing\n".encode())
+            return
+
+        with os.scandir(directory) as iterator:
+            kexts = sorted(entry.name for entry in iterator if entry.name.endswith(".kext") and entry.is_dir(follow_symlinks=False))
+
+        hasher.update(f"{directory}\0{len(kexts)}\n".encode())
+        for kext in kexts:
+            self._hash_tree(hasher, os.path.join(directory, kext), kext)
+
+
+    def fingerprint(self) -> str:
+        """
+        Generate fingerprint of the kernel cache inputs
+
+        Returns:
+            str: SHA-256 of kext bundle and kernel contents (path, type, size, modification time) and parameters
+        """
+
+        if self._fingerprint is not None:
+            return self._fingerprint
+
+        hasher = hashlib.sha256(f"{FINGERPRINT_VERSION}\n".encode())
+        for key in sorted(self.parameters):
+            hasher.update(f"{key}\0{self.parameters[key]}\n".encode())
+        for directory in self._extension_directories():
+            self._hash_directory(hasher, directory)
+
+        kernels = f"{self.mount_location}/System/Library/Kernels"
+        if Path(kernels).is_dir():
+            self._hash_tree(hasher, kernels, "Kernels")
+
+        self._fingerprint = hasher.hexdigest()
+        return self._fingerprint
+
+
+    def _collection_state(self, collection_paths: list) -> dict:
+        state = {}
+        for path in collection_paths:
+            try:
+                path_stat = os.stat(path)
+            except OSError:
+                continue
+            state[path] = {"Size": path_stat.st_size, "Modified": path_stat.st_mtime_ns}
+        return state
+
+
+    def metadata(self, collection_paths: list) -> dict:
+        """
+        Generate metadata to record after a successful rebuild
+
+        Parameters:
+            collection_paths (list): Cache files produced by the rebuild
+
+        Returns:
+            dict: Fingerprint and state of the produced cache files
+        """
+        return {
+            "Fingerprint": self.fingerprint(),
+            "Collections": self._collection_state(collection_paths),
+        }
+
+
+    def matches(self, previous: dict, collection_paths: list) -> bool:
+        """
+        Check whether a previous rebuild's output can be reused
+
+        Parameters:
+            previous         (dict): Metadata recorded by the previous rebuild, see metadata()
+            collection_paths (list): Cache files the rebuild would produce
+
+        Returns:
+            bool: True if inputs are unchanged and all cache files are present and untouched
+        """
+
+        if not isinstance(previous, dict) or not collection_paths:
+            return False
+        if previous.get("Fingerprint") != self.fingerprint():
+            return False
+
+        recorded = previous.get("Collections", {})
+        if sorted(recorded) != sorted(collection_paths):
+            return False
+
+        return self._collection_state(collection_paths) == recorded
@@ -49,6 +49,19 @@ class BootSystemKernelCollections(BaseKernelCache):
         return args
 
 
+    @property
+    def reusable(self) -> bool:
+        # Auxiliary KC builds require user approval, always rebuild
+        return self.auxiliary_kc is False
+
+
+    def collection_paths(self) -> list[str]:
+        return [
+            f"{self.mount_location}/System/Library/KernelCollections/BootKernelExtensions.kc",
+            f"{self.mount_location}/System/Library/KernelCollections/SystemKernelExtensions.kc",
+        ]
+
+
     def rebuild(self) -> bool:
         logging.info(f"- Rebuilding {'Boot and System' if self.auxiliary_kc is False else 'Boot, System and Auxiliary'} Kernel Collections")
         if self.auxiliary_kc is True:
@@ -54,6 +54,32 @@ class KernelCacheSupport:
         return True
 
 
+    def resolve_auxkc_destination(self, install_file: str, install_patch_directory: str, destination_folder_path: str) -> str:
+        """
+        Determine whether a kext will be installed to the Auxiliary Kernel Collection
+        Does not modify the kext, see add_auxkc_support()
+
+        Parameters:
+            install_file            (str): Kext file name
+            install_patch_directory (str): Patch directory
+            destination_folder_path (str): Destination folder path
+
+        Returns:
+            str: Updated destination folder path
+        """
+
+        if self.skip_root_kmutil_requirement is False:
+            return destination_folder_path
+        if not install_file.endswith(".kext"):
+            return destination_folder_path
+        if install_patch_directory != "/System/Library/Extensions":
+            return destination_folder_path
+        if self.detected_os < os_data.os_data.ventura:
+            return destination_folder_path
+
+        return str(self.mount_location_data) + "/Library/Extensions"
+
+
     def add_auxkc_support(self, install_file: str, source_folder_path: str, install_patch_directory: str, destination_folder_path: str) -> str:
         """
         Patch provided Kext to support Auxiliary Kernel Collection
@@ -79,16 +105,23 @@ class KernelCacheSupport:
             str: Updated destination folder path
         """
 
-        if self.skip_root_kmutil_requirement is False:
-            return destination_folder_path
-        if not install_file.endswith(".kext"):
-            return destination_folder_path
-        if install_patch_directory != "/System/Library/Extensions":
-            return destination_folder_path
-        if self.detected_os < os_data.os_data.ventura:
+        updated_install_location = self.resolve_auxkc_destination(install_file, install_patch_directory, destination_folder_path)
+        if updated_install_location == destination_folder_path:
             return destination_folder_path
 
-        updated_install_location = str(self.mount_location_data) + "/Library/Extensions"
+        self.patch_kext_for_auxkc(install_file, source_folder_path)
+
+        return updated_install_location
+
+
+    def patch_kext_for_auxkc(self, install_file: str, source_folder_path: str) -> None:
+        """
+        Set kext's 'OSBundleRequired' to 'Auxiliary', if required for AuxKC installation
+
+        Parameters:
+            install_file       (str): Kext file name
+            source_folder_path (str): Source folder path
+        """
 
         logging.info(f"  - Adding AuxKC support to {install_file}")
         plist_path = Path(Path(source_folder_path) / Path(install_file) / Path("Contents/Info.plist"))
@@ -96,16 +129,14 @@ class KernelCacheSupport:
 
         # Check if we need to update the 'OSBundleRequired' entry
         if not plist_data["CFBundleIdentifier"].startswith("com.apple."):
-            return updated_install_location
+            return
         if "OSBundleRequired" in plist_data:
             if plist_data["OSBundleRequired"] == "Auxiliary":
-                return updated_install_location
+                return
 
         plist_data["OSBundleRequired"] = "Auxiliary"
         plistlib.dump(plist_data, plist_path.open("wb"))
 
-        return updated_install_location
-
 
     def clean_auxiliary_kc(self) -> None:
         """
@@ -13,10 +13,24 @@ from ....support import subprocess_wrapper
 
 class PrelinkedKernel(BaseKernelCache):
 
+    reusable: bool = True
+
+
     def __init__(self, mount_location: str) -> None:
         self.mount_location = mount_location
 
 
+    def collection_paths(self) -> list[str]:
+        # 10.11 and newer use PrelinkedKernels, older releases use the kext cache folder
+        return [
+            path for path in [
+                f"{self.mount_location}/System/Library/PrelinkedKernels/prelinkedkernel",
+                f"{self.mount_location}/System/Library/Caches/com.apple.kext.caches/Startup/kernelcache",
+            ]
+            if Path(path).exists()
+        ]
+
+
     def _kextcache_arguments(self) -> list[str]:
         args = ["/usr/sbin/kextcache", "-invalidate", f"{self.mount_location}/"]
         return args
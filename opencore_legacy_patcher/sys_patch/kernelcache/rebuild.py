@@ -2,8 +2,11 @@
 rebuild.py: Manage kernel cache rebuilding regardless of macOS version
 """
 
-from .base.cache import BaseKernelCache
-from ...datasets import os_data
+import logging
+
+from .base.cache   import BaseKernelCache
+from .fingerprint import KernelCacheFingerprint
+from ...datasets  import os_data
 
 
 class RebuildKernelCache:
@@ -15,12 +18,22 @@ class RebuildKernelCache:
     - mount_location: Path to the mounted volume
     - auxiliary_cache: Whether to create auxiliary kernel cache (Big Sur and later)
     - auxiliary_cache_only: Whether to only create auxiliary kernel cache (Ventura and later)
+    - mount_location_data: Path to the data volume
+    - fingerprint_parameters: Additional rebuild inputs (ie. OS build, KDK), see fingerprint.py
+    - previous_fingerprint: Metadata recorded by the previous rebuild, rebuild is skipped if inputs are unchanged
+
+    After a successful rebuild, 'fingerprint' holds the metadata to record for future runs (None if not applicable)
     """
-    def __init__(self, os_version: os_data.os_data, mount_location: str, auxiliary_cache: bool, auxiliary_cache_only: bool) -> None:
+    def __init__(self, os_version: os_data.os_data, mount_location: str, auxiliary_cache: bool, auxiliary_cache_only: bool, mount_location_data: str = "", fingerprint_parameters: dict = None, previous_fingerprint: dict = None) -> None:
         self.os_version = os_version
         self.mount_location = mount_location
         self.auxiliary_cache = auxiliary_cache
         self.auxiliary_cache_only = auxiliary_cache_only
+        self.mount_location_data = mount_location_data
+        self.fingerprint_parameters = fingerprint_parameters or {}
+        self.previous_fingerprint = previous_fingerprint
+
+        self.fingerprint: dict = None
 
 
     def _rebuild_method(self) -> BaseKernelCache:
@@ -46,6 +59,31 @@ class RebuildKernelCache:
 
     def rebuild(self) -> bool:
         """
-        Rebuild the kernel cache
+        Rebuild the kernel cache, unless the previous rebuild's inputs are unchanged
         """
-        return self._rebuild_method().rebuild()
\ No newline at end of file
+        method = self._rebuild_method()
+        if method.reusable is False:
+            return method.rebuild()
+
+        fingerprint = KernelCacheFingerprint(
+            self.mount_location,
+            self.mount_location_data,
+            {
+                "OS Version": self.os_version,
+                "Rebuild Method": type(method).__name__,
+                "Auxiliary Cache": self.auxiliary_cache,
+                "Auxiliary Cache Only": self.auxiliary_cache_only,
+                **self.fingerprint_parameters,
+            }
+        )
+
+        if fingerprint.matches(self.previous_fingerprint, method.collection_paths()):
+            logging.info("- Kernel cache inputs unchanged since last rebuild, skipping")
+            self.fingerprint = self.previous_fingerprint
+            return True
+
+        if method.rebuild() is False:
+            return False
+
+        self.fingerprint = fingerprint.metadata(method.collection_paths())
+        return True
\ No newline at end of file
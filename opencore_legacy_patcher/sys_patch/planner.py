@@ -0,0 +1,298 @@
+"""
+planner.py: Generate an ordered operation plan for root volume patching
+
+Flattens the nested patchset dictionary (from HardwarePatchsetDetection) into
+a list of typed operations with resolved source and destination paths.
+All filesystem checks are performed once during planning, allowing the
+executor to simply consume the plan.
+
+Plans can be serialized to JSON, ie. for comparing patch runs across machines:
+
+>>> from sys_patch.planner import PatchPlanner
+>>> plan = PatchPlanner(mount_location, mount_location_data, source_files_path, kc_support_obj).plan(patches)
+>>> Path("plan.json").write_text(plan.to_json())
+"""
+
+import copy
+import json
+import logging
+
+from enum        import StrEnum
+from pathlib     import Path
+from dataclasses import dataclass, asdict, field
+from typing      import Callable, Optional
+
+from .patchsets import PatchType, DynamicPatchset
+from .kernelcache import KernelCacheSupport
+
+
+class PatchOperationType(StrEnum):
+    """
+    Type of operation to perform
+    """
+    REMOVE  = "Remove"
+    COPY    = "Copy"
+    MERGE   = "Merge"
+    EXECUTE = "Execute"
+
+
+@dataclass
+class PatchOperation:
+    patchset:    str
+    type:        PatchOperationType
+    file_name:   Optional[str] = None
+    source:      Optional[str] = None   # Folder containing file_name
+    destination: Optional[str] = None   # Folder to install/remove file_name in
+    directory:   bool = False           # Whether file_name is a directory (ie. .kext, .framework)
+    replace:     bool = False           # Whether file_name already exists in destination (replaced, or merged with)
+    auxkc:       bool = False           # Whether kext must be patched for the Auxiliary KC before copying
+    command:     Optional[str] = None   # EXECUTE only
+    as_root:     bool = False           # EXECUTE only
+
+    @property
+    def source_path(self) -> str:
+        return f"{self.source}/{self.file_name}"
+
+    @property
+    def destination_path(self) -> str:
+        return f"{self.destination}/{self.file_name}"
+
+
+@dataclass
+class PatchPlan:
+    operations:                list[PatchOperation] = field(default_factory=list)
+    patchset:                  dict = field(default_factory=dict)   # Patchset with resolved sources and destinations, for OpenCore-Legacy-Patcher.plist
+    needs_kmutil_exemptions:   bool = False
+    needs_to_open_preferences: bool = False
+
+
+    def to_json(self) -> str:
+        """
+        Serialize plan to JSON
+        """
+        return json.dumps(
+            {
+                "Needs kmutil Exemptions":   self.needs_kmutil_exemptions,
+                "Needs to Open Preferences": self.needs_to_open_preferences,
+                "Operations":                [{k: v for k, v in asdict(operation).items() if v is not None} for operation in self.operations],
+            },
+            indent=4
+        )
+
+
+class PatchPlanner:
+    """
+    Parameters:
+        mount_location      (str): Root volume mount point
+        mount_location_data (str): Data volume mount point
+        source_files_path   (str): Path to PatcherSupportPkg's Universal-Binaries
+        kc_support_obj      (KernelCacheSupport): Kernel Collection support object, for AuxKC handling
+        dynamic_resolver    (Callable): Resolves DynamicPatchset entries to a path, left unresolved if None
+    """
+
+    def __init__(self, mount_location: str, mount_location_data: str, source_files_path: str, kc_support_obj: KernelCacheSupport, dynamic_resolver: Callable = None) -> None:
+        self.mount_location      = str(mount_location)
+        self.mount_location_data = str(mount_location_data)
+        self.source_files_path   = str(source_files_path)
+        self.kc_support_obj      = kc_support_obj
+        self.dynamic_resolver    = dynamic_resolver
+
+        self._exists_cache: dict = {}
+        self._created:      set  = set()
+        self._removed:      set  = set()
+
+
+    def _exists(self, path: str) -> bool:
+        """
+        Check whether path exists, accounting for operations already planned
+        """
+
+        for parent in [path, *[str(x) for x in Path(path).parents]]:
+            if parent in self._removed:
+                return False
+            if parent in self._created:
+                return True
+
+        if path not in self._exists_cache:
+            self._exists_cache[path] = Path(path).exists()
+        return self._exists_cache[path]
+
+
+    def _mark_created(self, path: str) -> None:
+        self._removed.discard(path)
+        self._created.add(path)
+
+
+    def _mark_removed(self, path: str) -> None:
+        self._created.discard(path)
+        self._removed.add(path)
+
+
+    def _is_dynamic(self, source: str) -> bool:
+        """
+        Check whether source is a DynamicPatchset entry
+        """
+        try:
+            return source in DynamicPatchset
+        except TypeError:
+            return False
+
+
+    def _resolve_source(self, source: str) -> str:
+        """
+        Resolve DynamicPatchset entries, if possible
+        """
+        if self._is_dynamic(source) and self.dynamic_resolver is not None:
+            return self.dynamic_resolver(source)
+        return source
+
+
+    def _source_folder(self, source: str, install_patch_directory: str) -> str:
+        """
+        Generate source folder path, sourcing from PatcherSupportPkg unless absolute (or unresolved)
+        """
+        source_folder = source + install_patch_directory
+        if not source.startswith("/") and not self._is_dynamic(source):
+            source_folder = self.source_files_path + "/" + source_folder
+        return source_folder
+
+
+    def resolve_sources(self, required_patches: dict) -> dict:
+        """
+        Resolve dynamic patchsets and verify all source files are present
+
+        Parameters:
+            required_patches (dict): Patchset dictionary (from HardwarePatchsetDetection)
+
+        Returns:
+            dict: Copy of the patchset with dynamic patchsets resolved
+        """
+
+        required_patches = copy.deepcopy(required_patches)
+
+        for patch in required_patches:
+            for method_type in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.OVERWRITE_DATA_VOLUME, PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]:
+                if method_type not in required_patches[patch]:
+                    continue
+                for install_patch_directory in required_patches[patch][method_type]:
+                    for install_file in required_patches[patch][method_type][install_patch_directory]:
+                        source = self._resolve_source(required_patches[patch][method_type][install_patch_directory][install_file])
+                        required_patches[patch][method_type][install_patch_directory][install_file] = source
+                        if self._is_dynamic(source):
+                            # Unresolved, only permitted when no resolver is provided
+                            continue
+
+                        source_file = self._source_folder(source, install_patch_directory) + "/" + install_file
+                        if not self._exists(source_file):
+                            raise Exception(f"Failed to find {source_file}")
+
+        return required_patches
+
+
+    def _plan_removals(self, plan: PatchPlan, patch: str, removals: dict, method: PatchType) -> None:
+        for remove_patch_directory in removals:
+            if method == PatchType.REMOVE_SYSTEM_VOLUME:
+                destination_folder_path = self.mount_location + remove_patch_directory
+            else:
+                destination_folder_path = self.mount_location_data + remove_patch_directory
+
+            for remove_patch_file in removals[remove_patch_directory]:
+                destination_path = f"{destination_folder_path}/{remove_patch_file}"
+                if not self._exists(destination_path):
+                    continue
+                plan.operations.append(PatchOperation(
+                    patchset=patch,
+                    type=PatchOperationType.REMOVE,
+                    file_name=remove_patch_file,
+                    destination=destination_folder_path,
+                    directory=Path(destination_path).is_dir(),
+                ))
+                self._mark_removed(destination_path)
+
+
+    def _plan_installs(self, plan: PatchPlan, patch: str, installs: dict, method: PatchType) -> dict:
+        """
+        Returns:
+            dict: Installs keyed by final destination directory (ie. after AuxKC relocation)
+        """
+
+        resolved_installs = {install_patch_directory: {} for install_patch_directory in installs}
+
+        for install_patch_directory in installs:
+            for install_file, source in installs[install_patch_directory].items():
+                source_folder_path = self._source_folder(source, install_patch_directory)
+                directory = Path(source_folder_path + "/" + install_file).is_dir()
+
+                if method in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.MERGE_SYSTEM_VOLUME]:
+                    destination_folder_path = self.mount_location + install_patch_directory
+                else:
+                    if install_patch_directory == "/Library/Extensions":
+                        plan.needs_kmutil_exemptions = True
+                        if self.kc_support_obj.check_kexts_needs_authentication(install_file) is True:
+                            plan.needs_to_open_preferences = True
+                    destination_folder_path = self.mount_location_data + install_patch_directory
+
+                auxkc = False
+                updated_destination_folder_path = self.kc_support_obj.resolve_auxkc_destination(install_file, install_patch_directory, destination_folder_path)
+                if updated_destination_folder_path != destination_folder_path:
+                    auxkc = True
+                    if self.kc_support_obj.check_kexts_needs_authentication(install_file) is True:
+                        plan.needs_to_open_preferences = True
+                    destination_folder_path = updated_destination_folder_path
+
+                resolved_installs.setdefault(destination_folder_path if auxkc else install_patch_directory, {})[install_file] = source
+
+                if not self._exists(destination_folder_path):
+                    logging.info(f"  - Skipping {install_file}, cannot locate {destination_folder_path}")
+                    continue
+
+                destination_path = f"{destination_folder_path}/{install_file}"
+                merge = method in [PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]
+                plan.operations.append(PatchOperation(
+                    patchset=patch,
+                    type=PatchOperationType.MERGE if merge else PatchOperationType.COPY,
+                    file_name=install_file,
+                    source=source_folder_path,
+                    destination=destination_folder_path,
+                    directory=directory,
+                    replace=self._exists(destination_path),
+                    auxkc=auxkc,
+                ))
+                self._mark_created(destination_path)
+
+        return resolved_installs
+
+
+    def plan(self, required_patches: dict) -> PatchPlan:
+        """
+        Generate operation plan
+
+        Parameters:
+            required_patches (dict): Patchset dictionary (from HardwarePatchsetDetection)
+
+        Returns:
+            PatchPlan: Ordered operations, matching the patchset's order
+        """
+
+        required_patches = self.resolve_sources(required_patches)
+        plan = PatchPlan(patchset=required_patches)
+
+        for patch in required_patches:
+            for method_remove in [PatchType.REMOVE_SYSTEM_VOLUME, PatchType.REMOVE_DATA_VOLUME]:
+                if method_remove in required_patches[patch]:
+                    self._plan_removals(plan, patch, required_patches[patch][method_remove], method_remove)
+
+            for method_install in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.OVERWRITE_DATA_VOLUME, PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]:
+                if method_install in required_patches[patch]:
+                    required_patches[patch][method_install] = self._plan_installs(plan, patch, required_patches[patch][method_install], method_install)
+
+            if PatchType.EXECUTE in required_patches[patch]:
+                for process, as_root in required_patches[patch][PatchType.EXECUTE].items():
+                    plan.operations.append(PatchOperation(
+                        patchset=patch,
+                        type=PatchOperationType.EXECUTE,
+                        command=process,
+                        as_root=as_root is True,
+                    ))
+
+        return plan
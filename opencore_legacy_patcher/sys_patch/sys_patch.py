@@ -37,7 +37,9 @@ This is because Apple removed on-disk binaries (ref: https://github.com/dortania
 
 import logging
 import plistlib
+import threading
 import subprocess
+import concurrent.futures
 
 from pathlib   import Path
 from functools import cache
@@ -47,11 +49,15 @@ from .mount import (
     APFSSnapshot
 )
 from .utilities import (
-    install_new_file,
-    remove_file,
+    execute_operation,
     PatcherSupportPkgMount,
     KernelDebugKitMerge
 )
+from .planner import (
+    PatchPlanner,
+    PatchPlan,
+    PatchOperationType
+)
 
 from .. import constants
 
@@ -68,7 +74,6 @@ from ..support import (
 from .patchsets import (
     HardwarePatchsetDetection,
     HardwarePatchsetSettings,
-    PatchType,
     DynamicPatchset
 )
 from . import (
@@ -90,6 +95,17 @@ class PatchSysVolume:
         self.needs_kmutil_exemptions = False # For '/Library/Extensions' rebuilds
         self.kdk_path = None
         self.metallib_path = None
+        self.patchset = None
+        self.kernel_cache_fingerprint = None
+        self.previous_kernel_cache_fingerprint = None
+
+        # Background resolution of KDK and MetallibSupportPkg, see _start_resource_resolution()
+        self._resource_executor:  concurrent.futures.ThreadPoolExecutor = None
+        self._resource_futures:   dict = {}
+        self._resource_cancelled: threading.Event = threading.Event()
+        self._kdk_merge_obj:      KernelDebugKitMerge = None
+        self._metallib_download = None
+        self._install_lock:       threading.Lock = threading.Lock()  # Held while installing packages or attaching disk images
 
         # GUI will detect hardware patches before starting PatchSysVolume()
         # However the TUI will not, so allow for data to be passed in manually avoiding multiple calls
@@ -174,8 +190,9 @@ class PatchSysVolume:
         self.kdk_path = KernelDebugKitMerge(
             self.constants,
             self.mount_location,
-            self.skip_root_kmutil_requirement
-        ).merge(save_hid_cs)
+            self.skip_root_kmutil_requirement,
+            install_lock=self._install_lock
+        ).merge(save_hid_cs, kdk_path=self._await_resource("KDK"))
 
 
     def _unpatch_root_vol(self):
@@ -189,11 +206,7 @@ class PatchSysVolume:
         self._clean_skylight_plugins()
         self._delete_nonmetal_enforcement()
 
-        kernelcache.KernelCacheSupport(
-            mount_location_data=self.mount_location_data,
-            detected_os=self.constants.detected_os,
-            skip_root_kmutil_requirement=self.skip_root_kmutil_requirement
-        ).clean_auxiliary_kc()
+        self._kc_support().clean_auxiliary_kc()
 
         self.constants.root_patcher_succeeded = True
         logging.info("- Unpatching complete")
@@ -214,6 +227,10 @@ class PatchSysVolume:
         if self._rebuild_kernel_cache() is False:
             return False
 
+        # Record the new fingerprint, _execute_patchset() wrote the patchset without one
+        if self.patchset is not None and self.kernel_cache_fingerprint is not None:
+            self._write_patchset(self.patchset)
+
         self._update_preboot_kernel_cache()
         self._rebuild_dyld_shared_cache()
 
@@ -238,22 +255,54 @@ class PatchSysVolume:
         Rebuilds the Kernel Cache
         """
 
-        result =  kernelcache.RebuildKernelCache(
+        rebuild_obj = kernelcache.RebuildKernelCache(
             os_version=self.constants.detected_os,
             mount_location=self.mount_location,
             auxiliary_cache=self.needs_kmutil_exemptions,
-            auxiliary_cache_only=self.skip_root_kmutil_requirement
-        ).rebuild()
+            auxiliary_cache_only=self.skip_root_kmutil_requirement,
+            mount_location_data=self.mount_location_data,
+            fingerprint_parameters={
+                "OS Build": self.constants.detected_os_build,
+                "Kernel Debug Kit": self._kdk_fingerprint(),
+            },
+            previous_fingerprint=self.previous_kernel_cache_fingerprint,
+        )
 
-        if result is False:
+        if rebuild_obj.rebuild() is False:
             return False
 
+        self.kernel_cache_fingerprint = rebuild_obj.fingerprint
+
         if self.skip_root_kmutil_requirement is False:
             sys_patch_helpers.SysPatchHelpers(self.constants).install_rsr_repair_binary()
 
         return True
 
 
+    def _kdk_fingerprint(self) -> str:
+        """
+        Identify the KDK used for the kernel cache rebuild, if any
+        """
+        if not self.kdk_path or not Path(self.kdk_path).exists():
+            return "Not applicable"
+        return f"{self.kdk_path} ({Path(self.kdk_path).stat().st_mtime_ns})"
+
+
+    def _previous_kernel_cache_fingerprint(self) -> dict:
+        """
+        Kernel cache fingerprint recorded by the previous root patch, if any
+        """
+        patchset_file = Path(f"{self.mount_location}/System/Library/CoreServices/OpenCore-Legacy-Patcher.plist")
+        if not patchset_file.exists():
+            return None
+
+        try:
+            return plistlib.load(patchset_file.open("rb")).get("Kernel Cache Fingerprint")
+        except Exception as e:
+            logging.info(f"- Failed to read previous patchset information: {e}")
+            return None
+
+
     def _create_new_apfs_snapshot(self) -> bool:
         """
         Creates a new APFS snapshot of the root volume
@@ -325,7 +374,7 @@ class PatchSysVolume:
         destination_path = f"{self.mount_location}/System/Library/CoreServices"
         file_name = "OpenCore-Legacy-Patcher.plist"
         destination_path_file = f"{destination_path}/{file_name}"
-        if sys_patch_helpers.SysPatchHelpers(self.constants).generate_patchset_plist(patchset, file_name, self.kdk_path, self.metallib_path):
+        if sys_patch_helpers.SysPatchHelpers(self.constants).generate_patchset_plist(patchset, file_name, self.kdk_path, self.metallib_path, self.kernel_cache_fingerprint):
             logging.info("- Writing patchset information to Root Volume")
             if Path(destination_path_file).exists():
                 subprocess_wrapper.run_as_root_and_verify(["/bin/rm", destination_path_file], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
@@ -352,6 +401,30 @@ class PatchSysVolume:
         self._rebuild_root_volume()
 
 
+    def _kc_support(self) -> kernelcache.KernelCacheSupport:
+        """
+        Kernel Collection support object for the current configuration
+        """
+        return kernelcache.KernelCacheSupport(
+            mount_location_data=self.mount_location_data,
+            detected_os=self.constants.detected_os,
+            skip_root_kmutil_requirement=self.skip_root_kmutil_requirement
+        )
+
+
+    def _planner(self, dynamic_resolver: callable = None) -> PatchPlanner:
+        """
+        Patch planner for the current configuration
+        """
+        return PatchPlanner(
+            mount_location=self.mount_location,
+            mount_location_data=self.mount_location_data,
+            source_files_path=str(self.constants.payload_local_binaries_root_path),
+            kc_support_obj=self._kc_support(),
+            dynamic_resolver=dynamic_resolver
+        )
+
+
     def _execute_patchset(self, required_patches: dict):
         """
         Executes provided patchset
@@ -360,83 +433,170 @@ class PatchSysVolume:
             required_patches (dict): Patchset to execute (generated by HardwarePatchsetDetection)
         """
 
-        kc_support_obj = kernelcache.KernelCacheSupport(
-            mount_location_data=self.mount_location_data,
-            detected_os=self.constants.detected_os,
-            skip_root_kmutil_requirement=self.skip_root_kmutil_requirement
-        )
+        # Read before _write_patchset() replaces the previous patchset information
+        self.previous_kernel_cache_fingerprint = self._previous_kernel_cache_fingerprint()
+
+        planner = self._planner(dynamic_resolver=self._resolve_dynamic_patchset)
 
-        source_files_path = str(self.constants.payload_local_binaries_root_path)
-        required_patches = self._preflight_checks(required_patches, source_files_path)
-        for patch in required_patches:
-            logging.info("- Installing Patchset: " + patch)
-            for method_remove in [PatchType.REMOVE_SYSTEM_VOLUME, PatchType.REMOVE_DATA_VOLUME]:
-                if method_remove in required_patches[patch]:
-                    for remove_patch_directory in required_patches[patch][method_remove]:
-                        logging.info("- Remove Files at: " + remove_patch_directory)
-                        for remove_patch_file in required_patches[patch][method_remove][remove_patch_directory]:
-                            if method_remove == PatchType.REMOVE_SYSTEM_VOLUME:
-                                destination_folder_path = str(self.mount_location) + remove_patch_directory
-                            else:
-                                destination_folder_path = str(self.mount_location_data) + remove_patch_directory
-                            remove_file(destination_folder_path, remove_patch_file)
-
-
-            for method_install in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.OVERWRITE_DATA_VOLUME, PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]:
-                if method_install not in required_patches[patch]:
-                    continue
-
-                for install_patch_directory in list(required_patches[patch][method_install]):
-                    logging.info(f"- Handling Installs in: {install_patch_directory}")
-                    for install_file in list(required_patches[patch][method_install][install_patch_directory]):
-                        source_folder_path = required_patches[patch][method_install][install_patch_directory][install_file] + install_patch_directory
-                        # Check whether to source from root
-                        if not required_patches[patch][method_install][install_patch_directory][install_file].startswith("/"):
-                            source_folder_path = source_files_path + "/" + source_folder_path
-
-                        if method_install in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.MERGE_SYSTEM_VOLUME]:
-                            destination_folder_path = str(self.mount_location) + install_patch_directory
-                        else:
-                            if install_patch_directory == "/Library/Extensions":
-                                self.needs_kmutil_exemptions = True
-                                if kc_support_obj.check_kexts_needs_authentication(install_file) is True:
-                                    self.constants.needs_to_open_preferences = True
-
-                            destination_folder_path = str(self.mount_location_data) + install_patch_directory
-
-                        updated_destination_folder_path = kc_support_obj.add_auxkc_support(install_file, source_folder_path, install_patch_directory, destination_folder_path)
-                        if updated_destination_folder_path != destination_folder_path:
-                            if kc_support_obj.check_kexts_needs_authentication(install_file) is True:
-                                self.constants.needs_to_open_preferences = True
-
-                        if destination_folder_path != updated_destination_folder_path:
-                            # Update required_patches to reflect the new destination folder path
-                            if updated_destination_folder_path not in required_patches[patch][method_install]:
-                                required_patches[patch][method_install].update({updated_destination_folder_path: {}})
-                            required_patches[patch][method_install][updated_destination_folder_path].update({install_file: required_patches[patch][method_install][install_patch_directory][install_file]})
-                            required_patches[patch][method_install][install_patch_directory].pop(install_file)
-
-                            destination_folder_path = updated_destination_folder_path
-
-                        install_new_file(source_folder_path, destination_folder_path, install_file, method_install)
-
-            if PatchType.EXECUTE in required_patches[patch]:
-                for process in required_patches[patch][PatchType.EXECUTE]:
-                    # Some processes need sudo, however we cannot directly call sudo in some scenarios
-                    # Instead, call elevated funtion if string's boolean is True
-                    if required_patches[patch][PatchType.EXECUTE][process] is True:
-                        logging.info(f"- Running Process as Root:\n{process}")
-                        subprocess_wrapper.run_as_root_and_verify(process.split(" "), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    else:
-                        logging.info(f"- Running Process:\n{process}")
-                        subprocess_wrapper.run_and_verify(process, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
-
-        if any(x in required_patches for x in ["AMD Legacy GCN", "AMD Legacy Polaris", "AMD Legacy Vega"]):
+        required_patches = self._preflight_checks(required_patches, planner)
+        plan = planner.plan(required_patches)
+
+        if plan.needs_kmutil_exemptions is True:
+            self.needs_kmutil_exemptions = True
+        if plan.needs_to_open_preferences is True:
+            self.constants.needs_to_open_preferences = True
+
+        self._execute_plan(plan)
+
+        if any(x in plan.patchset for x in ["AMD Legacy GCN", "AMD Legacy Polaris", "AMD Legacy Vega"]):
             sys_patch_helpers.SysPatchHelpers(self.constants).disable_window_server_caching()
-        if "Metal 3802 Common Extended" in required_patches:
+        if "Metal 3802 Common Extended" in plan.patchset:
             sys_patch_helpers.SysPatchHelpers(self.constants).patch_gpu_compiler_libraries(mount_point=self.mount_location)
 
-        self._write_patchset(required_patches)
+        # Written ahead of the kernel cache rebuild, thus patches are recorded even if the rebuild fails
+        self.patchset = plan.patchset
+        self._write_patchset(self.patchset)
+
+
+    def _execute_plan(self, plan: PatchPlan) -> None:
+        """
+        Executes planned operations
+
+        File operations are queued and executed in a single Privileged Helper invocation per patchset
+
+        Parameters:
+            plan (PatchPlan): Plan to execute (generated by PatchPlanner)
+        """
+
+        kc_support_obj = self._kc_support()
+        batch = subprocess_wrapper.PrivilegedBatch()
+        current_patchset = None
+
+        for operation in plan.operations:
+            if operation.patchset != current_patchset:
+                batch.run_and_verify()
+                current_patchset = operation.patchset
+                logging.info("- Installing Patchset: " + current_patchset)
+
+            if operation.type == PatchOperationType.EXECUTE:
+                batch.run_and_verify()
+                # Some processes need sudo, however we cannot directly call sudo in some scenarios
+                # Instead, call elevated funtion if string's boolean is True
+                if operation.as_root is True:
+                    logging.info(f"- Running Process as Root:\n{operation.command}")
+                    subprocess_wrapper.run_as_root_and_verify(operation.command.split(" "), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                else:
+                    logging.info(f"- Running Process:\n{operation.command}")
+                    subprocess_wrapper.run_and_verify(operation.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
+                continue
+
+            if operation.auxkc is True:
+                kc_support_obj.patch_kext_for_auxkc(operation.file_name, operation.source)
+
+            execute_operation(operation, batch)
+
+        batch.run_and_verify()
+
+
+    def generate_plan(self) -> PatchPlan:
+        """
+        Generate patch plan without modifying the system (dry run)
+
+        Plan is generated against the live root volume, DynamicPatchsets are left unresolved
+
+        Returns:
+            PatchPlan: Planned operations, None if no patches are required
+        """
+
+        required_patches = HardwarePatchsetDetection(self.constants).patches
+        if required_patches == {}:
+            return None
+
+        if PatcherSupportPkgMount(self.constants).mount() is False:
+            raise Exception("Failed to mount PatcherSupportPkg")
+
+        mount_location = self.mount_location
+        self.mount_location = ""
+        try:
+            return self._planner().plan(required_patches)
+        finally:
+            self.mount_location = mount_location
+
+
+    def _start_resource_resolution(self) -> None:
+        """
+        Start resolving the KDK and MetallibSupportPkg in the background
+
+        Both are independent of each other and of the root volume, thus their downloads,
+        validation and installation overlap with one another and with mounting.
+        Patching only blocks once a resource is consumed, see _await_resource()
+        """
+        if self._resource_executor is not None:
+            return
+
+        resolvers = {}
+        if self.hardware_details[HardwarePatchsetSettings.KERNEL_DEBUG_KIT_REQUIRED] is True:
+            self._kdk_merge_obj = KernelDebugKitMerge(
+                self.constants,
+                self.mount_location,
+                self.skip_root_kmutil_requirement,
+                install_lock=self._install_lock
+            )
+            resolvers["KDK"] = self._kdk_merge_obj.resolve
+        if self.hardware_details[HardwarePatchsetSettings.METALLIB_SUPPORT_PKG_REQUIRED] is True:
+            resolvers["MetallibSupportPkg"] = self._resolve_metallib_support_pkg
+
+        if not resolvers:
+            return
+
+        logging.info(f"- Resolving in background: {', '.join(resolvers)}")
+        self._resource_cancelled.clear()
+        self._resource_executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(resolvers), thread_name_prefix="sys_patch_resource")
+        self._resource_futures = {name: self._resource_executor.submit(resolver) for name, resolver in resolvers.items()}
+
+
+    def _stop_resource_resolution(self) -> None:
+        """
+        Cancel background resolution not yet consumed (ie. patching aborted), and wait for it to exit
+        Downloads are stopped, installs already in progress are left to complete
+        """
+        if self._resource_executor is None:
+            return
+
+        self._resource_cancelled.set()
+        if self._kdk_merge_obj is not None:
+            self._kdk_merge_obj.cancel()
+        if self._metallib_download is not None:
+            self._metallib_download.stop()
+
+        for name, future in self._resource_futures.items():
+            if future.cancel():
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                logging.warning(f"- Background {name} resolution did not complete: {e}")
+
+        self._resource_executor.shutdown(wait=True)
+        self._resource_executor = None
+        self._resource_futures = {}
+
+
+    def _await_resource(self, name: str):
+        """
+        Block until a background resolved resource is available
+
+        Returns:
+            Resolved value, None if not resolved in the background
+            Exceptions raised during resolution are re-raised
+        """
+        future = self._resource_futures.pop(name, None)
+        if future is None:
+            return None
+
+        if not future.done():
+            logging.info(f"- Waiting for {name}")
+        return future.result()
 
 
     def _resolve_metallib_support_pkg(self) -> str:
@@ -455,13 +615,21 @@ class PatchSysVolume:
             self.metallib_path = metallib_obj.metallib_installed_path
             return str(metallib_obj.metallib_installed_path)
 
+        self._metallib_download = metallib_download_obj
+        if self._resource_cancelled.is_set():
+            raise Exception("MetallibSupportPkg resolution cancelled")
         metallib_download_obj.download(spawn_thread=False)
+        self._metallib_download = None
+        if self._resource_cancelled.is_set():
+            raise Exception("MetallibSupportPkg resolution cancelled")
         if metallib_download_obj.download_complete is False:
             error_msg = metallib_download_obj.error_msg
             logging.error(f"Could not download MetalLibSupportPkg: {error_msg}")
             raise Exception(f"Could not download MetalLibSupportPkg: {error_msg}")
 
-        if metallib_obj.install_metallib() is False:
+        with self._install_lock:
+            installed = metallib_obj.install_metallib()
+        if installed is False:
             logging.error("Failed to install MetalLibSupportPkg")
             raise Exception("Failed to install MetalLibSupportPkg")
 
@@ -475,18 +643,20 @@ class PatchSysVolume:
         Resolves dynamic patchset to a path
         """
         if variant == DynamicPatchset.MetallibSupportPkg:
+            if "MetallibSupportPkg" in self._resource_futures:
+                return self._await_resource("MetallibSupportPkg")
             return self._resolve_metallib_support_pkg()
 
         raise Exception(f"Unknown Dynamic Patchset: {variant}")
 
 
-    def _preflight_checks(self, required_patches: dict, source_files_path: Path) -> dict:
+    def _preflight_checks(self, required_patches: dict, planner: PatchPlanner) -> dict:
         """
         Runs preflight checks before patching
 
         Parameters:
             required_patches (dict): Patchset dictionary (from HardwarePatchsetDetection)
-            source_files_path (Path): Path to the source files (PatcherSupportPkg)
+            planner  (PatchPlanner): Planner used to resolve source files
 
         Returns:
             dict: Updated patchset dictionary
@@ -494,26 +664,8 @@ class PatchSysVolume:
 
         logging.info("- Running Preflight Checks before patching")
 
-        for patch in required_patches:
-            # Check if all files are present
-            for method_type in [PatchType.OVERWRITE_SYSTEM_VOLUME, PatchType.OVERWRITE_DATA_VOLUME, PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]:
-                if method_type not in required_patches[patch]:
-                    continue
-                for install_patch_directory in required_patches[patch][method_type]:
-                    for install_file in required_patches[patch][method_type][install_patch_directory]:
-                        try:
-                            if required_patches[patch][method_type][install_patch_directory][install_file] in DynamicPatchset:
-                                required_patches[patch][method_type][install_patch_directory][install_file] = self._resolve_dynamic_patchset(required_patches[patch][method_type][install_patch_directory][install_file])
-                        except TypeError:
-                            pass
-
-                        source_file = required_patches[patch][method_type][install_patch_directory][install_file] + install_patch_directory + "/" + install_file
-
-                        # Check whether to source from root
-                        if not required_patches[patch][method_type][install_patch_directory][install_file].startswith("/"):
-                            source_file = source_files_path + "/" + source_file
-                        if not Path(source_file).exists():
-                            raise Exception(f"Failed to find {source_file}")
+        # Check if all files are present
+        required_patches = planner.resolve_sources(required_patches)
 
         # Make sure old SkyLight plugins aren't being used
         self._clean_skylight_plugins()
@@ -522,15 +674,11 @@ class PatchSysVolume:
         self._delete_nonmetal_enforcement()
 
         # Make sure we clean old kexts in /L*/E* that are not in the patchset
-        kernelcache.KernelCacheSupport(
-            mount_location_data=self.mount_location_data,
-            detected_os=self.constants.detected_os,
-            skip_root_kmutil_requirement=self.skip_root_kmutil_requirement
-        ).clean_auxiliary_kc()
+        self._kc_support().clean_auxiliary_kc()
 
         # Make sure SNB kexts are compatible with the host
         if "Intel Sandy Bridge" in required_patches:
-            sys_patch_helpers.SysPatchHelpers(self.constants).snb_board_id_patch(source_files_path)
+            sys_patch_helpers.SysPatchHelpers(self.constants).snb_board_id_patch(str(self.constants.payload_local_binaries_root_path))
 
         # Ensure KDK is properly installed
         self._merge_kdk_with_root(save_hid_cs=True if "Legacy USB 1.1" in required_patches else False)
@@ -562,7 +710,20 @@ class PatchSysVolume:
             return
 
         logging.info("- Patcher is capable of patching")
-        if PatcherSupportPkgMount(self.constants).mount() is False:
+        self._start_resource_resolution()
+        try:
+            self._mount_and_patch_root_vol()
+        finally:
+            self._stop_resource_resolution()
+
+
+    def _mount_and_patch_root_vol(self) -> None:
+        """
+        Mount resources and root volume, then patch
+        """
+        with self._install_lock:
+            psp_mounted = PatcherSupportPkgMount(self.constants).mount()
+        if psp_mounted is False:
             logging.error("- Critical resources missing, cannot continue with patching!!!")
             return
 
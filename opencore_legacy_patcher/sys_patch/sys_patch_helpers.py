@@ -77,7 +77,7 @@ class SysPatchHelpers:
                 f.write(data)
 
 
-    def generate_patchset_plist(self, patchset: dict, file_name: str, kdk_used: Path, metallib_used: Path):
+    def generate_patchset_plist(self, patchset: dict, file_name: str, kdk_used: Path, metallib_used: Path, kernel_cache_fingerprint: dict = None):
         """
         Generate patchset file for user reference
 
@@ -85,6 +85,7 @@ class SysPatchHelpers:
             patchset (dict): Dictionary of patchset, sys_patch/patchsets
             file_name (str): Name of the file to write to
             kdk_used (Path): Path to the KDK used, if any
+            kernel_cache_fingerprint (dict): Kernel cache rebuild metadata, if any (see kernelcache/fingerprint.py)
 
         Returns:
             bool: True if successful, False if not
@@ -113,6 +114,9 @@ class SysPatchHelpers:
             "Custom Signature": bool(Path(self.constants.payload_local_binaries_root_path / ".signed").exists()),
         }
 
+        if kernel_cache_fingerprint:
+            data["Kernel Cache Fingerprint"] = kernel_cache_fingerprint
+
         data.update(patchset)
 
         if Path(source_path_file).exists():
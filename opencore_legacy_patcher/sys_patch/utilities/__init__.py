@@ -1,6 +1,6 @@
 """
 utilities: General utility functions for root volume patching
 """
-from .files import install_new_file, remove_file, fix_permissions
+from .files import install_new_file, remove_file, fix_permissions, execute_operation
 from .dmg_mount import PatcherSupportPkgMount
 from .kdk_merge import KernelDebugKitMerge
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+file_sync.py: Incremental file synchronization for root volume patching
+
+Compares a source file or tree (PatcherSupportPkg) against its installed copy,
+generating only the commands required to bring the destination up to date.
+
+Results match the existing install semantics:
+- Overwrite: destination becomes an exact copy of source (rm -R + cp -R)
+- Merge:     source is layered over destination, extra files are kept (rsync -r -a)
+In both cases, every path in the resulting tree is owned by root:wheel with 755 permissions (fix_permissions)
+
+Usage:
+>>> diff = TreeDiff.compare("/source/Foo.kext", "/destination/Foo.kext", delete=True)
+>>> for args in diff.commands():
+...     subprocess_wrapper.run_as_root_and_verify(args)
+"""
+
+import os
+import stat
+import hashlib
+
+from dataclasses import dataclass, field
+
+
+# Maximum number of paths passed to a single rm/chmod/chown invocation
+COMMAND_PATH_LIMIT: int = 128
+
+
+def _file_type(mode: int) -> int:
+    return stat.S_IFMT(mode)
+
+
+def _needs_permissions(st: os.stat_result) -> bool:
+    """
+    Check whether path differs from fix_permissions()' result
+    """
+    return stat.S_IMODE(st.st_mode) != 0o755 or st.st_uid != 0 or st.st_gid != 0
+
+
+def _hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def _walk(root: str) -> dict:
+    """
+    Generate stat results for every path within root, keyed by relative path
+    Root itself is keyed as "", symbolic links are not followed
+    """
+
+    entries = {"": os.lstat(root)}
+    if not stat.S_ISDIR(entries[""].st_mode):
+        return entries
+
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        with os.scandir(os.path.join(root, relative)) as iterator:
+            for entry in iterator:
+                entry_relative = os.path.join(relative, entry.name) if relative else entry.name
+                entries[entry_relative] = entry.stat(follow_symlinks=False)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry_relative)
+
+    return entries
+
+
+@dataclass
+class TreeDiff:
+    source:      str
+    destination: str
+    clone:       bool = False  # Use APFS clonefile when copying ('cp -c')
+
+    remove:      list = field(default_factory=list)  # Destination paths to delete
+    mkdir:       list = field(default_factory=list)  # Destination directories to create
+    copy:        list = field(default_factory=list)  # (source, destination) files to copy
+    link:        list = field(default_factory=list)  # (target, destination) symbolic links to create
+    permissions: list = field(default_factory=list)  # Destination paths requiring chmod/chown
+    unchanged:   int  = 0
+
+
+    @classmethod
+    def compare(cls, source: str, destination: str, delete: bool, compare_hash: bool = False, clone: bool = False) -> "TreeDiff":
+        """
+        Compare source against destination
+
+        Files are considered identical when sizes match and either the modification
+        time or the content hash matches. Files copied with 'cp' receive a new
+        modification time, thus fall back to hashing.
+
+        Parameters:
+            source       (str):  Source file or directory
+            destination  (str):  Destination file or directory
+            delete       (bool): Remove destination paths not present in source (Overwrite semantics)
+            compare_hash (bool): Always compare content hashes, even if size and modification time match
+            clone        (bool): Use APFS clonefile when copying
+        """
+
+        diff = cls(source=source, destination=destination, clone=clone)
+
+        source_entries      = _walk(source)
+        destination_entries = _walk(destination) if os.path.lexists(destination) else {}
+        removed_prefixes    = []
+
+        def _is_removed(relative: str) -> bool:
+            return any(relative == prefix or relative.startswith(prefix + "/") for prefix in removed_prefixes)
+
+        for relative in sorted(source_entries):
+            source_stat = source_entries[relative]
+            source_path      = os.path.join(source, relative) if relative else source
+            destination_path = os.path.join(destination, relative) if relative else destination
+
+            destination_stat = None if _is_removed(relative) else destination_entries.get(relative)
+            if destination_stat is not None and _file_type(destination_stat.st_mode) != _file_type(source_stat.st_mode):
+                diff.remove.append(destination_path)
+                removed_prefixes.append(relative)
+                destination_stat = None
+
+            if stat.S_ISDIR(source_stat.st_mode):
+                if destination_stat is None:
+                    diff.mkdir.append(destination_path)
+                    diff.permissions.append(destination_path)
+                elif _needs_permissions(destination_stat):
+                    diff.permissions.append(destination_path)
+                else:
+                    diff.unchanged += 1
+
+            elif stat.S_ISLNK(source_stat.st_mode):
+                target = os.readlink(source_path)
+                if destination_stat is None:
+                    diff.link.append((target, destination_path))
+                elif os.readlink(destination_path) != target:
+                    diff.remove.append(destination_path)
+                    diff.link.append((target, destination_path))
+                else:
+                    diff.unchanged += 1
+
+            else:
+                if destination_stat is None or not diff._files_match(source_path, source_stat, destination_path, destination_stat, compare_hash):
+                    diff.copy.append((source_path, destination_path))
+                    diff.permissions.append(destination_path)
+                elif _needs_permissions(destination_stat):
+                    diff.permissions.append(destination_path)
+                else:
+                    diff.unchanged += 1
+
+        for relative in sorted(destination_entries):
+            if relative in source_entries or _is_removed(relative):
+                continue
+            destination_path = os.path.join(destination, relative)
+            if delete:
+                diff.remove.append(destination_path)
+                removed_prefixes.append(relative)
+            elif not stat.S_ISLNK(destination_entries[relative].st_mode) and _needs_permissions(destination_entries[relative]):
+                diff.permissions.append(destination_path)
+
+        return diff
+
+
+    def _files_match(self, source_path: str, source_stat: os.stat_result, destination_path: str, destination_stat: os.stat_result, compare_hash: bool) -> bool:
+        if source_stat.st_size != destination_stat.st_size:
+            return False
+        if not compare_hash and int(source_stat.st_mtime) == int(destination_stat.st_mtime):
+            return True
+        return _hash(source_path) == _hash(destination_path)
+
+
+    def is_empty(self) -> bool:
+        """
+        Check whether destination already matches source
+        """
+        return not (self.remove or self.mkdir or self.copy or self.link or self.permissions)
+
+
+    def commands(self) -> list:
+        """
+        Generate commands required to update destination, in execution order
+        """
+
+        commands = []
+
+        for i in range(0, len(self.remove), COMMAND_PATH_LIMIT):
+            commands.append(["/bin/rm", "-Rf", *self.remove[i:i + COMMAND_PATH_LIMIT]])
+        for directory in self.mkdir:
+            commands.append(["/bin/mkdir", "-p", directory])
+        for source, destination in self.copy:
+            # Preserve modification time, allowing future comparisons to skip hashing
+            commands.append(["/bin/cp", "-c", "-p", source, destination] if self.clone else ["/bin/cp", "-p", source, destination])
+        for target, destination in self.link:
+            commands.append(["/bin/ln", "-s", target, destination])
+        for i in range(0, len(self.permissions), COMMAND_PATH_LIMIT):
+            commands.append(["/bin/chmod", "755", *self.permissions[i:i + COMMAND_PATH_LIMIT]])
+            commands.append(["/usr/sbin/chown", "root:wheel", *self.permissions[i:i + COMMAND_PATH_LIMIT]])
+
+        return commands
+
+
+    def summary(self) -> str:
+        return f"{len(self.copy) + len(self.link)} updated, {len(self.remove)} removed, {len(self.permissions)} permission fixes, {self.unchanged} unchanged"
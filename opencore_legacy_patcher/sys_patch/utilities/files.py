@@ -7,13 +7,30 @@ import subprocess
 
 from pathlib import Path
 
+from .file_sync       import TreeDiff
 from ..patchsets.base import PatchType
+from ..planner        import PatchOperation, PatchOperationType
 
-from ...volume  import generate_copy_arguments
+from ...volume  import generate_copy_arguments, can_copy_on_write
 from ...support import subprocess_wrapper
 
 
-def install_new_file(source_folder: Path, destination_folder: Path, file_name: str, method: PatchType) -> None:
+def _run_as_root(args: list, batch: subprocess_wrapper.PrivilegedBatch = None, verify: bool = True) -> None:
+    """
+    Run command as root, or queue it in the batch if provided
+    """
+
+    if batch is not None:
+        batch.add(args, verify=verify)
+        return
+
+    if verify:
+        subprocess_wrapper.run_as_root_and_verify(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    else:
+        subprocess_wrapper.run_as_root(args, stdout=subprocess.PIPE)
+
+
+def install_new_file(source_folder: Path, destination_folder: Path, file_name: str, method: PatchType, batch: subprocess_wrapper.PrivilegedBatch = None) -> None:
     """
     Installs a new file to the destination folder
 
@@ -25,66 +42,150 @@ def install_new_file(source_folder: Path, destination_folder: Path, file_name: s
         source_folder      (Path): Path to the source folder
         destination_folder (Path): Path to the destination folder
         file_name           (str): Name of the file to install
+        batch   (PrivilegedBatch): Queue operations instead of running them immediately
     """
 
     file_name_str = str(file_name)
 
+    if not Path(destination_folder).exists() and batch:
+        # Destination may be created by a queued operation
+        batch.run_and_verify()
+
     if not Path(destination_folder).exists():
         logging.info(f"  - Skipping {file_name}, cannot locate {source_folder}")
         return
 
+    is_directory = Path(source_folder + "/" + file_name_str).is_dir()
+
     if method in [PatchType.MERGE_SYSTEM_VOLUME, PatchType.MERGE_DATA_VOLUME]:
         # merge with rsync
         logging.info(f"  - Installing: {file_name}")
-        subprocess_wrapper.run_as_root(["/usr/bin/rsync", "-r", "-i", "-a", f"{source_folder}/{file_name}", f"{destination_folder}/"], stdout=subprocess.PIPE)
-        fix_permissions(destination_folder + "/" + file_name)
-    elif Path(source_folder + "/" + file_name_str).is_dir():
+        _run_as_root(["/usr/bin/rsync", "-r", "-i", "-a", f"{source_folder}/{file_name}", f"{destination_folder}/"], batch, verify=False)
+        fix_permissions(destination_folder + "/" + file_name, batch, is_directory)
+    elif is_directory:
         # Applicable for .kext, .app, .plugin, .bundle, all of which are directories
         if Path(destination_folder + "/" + file_name).exists():
             logging.info(f"  - Found existing {file_name}, overwriting...")
-            subprocess_wrapper.run_as_root_and_verify(["/bin/rm", "-R", f"{destination_folder}/{file_name}"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            _run_as_root(["/bin/rm", "-R", f"{destination_folder}/{file_name}"], batch)
         else:
             logging.info(f"  - Installing: {file_name}")
-        subprocess_wrapper.run_as_root_and_verify(generate_copy_arguments(f"{source_folder}/{file_name}", destination_folder), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        fix_permissions(destination_folder + "/" + file_name)
+        _run_as_root(generate_copy_arguments(f"{source_folder}/{file_name}", destination_folder), batch)
+        fix_permissions(destination_folder + "/" + file_name, batch, is_directory)
     else:
         # Assume it's an individual file, replace as normal
         if Path(destination_folder + "/" + file_name).exists():
             logging.info(f"  - Found existing {file_name}, overwriting...")
-            subprocess_wrapper.run_as_root_and_verify(["/bin/rm", f"{destination_folder}/{file_name}"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            _run_as_root(["/bin/rm", f"{destination_folder}/{file_name}"], batch)
         else:
             logging.info(f"  - Installing: {file_name}")
-        subprocess_wrapper.run_as_root_and_verify(generate_copy_arguments(f"{source_folder}/{file_name}", destination_folder), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        fix_permissions(destination_folder + "/" + file_name)
+        _run_as_root(generate_copy_arguments(f"{source_folder}/{file_name}", destination_folder), batch)
+        fix_permissions(destination_folder + "/" + file_name, batch, is_directory)
+
+
+def _sync_existing(operation: PatchOperation, batch: subprocess_wrapper.PrivilegedBatch = None) -> bool:
+    """
+    Incrementally update an already installed file, only touching changed paths
+
+    Returns:
+        bool: True if handled, False if a full install is required
+    """
+
+    try:
+        diff = TreeDiff.compare(
+            operation.source_path,
+            operation.destination_path,
+            delete=operation.type == PatchOperationType.COPY,
+            clone=can_copy_on_write(operation.source_path, operation.destination_path)
+        )
+    except Exception as e:
+        # ie. unreadable destination
+        logging.info(f"  - Unable to compare {operation.file_name}, falling back to full install: {e}")
+        return False
+
+    if diff.is_empty():
+        logging.info(f"  - Already up to date: {operation.file_name}")
+        return True
+
+    logging.info(f"  - Updating: {operation.file_name} ({diff.summary()})")
+    for args in diff.commands():
+        _run_as_root(args, batch)
 
+    return True
 
-def remove_file(destination_folder: Path, file_name: str) -> None:
+
+def execute_operation(operation: PatchOperation, batch: subprocess_wrapper.PrivilegedBatch = None, incremental: bool = True) -> None:
+    """
+    Executes a planned file operation (see sys_patch/planner.py)
+
+    Existence checks were performed during planning, thus are not repeated here
+
+    Parameters:
+        operation (PatchOperation): Remove, copy or merge operation
+        batch    (PrivilegedBatch): Queue operations instead of running them immediately
+        incremental         (bool): Only update changed paths of existing files, instead of replacing them
+    """
+
+    if incremental and operation.replace and operation.type in [PatchOperationType.COPY, PatchOperationType.MERGE]:
+        if _sync_existing(operation, batch):
+            return
+
+    if operation.type == PatchOperationType.REMOVE:
+        logging.info(f"  - Removing: {operation.file_name}")
+        _run_as_root(["/bin/rm", "-R", operation.destination_path] if operation.directory else ["/bin/rm", operation.destination_path], batch)
+        return
+
+    if operation.type == PatchOperationType.MERGE:
+        logging.info(f"  - Installing: {operation.file_name}")
+        _run_as_root(["/usr/bin/rsync", "-r", "-i", "-a", operation.source_path, f"{operation.destination}/"], batch, verify=False)
+    elif operation.type == PatchOperationType.COPY:
+        if operation.replace:
+            logging.info(f"  - Found existing {operation.file_name}, overwriting...")
+            _run_as_root(["/bin/rm", "-R", operation.destination_path] if operation.directory else ["/bin/rm", operation.destination_path], batch)
+        else:
+            logging.info(f"  - Installing: {operation.file_name}")
+        _run_as_root(generate_copy_arguments(operation.source_path, operation.destination), batch)
+    else:
+        raise Exception(f"Unsupported file operation: {operation.type}")
+
+    fix_permissions(operation.destination_path, batch, operation.directory)
+
+
+def remove_file(destination_folder: Path, file_name: str, batch: subprocess_wrapper.PrivilegedBatch = None) -> None:
     """
     Removes a file from the destination folder
 
     Parameters:
         destination_folder (Path): Path to the destination folder
         file_name           (str): Name of the file to remove
+        batch   (PrivilegedBatch): Queue operations instead of running them immediately
     """
 
     if Path(destination_folder + "/" + file_name).exists():
         logging.info(f"  - Removing: {file_name}")
         if Path(destination_folder + "/" + file_name).is_dir():
-            subprocess_wrapper.run_as_root_and_verify(["/bin/rm", "-R", f"{destination_folder}/{file_name}"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            _run_as_root(["/bin/rm", "-R", f"{destination_folder}/{file_name}"], batch)
         else:
-            subprocess_wrapper.run_as_root_and_verify(["/bin/rm", f"{destination_folder}/{file_name}"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            _run_as_root(["/bin/rm", f"{destination_folder}/{file_name}"], batch)
 
 
-def fix_permissions(destination_file: Path) -> None:
+def fix_permissions(destination_file: Path, batch: subprocess_wrapper.PrivilegedBatch = None, is_directory: bool = None) -> None:
     """
     Fix file permissions for a given file or directory
+
+    Parameters:
+        destination_file   (Path): Path to the file or directory
+        batch   (PrivilegedBatch): Queue operations instead of running them immediately
+        is_directory       (bool): Whether the destination is a directory, required if it is yet to be created by a queued operation
     """
 
+    if is_directory is None:
+        is_directory = Path(destination_file).is_dir()
+
     chmod_args = ["/bin/chmod",      "-Rf", "755", destination_file]
     chown_args = ["/usr/sbin/chown", "-Rf", "root:wheel", destination_file]
-    if not Path(destination_file).is_dir():
+    if not is_directory:
         # Strip recursive arguments
         chmod_args.pop(1)
         chown_args.pop(1)
-    subprocess_wrapper.run_as_root_and_verify(chmod_args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    subprocess_wrapper.run_as_root_and_verify(chown_args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    _run_as_root(chmod_args, batch)
+    _run_as_root(chown_args, batch)
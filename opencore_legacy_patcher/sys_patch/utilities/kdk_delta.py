@@ -0,0 +1,182 @@
+"""
+kdk_delta.py: Delta merging of Kernel Debug Kits with the root volume
+
+Rather than rsync'ing the KDK's entire Extensions folder on every patch, the KDK is
+compared against the root volume, generating only the commands required to add or
+replace entries that differ. Merged entries retain the KDK's size and modification
+time ('rsync -a'), thus unchanged entries are detected with a single lstat each.
+
+Operates purely on the filesystem, thus can be exercised against synthetic trees.
+
+Usage:
+>>> delta = KernelDebugKitDelta.compare(kdk_path, mount_location)
+>>> logging.info(delta.summary())
+>>> for args in delta.commands():
+...     batch.add(args)
+"""
+
+import os
+import stat
+
+from dataclasses import dataclass, field
+
+from .file_sync import COMMAND_PATH_LIMIT
+
+
+EXTENSIONS_PATH:  str   = "System/Library/Extensions"
+FULL_MERGE_RATIO: float = 0.5  # Past this ratio of changed entries, a single full rsync is cheaper
+
+
+def _entry(path: str) -> tuple:
+    """
+    Identity of a file or symbolic link, matching what 'rsync -a' preserves
+    """
+    entry_stat = os.lstat(path)
+    if stat.S_ISLNK(entry_stat.st_mode):
+        return ("Link", 0, 0, os.readlink(path))
+    if stat.S_ISDIR(entry_stat.st_mode):
+        # Only possible on the root volume, where a directory conflicts with a KDK file or link
+        return ("Directory", 0, 0, "")
+    return ("File", entry_stat.st_size, int(entry_stat.st_mtime), "")
+
+
+def _walk(root: str) -> tuple:
+    """
+    Walk root without following symbolic links
+
+    Returns:
+        tuple: (directories, files and links keyed by relative path, see _entry())
+    """
+
+    directories = []
+    entries     = {}
+
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        with os.scandir(os.path.join(root, relative)) as iterator:
+            for item in iterator:
+                item_relative = os.path.join(relative, item.name) if relative else item.name
+                if item.is_dir(follow_symlinks=False):
+                    directories.append(item_relative)
+                    pending.append(item_relative)
+                else:
+                    entries[item_relative] = _entry(item.path)
+
+    return directories, entries
+
+
+@dataclass
+class KernelDebugKitDelta:
+    kdk_path:       str
+    mount_location: str
+
+    entries:   dict = field(default_factory=dict)  # Relative path -> (type, size, modification time, link target), files and links within the KDK
+    remove:    list = field(default_factory=list)  # Relative paths on root volume whose type conflicts with the KDK
+    mkdir:     list = field(default_factory=list)  # Relative directories missing from root volume
+    add:       list = field(default_factory=list)  # Relative paths missing from root volume
+    replace:   list = field(default_factory=list)  # Relative paths differing on root volume
+    unchanged: int  = 0
+
+
+    @property
+    def source(self) -> str:
+        return f"{self.kdk_path}/{EXTENSIONS_PATH}"
+
+
+    @property
+    def destination(self) -> str:
+        return f"{self.mount_location}/{EXTENSIONS_PATH}"
+
+
+    @classmethod
+    def compare(cls, kdk_path: str, mount_location: str) -> "KernelDebugKitDelta":
+        """
+        Compare KDK's Extensions folder against the root volume
+
+        Parameters:
+            kdk_path       (str): Path to KDK
+            mount_location (str): Root volume mount point
+        """
+
+        delta = cls(kdk_path=str(kdk_path), mount_location=str(mount_location))
+
+        directories, delta.entries = _walk(delta.source)
+
+        for relative in sorted(directories):
+            destination_path = os.path.join(delta.destination, relative)
+            if os.path.isdir(destination_path) and not os.path.islink(destination_path):
+                continue
+            if os.path.lexists(destination_path):
+                delta.remove.append(relative)
+            delta.mkdir.append(relative)
+
+        missing_directories = set(delta.mkdir)
+        for relative in sorted(delta.entries):
+            entry = delta.entries[relative]
+
+            if os.path.dirname(relative) in missing_directories:
+                delta.add.append(relative)
+                continue
+
+            try:
+                current = _entry(os.path.join(delta.destination, relative))
+            except FileNotFoundError:
+                delta.add.append(relative)
+                continue
+
+            if current == entry:
+                delta.unchanged += 1
+                continue
+
+            if current[0] != entry[0]:
+                delta.remove.append(relative)
+            delta.replace.append(relative)
+
+        return delta
+
+
+    def is_empty(self) -> bool:
+        """
+        Check whether root volume already contains the KDK
+        """
+        return not (self.remove or self.mkdir or self.add or self.replace)
+
+
+    def prefer_full_merge(self) -> bool:
+        """
+        Check whether most of the KDK differs (ie. freshly updated root volume), where a full rsync is cheaper
+        """
+        return len(self.add) + len(self.replace) > len(self.entries) * FULL_MERGE_RATIO
+
+
+    def commands(self) -> list:
+        """
+        Generate commands required to merge the KDK, in execution order
+        """
+
+        commands = []
+
+        remove = [os.path.join(self.destination, relative) for relative in self.remove]
+        for i in range(0, len(remove), COMMAND_PATH_LIMIT):
+            commands.append(["/bin/rm", "-Rf", *remove[i:i + COMMAND_PATH_LIMIT]])
+
+        # Sorted, thus parents are created first
+        mkdir = [os.path.join(self.destination, relative) for relative in self.mkdir]
+        for i in range(0, len(mkdir), COMMAND_PATH_LIMIT):
+            commands.append(["/bin/mkdir", "-p", *mkdir[i:i + COMMAND_PATH_LIMIT]])
+
+        # rsync each parent directory's entries together, preserving attributes and symbolic links
+        by_parent = {}
+        for relative in sorted(self.add + self.replace):
+            by_parent.setdefault(os.path.dirname(relative), []).append(os.path.join(self.source, relative))
+        for parent, sources in by_parent.items():
+            destination = os.path.join(self.destination, parent) if parent else self.destination
+            for i in range(0, len(sources), COMMAND_PATH_LIMIT):
+                commands.append(["/usr/bin/rsync", "-a", "-i", *sources[i:i + COMMAND_PATH_LIMIT], f"{destination}/"])
+
+        return commands
+
+
+    def summary(self) -> str:
+        return f"{len(self.add)} added, {len(self.replace)} replaced, {self.unchanged} unchanged"
@@ -1,9 +1,11 @@
 
 import logging
+import threading
 import subprocess
 import plistlib
 
-from pathlib import Path
+from pathlib    import Path
+from contextlib import nullcontext
 
 from ... import constants
 
@@ -11,13 +13,42 @@ from ...datasets import os_data
 from ...support import subprocess_wrapper, kdk_handler
 from ...volume import generate_copy_arguments
 
+from .kdk_delta import KernelDebugKitDelta
 
-class KernelDebugKitMerge:
 
-    def __init__(self, global_constants: constants.Constants, mount_location: str, skip_root_kmutil_requirement: bool) -> None:
+class KernelDebugKitMerge:
+    """
+    Parameters:
+        global_constants             (Constants):      Global constants
+        mount_location               (str):            Root volume mount point
+        skip_root_kmutil_requirement (bool):           If True, no KDK is required
+        install_lock                 (threading.Lock): Held while installing the KDK, for serializing with other package installs
+    """
+
+    def __init__(self, global_constants: constants.Constants, mount_location: str, skip_root_kmutil_requirement: bool, install_lock: threading.Lock = None) -> None:
         self.constants: constants.Constants = global_constants
         self.mount_location = mount_location
         self.skip_root_kmutil_requirement = skip_root_kmutil_requirement
+        self.install_lock = install_lock if install_lock is not None else nullcontext()
+
+        self._cancelled = threading.Event()
+        self._active_download = None
+
+
+    def cancel(self) -> None:
+        """
+        Abort resolve() before its next step, stopping any active download
+        Installs already in progress are left to complete
+        """
+        self._cancelled.set()
+        if self._active_download is not None:
+            self._active_download.stop()
+
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            logging.info("- KDK resolution cancelled")
+            raise Exception("KDK resolution cancelled")
 
 
     def _matching_kdk_already_merged(self, kdk_path: str) -> bool:
@@ -76,14 +107,31 @@ class KernelDebugKitMerge:
     def _merge_kdk(self, kdk_path: str) -> None:
         """
         Merge Kernel Debug Kit (KDK) with the root volume
+        Only entries differing from the root volume are copied, see kdk_delta.py
         """
         logging.info(f"- Merging KDK with Root Volume: {Path(kdk_path).name}")
-        subprocess_wrapper.run_as_root(
-            # Only merge '/System/Library/Extensions'
-            # 'Kernels' and 'KernelSupport' is wasted space for root patching (we don't care above dev kernels)
-            ["/usr/bin/rsync", "-r", "-i", "-a", f"{kdk_path}/System/Library/Extensions/", f"{self.mount_location}/System/Library/Extensions"],
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-        )
+
+        try:
+            delta = KernelDebugKitDelta.compare(kdk_path, self.mount_location)
+        except Exception as e:
+            logging.warning(f"- Failed to compare KDK with Root Volume, merging in full: {e}")
+            delta = None
+
+        if delta is not None:
+            logging.info(f"- KDK delta: {delta.summary()}")
+
+        if delta is None or delta.prefer_full_merge():
+            subprocess_wrapper.run_as_root(
+                # Only merge '/System/Library/Extensions'
+                # 'Kernels' and 'KernelSupport' is wasted space for root patching (we don't care above dev kernels)
+                ["/usr/bin/rsync", "-r", "-i", "-a", f"{kdk_path}/System/Library/Extensions/", f"{self.mount_location}/System/Library/Extensions"],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            )
+        elif not delta.is_empty():
+            batch = subprocess_wrapper.PrivilegedBatch()
+            for args in delta.commands():
+                batch.add(args, verify=args[0] != "/usr/bin/rsync")
+            batch.run_and_verify()
 
         if not (Path(self.mount_location) / Path("System/Library/Extensions/System.kext/PlugIns/Libkern.kext/Libkern")).exists():
             logging.info("- Failed to merge KDK with Root Volume")
@@ -91,11 +139,19 @@ class KernelDebugKitMerge:
         logging.info("- Successfully merged KDK with Root Volume")
 
 
-    def merge(self, save_hid_cs: bool = False) -> str:
+    def _install_kdk_dmg(self) -> bool:
+        self._check_cancelled()
+        with self.install_lock:
+            return kdk_handler.KernelDebugKitUtilities().install_kdk_dmg(self.constants.kdk_download_path)
+
+
+    def resolve(self) -> Path:
         """
-        Merge the Kernel Debug Kit (KDK) with the root volume
+        Locate the Kernel Debug Kit (KDK), downloading, validating and installing it if missing
+        Does not touch the root volume, thus may run before it is mounted
 
-        Returns KDK used
+        Returns:
+            Path: Installed KDK, None if no KDK is required
         """
         if self.skip_root_kmutil_requirement is True:
             return None
@@ -104,7 +160,7 @@ class KernelDebugKitMerge:
 
         # If a KDK was pre-downloaded, install it
         if self.constants.kdk_download_path.exists():
-            if kdk_handler.KernelDebugKitUtilities().install_kdk_dmg(self.constants.kdk_download_path) is False:
+            if self._install_kdk_dmg() is False:
                 logging.info("Failed to install KDK")
                 raise Exception("Failed to install KDK")
 
@@ -122,7 +178,11 @@ class KernelDebugKitMerge:
                 raise Exception(f"Could not retrieve KDK: {kdk_obj.error_msg}")
 
             # Hold thread until download is complete
+            self._active_download = kdk_download_obj
+            self._check_cancelled()
             kdk_download_obj.download(spawn_thread=False)
+            self._active_download = None
+            self._check_cancelled()
 
             if kdk_download_obj.download_complete is False:
                 error_msg = kdk_download_obj.error_msg
@@ -133,7 +193,7 @@ class KernelDebugKitMerge:
                 logging.info(f"KDK checksum validation failed: {kdk_obj.error_msg}")
                 raise Exception(f"KDK checksum validation failed: {kdk_obj.error_msg}")
 
-            kdk_handler.KernelDebugKitUtilities().install_kdk_dmg(self.constants.kdk_download_path)
+            self._install_kdk_dmg()
             # re-init kdk_obj to get the new kdk_installed_path
             kdk_obj = kdk_handler.KernelDebugKitObject(self.constants, self.constants.detected_os_build, self.constants.detected_os_version)
             if kdk_obj.success is False:
@@ -153,6 +213,27 @@ class KernelDebugKitMerge:
 
         logging.info(f"- Found KDK at: {kdk_path}")
 
+        return kdk_path
+
+
+    def merge(self, save_hid_cs: bool = False, kdk_path: Path = None) -> str:
+        """
+        Merge the Kernel Debug Kit (KDK) with the root volume
+
+        Parameters:
+            save_hid_cs (bool): If True, will save the HID CS file before merging KDK
+            kdk_path    (Path): KDK previously located with resolve(), otherwise resolved here
+
+        Returns KDK used
+        """
+        if self.skip_root_kmutil_requirement is True:
+            return None
+        if self.constants.detected_os < os_data.os_data.ventura:
+            return None
+
+        if kdk_path is None:
+            kdk_path = self.resolve()
+
         if self._matching_kdk_already_merged(kdk_path):
             return kdk_path
 
@@ -164,4 +245,4 @@ class KernelDebugKitMerge:
         if save_hid_cs is True:
             self._restore_hid_cs()
 
-        return kdk_path
\ No newline at end of file
+        return kdk_path
@@ -30,7 +30,8 @@ from ..support import (
     macos_installer_handler,
     utilities,
     network_handler,
-    integrity_verification
+    integrity_verification,
+    global_settings
 )
 
 
@@ -137,13 +138,18 @@ class macOSInstallerDownloadFrame(wx.Frame):
         def _fetch_installers():
             logging.info(f"Fetching installer catalog: {sucatalog.SeedType.DeveloperSeed.name}")
 
-            sucatalog_contents = sucatalog.CatalogURL(seed=sucatalog.SeedType.DeveloperSeed).url_contents
+            # Optional local mirror, see '--sync_catalog_mirror' and '--set_catalog_mirror'
+            mirror = global_settings.GlobalEnviromentSettings().read_property("CatalogMirror")
+            if mirror:
+                logging.info(f"Using catalog mirror: {mirror}")
+
+            sucatalog_contents = sucatalog.CatalogURL(seed=sucatalog.SeedType.DeveloperSeed, mirror=mirror).contents(install_assistants_only=True)
             if sucatalog_contents is None:
                 logging.error("Failed to download Installer Catalog from Apple")
                 return
 
-            self.available_installers        = sucatalog.CatalogProducts(sucatalog_contents).products
-            self.available_installers_latest = sucatalog.CatalogProducts(sucatalog_contents).latest_products
+            self.available_installers        = sucatalog.CatalogProducts(sucatalog_contents, mirror=mirror).products
+            self.available_installers_latest = sucatalog.CatalogProducts(sucatalog_contents, mirror=mirror).latest_products
 
 
         thread = threading.Thread(target=_fetch_installers)
@@ -320,7 +326,15 @@ class macOSInstallerDownloadFrame(wx.Frame):
 
             self.frame_modal.Close()
 
-            download_obj = network_handler.DownloadObject(selected_installer['InstallAssistant']['URL'], self.constants.payload_path / "InstallAssistant.pkg")
+            # Verify installer against its chunklist while downloading
+            chunk_obj = None
+            chunklist_stream = network_handler.NetworkUtilities().get(selected_installer['InstallAssistant']['IntegrityDataURL']).content
+            if chunklist_stream:
+                chunk_obj = integrity_verification.StreamingChunklistVerification(self.constants.payload_path / "InstallAssistant.pkg", chunklist_stream)
+                if not chunk_obj.chunks:
+                    chunk_obj = None
+
+            download_obj = network_handler.DownloadObject(selected_installer['InstallAssistant']['URL'], self.constants.payload_path / "InstallAssistant.pkg", verifier=chunk_obj)
 
             gui_download.DownloadFrame(
                 self,
@@ -335,12 +349,14 @@ class macOSInstallerDownloadFrame(wx.Frame):
                 self.on_return_to_main_menu()
                 return
 
-            self._validate_installer(selected_installer['InstallAssistant']['IntegrityDataURL'])
+            self._validate_installer(selected_installer['InstallAssistant']['IntegrityDataURL'], chunk_obj)
 
 
-    def _validate_installer(self, chunklist_link: str) -> None:
+    def _validate_installer(self, chunklist_link: str, chunk_obj: integrity_verification.StreamingChunklistVerification = None) -> None:
         """
         Validate macOS installer
+
+        If the installer was already verified during download, validation is skipped
         """
         self.SetSize((300, 200))
         for child in self.GetChildren():
@@ -364,7 +380,11 @@ class macOSInstallerDownloadFrame(wx.Frame):
         self.SetSize((-1, progress_bar.GetPosition()[1] + progress_bar.GetSize()[1] + 40))
         self.Show()
 
-        chunklist_stream = network_handler.NetworkUtilities().get(chunklist_link).content
+        chunklist_stream = None
+        if chunk_obj and chunk_obj.status == integrity_verification.ChunklistStatus.SUCCESS:
+            logging.info("macOS installer verified during download")
+        else:
+            chunklist_stream = network_handler.NetworkUtilities().get(chunklist_link).content
         if chunklist_stream:
             logging.info("Validating macOS installer")
             utilities.disable_sleep_while_running()
@@ -374,7 +394,7 @@ class macOSInstallerDownloadFrame(wx.Frame):
                 progress_bar.SetRange(chunk_obj.total_chunks)
 
                 wx.App.Get().Yield()
-                chunk_obj.validate()
+                chunk_obj.validate(parallel=True)
 
                 while chunk_obj.status == integrity_verification.ChunklistStatus.IN_PROGRESS:
                     progress_bar.SetValue(chunk_obj.current_chunk)
@@ -0,0 +1,45 @@
+"""
+tests: Regression tests and benchmarks for platform independent modules
+
+The opencore_legacy_patcher package imports macOS frameworks (PyObjC) on import,
+thus modules under test are loaded with load_module(), which skips the package's
+__init__ files, allowing the tests to run on any platform.
+
+Usage:
+    python3 -m unittest discover -s tests -t .
+"""
+
+import sys
+import types
+import importlib
+
+from pathlib import Path
+
+
+PACKAGE_PATH: Path = Path(__file__).resolve().parent.parent / "opencore_legacy_patcher"
+
+
+def load_module(relative_path: str):
+    """
+    Import a module from the package, without running its parent packages' __init__ files
+
+    Parent packages are registered as empty packages, thus relative imports of
+    sibling modules still resolve, so long as those avoid macOS-only dependencies
+
+    Parameters:
+        relative_path (str): Path relative to the package (ie. 'sucatalog/parser.py')
+
+    Returns:
+        module: Imported module
+    """
+
+    parts = [PACKAGE_PATH.name] + list(Path(relative_path).with_suffix("").parts)
+    for i in range(1, len(parts)):
+        package_name = ".".join(parts[:i])
+        if package_name in sys.modules:
+            continue
+        package = types.ModuleType(package_name)
+        package.__path__ = [str(PACKAGE_PATH.parent.joinpath(*parts[:i]))]
+        sys.modules[package_name] = package
+
+    return importlib.import_module(".".join(parts))
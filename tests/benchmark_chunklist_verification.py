@@ -0,0 +1,101 @@
+"""
+benchmark_chunklist_verification.py: Compare serial and parallel chunklist validation
+
+Generates a synthetic file and matching chunklist, then times ChunklistVerification's
+_validate() against _validate_parallel(). The file is read once beforehand so both
+run against the page cache, thus hashing throughput is compared rather than disk speed.
+
+Usage:
+    python3 -m tests.benchmark_chunklist_verification --size 2048 --runs 5
+"""
+
+import os
+import time
+import hashlib
+import argparse
+import tempfile
+import statistics
+
+from pathlib import Path
+
+from opencore_legacy_patcher.support import integrity_verification
+
+
+CHUNKLIST_HEADER_LENGTH = 36
+
+
+def _generate(file_path: Path, size: int, chunk_size: int) -> bytes:
+    """
+    Write size bytes of random data to file_path
+
+    Returns:
+        bytes: Chunklist for the written file
+    """
+
+    chunks = b""
+    count  = 0
+    with file_path.open("wb") as f:
+        remaining = size
+        while remaining > 0:
+            data = os.urandom(min(chunk_size, remaining))
+            f.write(data)
+            chunks    += len(data).to_bytes(4, "little") + hashlib.sha256(data).digest()
+            remaining -= len(data)
+            count     += 1
+
+    # Ref: https://github.com/apple-oss-distributions/xnu/blob/xnu-8020.101.4/bsd/kern/chunklist.h#L59-L69
+    header = b"CNKL"
+    header += CHUNKLIST_HEADER_LENGTH.to_bytes(4, "little")
+    header += bytes([1, 1, 0, 0])
+    header += count.to_bytes(8, "little")
+    header += CHUNKLIST_HEADER_LENGTH.to_bytes(8, "little")
+    header += (CHUNKLIST_HEADER_LENGTH + len(chunks)).to_bytes(8, "little")
+
+    return header + chunks
+
+
+def _time(file_path: Path, chunklist: bytes, parallel: bool) -> float:
+    chunk_obj = integrity_verification.ChunklistVerification(file_path, chunklist)
+    start = time.perf_counter()
+    chunk_obj._validate_parallel() if parallel else chunk_obj._validate()
+    elapsed = time.perf_counter() - start
+
+    if chunk_obj.status != integrity_verification.ChunklistStatus.SUCCESS:
+        raise Exception(f"Validation failed: {chunk_obj.error_msg}")
+
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Compare serial and parallel chunklist validation")
+    arg_parser.add_argument("--size",       type=int, default=1024, help="File size in MiB")
+    arg_parser.add_argument("--chunk-size", type=int, default=10,   help="Chunk size in MiB, Apple uses 10 MiB")
+    arg_parser.add_argument("--runs",       type=int, default=5,    help="Runs per method, median is reported")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "InstallAssistant.pkg"
+        chunklist = _generate(file_path, args.size * 1024 * 1024, args.chunk_size * 1024 * 1024)
+
+        # Warm page cache
+        with file_path.open("rb") as f:
+            while f.read(64 * 1024 * 1024):
+                pass
+
+        serial   = []
+        parallel = []
+        for _ in range(args.runs):
+            serial.append(_time(file_path, chunklist, parallel=False))
+            parallel.append(_time(file_path, chunklist, parallel=True))
+
+    serial_median   = statistics.median(serial)
+    parallel_median = statistics.median(parallel)
+
+    print(f"{args.size} MiB in {args.chunk_size} MiB chunks, {os.cpu_count()} CPUs, median of {args.runs} runs")
+    print(f"Serial:   {serial_median:.3f}s ({args.size / serial_median:.0f} MiB/s)")
+    print(f"Parallel: {parallel_median:.3f}s ({args.size / parallel_median:.0f} MiB/s)")
+    print(f"Speedup:  {serial_median / parallel_median:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+benchmark_opencore_cache.py: Compare extracting OpenCorePkg per build against OpenCoreTemplateCache
+
+Times the OpenCore base tree and config.plist setup of BuildOpenCore._generate_base(),
+as previously done (copying and extracting the zip, then parsing config.plist), against
+OpenCoreTemplateCache with a warm cache, a cold cache, and its manifest validation alone.
+
+Usage:
+    python3 -m tests.benchmark_opencore_cache --runs 30
+    python3 -m tests.benchmark_opencore_cache --runs 30 --debug
+"""
+
+import time
+import shutil
+import zipfile
+import argparse
+import plistlib
+import tempfile
+import statistics
+
+from pathlib import Path
+
+from opencore_legacy_patcher import constants
+from opencore_legacy_patcher.efi_builder import opencore_cache
+
+
+def _extract(global_constants: constants.Constants) -> dict:
+    """
+    Base tree and config.plist setup prior to OpenCoreTemplateCache
+    """
+
+    shutil.copy(global_constants.opencore_zip_source, global_constants.build_path)
+    zipfile.ZipFile(global_constants.opencore_zip_copied).extractall(global_constants.build_path)
+    shutil.copy(global_constants.plist_template, global_constants.oc_folder)
+    return plistlib.load(Path(global_constants.plist_path).open("rb"))
+
+
+def _cached(global_constants: constants.Constants) -> dict:
+    template_cache = opencore_cache.OpenCoreTemplateCache(global_constants)
+    template_cache.materialize(global_constants.build_path)
+    return template_cache.config()
+
+
+def _cold(global_constants: constants.Constants) -> dict:
+    template_cache = opencore_cache.OpenCoreTemplateCache(global_constants)
+    shutil.rmtree(template_cache._cache_path(), ignore_errors=True)
+    opencore_cache.OpenCoreTemplateCache._templates.clear()
+    return _cached(global_constants)
+
+
+def _validate(global_constants: constants.Constants) -> None:
+    template_cache = opencore_cache.OpenCoreTemplateCache(global_constants)
+    if not template_cache._is_valid(template_cache._cache_path()):
+        raise Exception("Cached base tree failed validation")
+
+
+def _time(method, global_constants: constants.Constants, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as build_path:
+            global_constants.custom_build_path = Path(build_path)
+            start = time.perf_counter()
+            method(global_constants)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Compare extracting OpenCorePkg per build against OpenCoreTemplateCache")
+    arg_parser.add_argument("--runs",  type=int, default=30, help="Runs per method, median is reported")
+    arg_parser.add_argument("--debug", action="store_true",  help="Use the DEBUG variant of OpenCorePkg")
+    args = arg_parser.parse_args()
+
+    global_constants = constants.Constants()
+    global_constants.opencore_debug = args.debug
+
+    extract = _time(_extract, global_constants, args.runs)
+    cold    = _time(_cold, global_constants, args.runs)
+    warm    = _time(_cached, global_constants, args.runs)
+    verify  = _time(_validate, global_constants, args.runs)
+
+    print(f"OpenCore v{global_constants.opencore_version} {'DEBUG' if args.debug else 'RELEASE'}, median of {args.runs} runs")
+    print(f"Extract per build:       {extract * 1000:.1f}ms")
+    print(f"Cached, cold:            {cold * 1000:.1f}ms")
+    print(f"Cached, warm:            {warm * 1000:.1f}ms")
+    print(f"  of which, validation:  {verify * 1000:.1f}ms")
+    print(f"Speedup (warm):          {extract / warm:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
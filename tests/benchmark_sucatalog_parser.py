@@ -0,0 +1,127 @@
+"""
+benchmark_sucatalog_parser.py: Compare plistlib against the incremental sucatalog parser
+
+Times plistlib.loads() followed by filtering for InstallAssistants, against
+parser.parse_catalog(install_assistants_only=True), reporting the median time
+and peak traced memory of each. By default a synthetic catalog is generated,
+with products modelled on Apple's: mostly updates, a share of them lacking
+ExtendedMetaInfo, and a few InstallAssistants. A downloaded catalog may be
+passed with --catalog instead.
+
+Usage:
+    python3 -m tests.benchmark_sucatalog_parser --products 20000 --runs 5
+    python3 -m tests.benchmark_sucatalog_parser --catalog index.sucatalog
+"""
+
+import time
+import random
+import argparse
+import datetime
+import plistlib
+import statistics
+import tracemalloc
+
+from pathlib import Path
+
+from . import load_module
+
+
+parser = load_module("sucatalog/parser.py")
+
+
+def _product(index: int, rng: random.Random) -> dict:
+    product = {
+        "ServerMetadataURL": f"https://swcdn.apple.com/content/downloads/{index:05d}/Update.smd",
+        "Packages": [
+            {
+                "Digest":      f"{rng.getrandbits(160):040x}",
+                "Size":        rng.randint(1_000_000, 5_000_000_000),
+                "MetadataURL": f"https://swdist.apple.com/content/downloads/{index:05d}/Package{package}.pkm",
+                "URL":         f"https://swcdn.apple.com/content/downloads/{index:05d}/Package{package}.pkg",
+            }
+            for package in range(rng.randint(1, 6))
+        ],
+        "PostDate": datetime.datetime(2015, 1, 1) + datetime.timedelta(minutes=rng.randint(0, 5_000_000)),
+        "Distributions": {"English": f"https://swdist.apple.com/content/downloads/{index:05d}/{index:05d}.English.dist"},
+    }
+
+    kind = rng.random()
+    if kind < 0.02:
+        product["ExtendedMetaInfo"] = {
+            "InstallAssistantPackageIdentifiers": {
+                "SharedSupport":        "com.apple.pkg.InstallAssistant.macOSSequoia",
+                "OSInstall":            "com.apple.mpkg.OSInstall",
+                "InstallInfo":          "com.apple.plist.InstallInfo",
+                "BuildManifest":        "com.apple.pkg.BuildManifest",
+            },
+        }
+    elif kind < 0.6:
+        product["ExtendedMetaInfo"] = {"ProductType": "update", "AutoUpdate": "YES", "ProductVersion": f"{rng.randint(10, 15)}.{rng.randint(0, 7)}"}
+
+    return product
+
+
+def _generate(count: int) -> bytes:
+    rng = random.Random(count)
+    return plistlib.dumps({
+        "CatalogVersion": 2,
+        "ApplePostURL":   "http://swpost.apple.com/stats",
+        "IndexDate":      datetime.datetime(2024, 10, 1),
+        "Products":       {f"{rng.randint(0, 99):03d}-{index:05d}": _product(index, rng) for index in range(count)},
+    })
+
+
+def _plistlib(data: bytes) -> dict:
+    catalog = plistlib.loads(data)
+    catalog["Products"] = {k: v for k, v in catalog["Products"].items() if parser._is_install_assistant(v.get("ExtendedMetaInfo", {}))}
+    return catalog
+
+
+def _incremental(data: bytes) -> dict:
+    return parser.parse_catalog(data, install_assistants_only=True)
+
+
+def _measure(method, data: bytes, runs: int) -> tuple:
+    """
+    Returns:
+        tuple: (median seconds, peak traced bytes, result)
+    """
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = method(data)
+        timings.append(time.perf_counter() - start)
+
+    # Tracing slows allocation heavy code, thus memory is measured in a separate run
+    tracemalloc.start()
+    method(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return statistics.median(timings), peak, result
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Compare plistlib against the incremental sucatalog parser")
+    arg_parser.add_argument("--catalog",  type=Path, default=None,  help="Catalog to parse, instead of a synthetic one")
+    arg_parser.add_argument("--products", type=int,  default=20000, help="Products in the synthetic catalog")
+    arg_parser.add_argument("--runs",     type=int,  default=5,     help="Runs per method, median is reported")
+    args = arg_parser.parse_args()
+
+    data = args.catalog.read_bytes() if args.catalog else _generate(args.products)
+
+    plistlib_time,    plistlib_peak,    expected = _measure(_plistlib, data, args.runs)
+    incremental_time, incremental_peak, result   = _measure(_incremental, data, args.runs)
+
+    if result != expected:
+        raise Exception("Incremental parser result differs from plistlib")
+
+    print(f"{len(data) / 1024 / 1024:.1f} MiB catalog, {len(result['Products'])} InstallAssistants, median of {args.runs} runs")
+    print(f"plistlib:    {plistlib_time:.3f}s, peak {plistlib_peak / 1024 / 1024:.1f} MiB")
+    print(f"Incremental: {incremental_time:.3f}s, peak {incremental_peak / 1024 / 1024:.1f} MiB")
+    print(f"Speedup:     {plistlib_time / incremental_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+test_build_support.py: BuildSupport config.plist array lookups against the shipped template
+
+efi_builder.support imports constants, and thus device_probe, these tests only run on macOS
+"""
+
+import sys
+import copy
+import plistlib
+import unittest
+
+from pathlib import Path
+
+from . import load_module
+
+
+if sys.platform == "darwin":
+    support = load_module("efi_builder/support.py")
+
+
+TEMPLATE = Path(__file__).parent.parent / "payloads" / "Config" / "config.plist"
+
+
+@unittest.skipUnless(sys.platform == "darwin", "efi_builder.support requires macOS")
+class TestIndexedLookups(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with TEMPLATE.open("rb") as f:
+            self.template = plistlib.load(f)
+        self.config = support.IndexedConfig(copy.deepcopy(self.template))
+
+
+    def _support(self, config: dict = None) -> "support.BuildSupport":
+        return support.BuildSupport("iMac12,2", None, self.config if config is None else config)
+
+
+    def test_matches_scan(self) -> None:
+        for kext in self.template["Kernel"]["Add"]:
+            self.assertEqual(self._support().get_kext_by_bundle_path(kext["BundlePath"]), kext)
+            self.assertIs(
+                self._support().get_kext_by_bundle_path(kext["BundlePath"]),
+                support.BuildSupport.get_item_by_kv(self.config["Kernel"]["Add"], "BundlePath", kext["BundlePath"])
+            )
+        for driver in self.template["UEFI"]["Drivers"]:
+            self.assertEqual(self._support().get_efi_binary_by_path(driver["Path"], "UEFI", "Drivers"), driver)
+
+        with self.assertRaises(IndexError), self.assertLogs(level="INFO"):
+            self._support().get_kext_by_bundle_path("Missing.kext")
+
+
+    def test_index_per_config(self) -> None:
+        bundle_path = self.template["Kernel"]["Add"][0]["BundlePath"]
+        other = support.IndexedConfig(copy.deepcopy(self.template))
+
+        first  = self._support().get_kext_by_bundle_path(bundle_path)
+        second = self._support(other).get_kext_by_bundle_path(bundle_path)
+
+        self.assertIs(first, self.config["Kernel"]["Add"][0])
+        self.assertIs(second, other["Kernel"]["Add"][0])
+        self.assertIs(self._support().get_kext_by_bundle_path(bundle_path), first)
+
+
+    def test_remove_item(self) -> None:
+        kexts = self.config["Kernel"]["Add"]
+        removed = kexts[0]
+        self._support().get_kext_by_bundle_path(removed["BundlePath"])
+
+        self._support().remove_item(kexts, removed)
+
+        self.assertNotIn(removed, kexts)
+        with self.assertRaises(IndexError), self.assertLogs(level="INFO"):
+            self._support().get_kext_by_bundle_path(removed["BundlePath"])
+        self.assertIs(self._support().get_kext_by_bundle_path(kexts[0]["BundlePath"]), kexts[0])
+
+
+    def test_added_and_modified_outside(self) -> None:
+        kexts = self.config["Kernel"]["Add"]
+        self._support().get_kext_by_bundle_path(kexts[0]["BundlePath"])
+
+        added = {**kexts[0], "BundlePath": "Added.kext"}
+        kexts.append(added)
+        self.assertIs(self._support().get_kext_by_bundle_path("Added.kext"), added)
+
+        kexts[1]["BundlePath"] = "Renamed.kext"
+        self.assertIs(self._support().get_kext_by_bundle_path("Renamed.kext"), kexts[1])
+
+
+    def test_plain_dict(self) -> None:
+        config = copy.deepcopy(self.template)
+        bundle_path = config["Kernel"]["Add"][0]["BundlePath"]
+        self.assertIs(self._support(config).get_kext_by_bundle_path(bundle_path), config["Kernel"]["Add"][0])
+
+
+    def test_plist_output(self) -> None:
+        self.assertEqual(plistlib.dumps(self.config), plistlib.dumps(self.template))
+
+
+if __name__ == "__main__":
+    unittest.main()
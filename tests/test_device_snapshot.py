@@ -0,0 +1,211 @@
+"""
+test_device_snapshot.py: Hardware snapshot round trips and cache invalidation
+
+device_probe imports IOKit through PyObjC, thus these tests only run on macOS
+"""
+
+import sys
+import plistlib
+import tempfile
+import unittest
+import dataclasses
+
+from pathlib import Path
+from unittest import mock
+
+from . import load_module
+
+
+if sys.platform == "darwin":
+    device_probe    = load_module("detections/device_probe.py")
+    device_snapshot = load_module("detections/device_snapshot.py")
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "pci_registry_imac12_2.plist"
+
+# Methods re-run on cache hits, see HardwareSnapshotCache.probe()
+REPROBED = ["oclp_sys_patch_probe", "check_rosetta", "usb_device_probe", "bluetooth_probe", "topcase_probe", "t1_probe"]
+
+
+def _computer() -> "device_probe.Computer":
+    """
+    Computer with every field populated, PCI devices classified from the registry fixture
+    """
+
+    with FIXTURE.open("rb") as f:
+        registry = device_probe.PCIRegistry.from_dump(plistlib.load(f))
+
+    computer = device_probe.Computer(
+        real_model="iMac12,2",
+        real_board_id="Mac-942B59F58194171B",
+        reported_model="iMac19,1",
+        reported_board_id="Mac-AA95B1DDAB278B95",
+        build_model="iMac12,2",
+        uuid_sha1="4b6a2c7a1a8f0d2b6e2d9d86c1e1b1b1c1f0a0d4",
+        cpu=device_probe.CPU("Intel(R) Core(TM) i7-2600 CPU @ 3.40GHz", ["FPU", "SSE4.2", "AVX"], ["SMEP", "ERMS"]),
+        oclp_version="2.1.0",
+        opencore_version="REL-102-2024-10-07",
+        opencore_path="PciRoot(0x0)/Pci(0x1F,0x2)/Sata(0x0,0xFFFF,0x0)/HD(2,GPT,1F7A0A4E-0000-0000-0000-000000000000,0x64028,0x3A1CEA78)/EFI\\OC\\OpenCore.efi",
+        bluetooth_chipset="BRCM20702 v1",
+        internal_keyboard_type="Modern",
+        trackpad_type="Modern",
+        ambient_light_sensor=True,
+        third_party_sata_ssd=True,
+        pcie_webcam=True,
+        t1_chip=True,
+        secure_boot_model="x86legacy",
+        secure_boot_policy=2,
+        oclp_sys_version="2.1.0",
+        oclp_sys_date="2024-10-08 12:00:00",
+        oclp_sys_url="https://github.com/dortania/OpenCore-Legacy-Patcher/releases/tag/2.1.0",
+        oclp_sys_signed=True,
+        firmware_vendor="Apple",
+        rosetta_active=True,
+    )
+
+    for probe in ["gpu_probe", "wifi_probe", "storage_probe", "usb_controller_probe", "sdxc_controller_probe", "ethernet_probe"]:
+        getattr(computer, probe)(registry)
+
+    # Shortcuts share instances with Computer.gpus
+    computer.dgpu = computer.gpus[0]
+    computer.igpu = computer.gpus[1]
+
+    usb_device = device_probe.USBDevice(0x05AC, 0x8215, 0xE0, 0x02, "Bluetooth USB Host Controller", "Apple Inc.", "A1B2C3D4E5F6")
+    usb_device.detect()
+    computer.usb_devices = [usb_device]
+
+    return computer
+
+
+@unittest.skipUnless(sys.platform == "darwin", "device_probe requires macOS")
+class TestSnapshotRoundTrip(unittest.TestCase):
+
+    def _assert_identical(self, restored, original, path: str) -> None:
+        self.assertIs(type(restored), type(original), path)
+        if dataclasses.is_dataclass(original):
+            for item in dataclasses.fields(original):
+                self.assertEqual(hasattr(restored, item.name), hasattr(original, item.name), f"{path}.{item.name}")
+                if hasattr(original, item.name):
+                    self._assert_identical(getattr(restored, item.name), getattr(original, item.name), f"{path}.{item.name}")
+        elif isinstance(original, list):
+            self.assertEqual(len(restored), len(original), path)
+            for i, (restored_item, original_item) in enumerate(zip(restored, original)):
+                self._assert_identical(restored_item, original_item, f"{path}[{i}]")
+        else:
+            self.assertEqual(restored, original, path)
+
+
+    def test_fixture_populated(self) -> None:
+        computer = _computer()
+        for item in dataclasses.fields(computer):
+            default = item.default_factory() if item.default_factory is not dataclasses.MISSING else item.default
+            self.assertNotEqual(getattr(computer, item.name), default, f"Computer.{item.name} left at its default")
+
+
+    def test_round_trip(self) -> None:
+        computer = _computer()
+
+        restored = device_snapshot.from_json(device_snapshot.to_json(computer))
+
+        self._assert_identical(restored, computer, "Computer")
+        self.assertEqual(restored, computer)
+
+
+    def test_nested_types(self) -> None:
+        restored = device_snapshot.from_json(device_snapshot.to_json(_computer()))
+
+        self.assertIsInstance(restored.dgpu, device_probe.AMD)
+        self.assertIs(restored.dgpu.arch, device_probe.AMD.Archs.TeraScale_2)
+        self.assertIs(restored.igpu.arch, device_probe.Intel.Archs.Sandy_Bridge)
+        self.assertIs(restored.dgpu, restored.gpus[0])
+        self.assertIs(restored.igpu, restored.gpus[1])
+        self.assertIs(restored.wifi.chipset, device_probe.Broadcom.Chipsets.AirPortBrcm4360)
+        self.assertEqual(restored.wifi.country_code, "US")
+        self.assertIs(restored.ethernet[0].chipset, device_probe.BroadcomEthernet.Chipsets.AppleBCM5701Ethernet)
+        self.assertEqual([type(controller) for controller in restored.storage], [device_probe.SATAController, device_probe.NVMeController])
+        self.assertEqual(restored.storage[1].aspm, 2)
+        self.assertIs(restored.usb_devices[0].device_class, device_probe.USBDevice.ClassCode.WIRELESS)
+        self.assertIs(restored.usb_devices[0].device_speed, device_probe.USBDevice.Speed.FULL_SPEED)
+        self.assertIsInstance(restored.cpu, device_probe.CPU)
+
+
+    def test_rejects_unknown_types(self) -> None:
+        for snapshot in [
+            '{"Version": 1, "Computer": {"__class__": "subprocess", "__id__": 0}}',
+            '{"Version": 1, "Computer": {"__class__": "Computer.__init__", "__id__": 0}}',
+            '{"Version": 1, "Computer": {"__enum__": "Path", "name": "home"}}',
+            '{"Version": 0, "Computer": {}}',
+        ]:
+            with self.assertRaises(ValueError):
+                device_snapshot.from_json(snapshot)
+
+
+@unittest.skipUnless(sys.platform == "darwin", "device_probe requires macOS")
+class TestHardwareSnapshotCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.cache_path = Path(self._temp_dir.name) / "Hardware-Snapshot.json"
+
+        self.boot_session_uuid = "8B1D4E1C-0000-0000-0000-000000000001"
+        self.pci_topology_hash = "a" * 64
+
+        self.probe = mock.patch.object(device_probe.Computer, "probe", side_effect=_computer).start()
+        for method in REPROBED:
+            mock.patch.object(device_probe.Computer, method).start()
+        self.addCleanup(mock.patch.stopall)
+
+
+    def _cache(self, patcher_version: str = "2.1.0") -> "device_snapshot.HardwareSnapshotCache":
+        cache = device_snapshot.HardwareSnapshotCache(patcher_version, self.cache_path)
+        cache._boot_session_uuid = lambda: self.boot_session_uuid
+        cache._pci_topology_hash = lambda: self.pci_topology_hash
+        return cache
+
+
+    def test_cache_hit(self) -> None:
+        probed = self._cache().probe()
+        self.assertEqual(self.probe.call_count, 1)
+        self.assertTrue(self.cache_path.exists())
+
+        cached = self._cache().probe()
+
+        self.assertEqual(self.probe.call_count, 1)
+        self.assertEqual(cached.gpus, probed.gpus)
+        self.assertEqual(cached.wifi, probed.wifi)
+        for method in REPROBED:
+            getattr(device_probe.Computer, method).assert_called_once()
+
+
+    def test_patcher_version_changed(self) -> None:
+        self._cache("2.1.0").probe()
+        self._cache("2.2.0").probe()
+        self.assertEqual(self.probe.call_count, 2)
+
+
+    def test_boot_session_changed(self) -> None:
+        self._cache().probe()
+        self.boot_session_uuid = "8B1D4E1C-0000-0000-0000-000000000002"
+        self._cache().probe()
+        self.assertEqual(self.probe.call_count, 2)
+
+
+    def test_pci_topology_changed(self) -> None:
+        self._cache().probe()
+        self.pci_topology_hash = "b" * 64
+        self._cache().probe()
+        self.assertEqual(self.probe.call_count, 2)
+
+
+    def test_corrupt_cache(self) -> None:
+        self._cache().probe()
+        self.cache_path.write_text("{")
+
+        with self.assertLogs(level="WARNING"):
+            self._cache().probe()
+        self.assertEqual(self.probe.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
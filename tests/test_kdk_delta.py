@@ -0,0 +1,191 @@
+"""
+test_kdk_delta.py: KDK delta merge planning against synthetic KDK and root volume trees
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from . import load_module
+
+
+kdk_delta = load_module("sys_patch/utilities/kdk_delta.py")
+
+
+MTIME = 1_700_000_000
+
+
+def _write(path: Path, contents: bytes, mtime: int = MTIME) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(contents)
+    os.utime(path, (mtime, mtime))
+
+
+def _apply(commands: list) -> None:
+    """
+    Execute planned commands unprivileged, emulating rm, mkdir and 'rsync -a'
+    """
+    for args in commands:
+        if args[0] == "/bin/rm":
+            for path in args[2:]:
+                if os.path.isdir(path) and not os.path.islink(path):
+                    shutil.rmtree(path)
+                elif os.path.lexists(path):
+                    os.unlink(path)
+        elif args[0] == "/bin/mkdir":
+            for path in args[2:]:
+                os.makedirs(path, exist_ok=True)
+        elif args[0] == "/usr/bin/rsync":
+            for source in args[3:-1]:
+                destination = os.path.join(args[-1], os.path.basename(source))
+                if os.path.lexists(destination):
+                    os.unlink(destination)
+                shutil.copy2(source, destination, follow_symlinks=False)
+        else:
+            raise Exception(f"Unexpected command: {args}")
+
+
+class TestKernelDebugKitDelta(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+        self.kdk  = Path(self._temp_dir.name) / "KDK_14.7_23H124.kdk"
+        self.root = Path(self._temp_dir.name) / "Root"
+
+        self.kdk_extensions  = self.kdk  / kdk_delta.EXTENSIONS_PATH
+        self.root_extensions = self.root / kdk_delta.EXTENSIONS_PATH
+
+        for kext in ["IOHIDFamily", "apfs", "System"]:
+            _write(self.kdk_extensions / f"{kext}.kext/Contents/Info.plist", f"{kext} plist".encode())
+            _write(self.kdk_extensions / f"{kext}.kext/Contents/MacOS/{kext}", f"{kext} binary".encode())
+        _write(self.kdk_extensions / "System.kext/PlugIns/Libkern.kext/Libkern", b"libkern")
+        os.symlink("Contents/MacOS/apfs", self.kdk_extensions / "apfs.kext/apfs")
+
+        # Root volume with the KDK already merged, alongside stock content absent from the KDK
+        shutil.copytree(self.kdk_extensions, self.root_extensions, symlinks=True)
+        _write(self.root_extensions / "Stock.kext/Contents/Info.plist", b"stock")
+
+
+    def _compare(self) -> "kdk_delta.KernelDebugKitDelta":
+        return kdk_delta.KernelDebugKitDelta.compare(self.kdk, self.root)
+
+
+    def _assert_merged(self) -> None:
+        delta = self._compare()
+        self.assertTrue(delta.is_empty(), delta.summary())
+        self.assertEqual(delta.unchanged, len(delta.entries))
+        self.assertEqual((self.root_extensions / "Stock.kext/Contents/Info.plist").read_bytes(), b"stock")
+
+
+    def test_same_kdk(self) -> None:
+        delta = self._compare()
+
+        self.assertTrue(delta.is_empty())
+        self.assertEqual(delta.commands(), [])
+        self.assertEqual(delta.unchanged, 8)
+        self.assertEqual(delta.summary(), "0 added, 0 replaced, 8 unchanged")
+
+
+    def test_fresh_root_volume(self) -> None:
+        shutil.rmtree(self.root_extensions)
+        self.root_extensions.mkdir(parents=True)
+
+        delta = self._compare()
+
+        self.assertEqual(len(delta.add), 8)
+        self.assertTrue(delta.prefer_full_merge())
+
+
+    def test_point_update(self) -> None:
+        _write(self.kdk_extensions / "IOHIDFamily.kext/Contents/MacOS/IOHIDFamily", b"IOHIDFamily binary, new build", MTIME + 60)
+        _write(self.kdk_extensions / "apfs.kext/Contents/Info.plist", b"apfs plist", MTIME + 60)
+        _write(self.kdk_extensions / "IOHIDFamily.kext/Contents/Resources/Added.strings", b"strings")
+        _write(self.kdk_extensions / "Added.kext/Contents/MacOS/Added", b"added")
+        os.unlink(self.kdk_extensions / "apfs.kext/apfs")
+        os.symlink("Contents/MacOS/apfs-new", self.kdk_extensions / "apfs.kext/apfs")
+
+        delta = self._compare()
+
+        self.assertEqual(delta.remove, [])
+        self.assertEqual(delta.mkdir, ["Added.kext", "Added.kext/Contents", "Added.kext/Contents/MacOS", "IOHIDFamily.kext/Contents/Resources"])
+        self.assertEqual(delta.add, ["Added.kext/Contents/MacOS/Added", "IOHIDFamily.kext/Contents/Resources/Added.strings"])
+        self.assertEqual(delta.replace, ["IOHIDFamily.kext/Contents/MacOS/IOHIDFamily", "apfs.kext/Contents/Info.plist", "apfs.kext/apfs"])
+        self.assertEqual(delta.unchanged, 5)
+        self.assertFalse(delta.prefer_full_merge())
+
+        source      = str(self.kdk_extensions)
+        destination = str(self.root_extensions)
+        self.assertEqual(delta.commands(), [
+            ["/bin/mkdir", "-p"] + [f"{destination}/{relative}" for relative in delta.mkdir],
+            ["/usr/bin/rsync", "-a", "-i", f"{source}/Added.kext/Contents/MacOS/Added", f"{destination}/Added.kext/Contents/MacOS/"],
+            ["/usr/bin/rsync", "-a", "-i", f"{source}/IOHIDFamily.kext/Contents/MacOS/IOHIDFamily", f"{destination}/IOHIDFamily.kext/Contents/MacOS/"],
+            ["/usr/bin/rsync", "-a", "-i", f"{source}/IOHIDFamily.kext/Contents/Resources/Added.strings", f"{destination}/IOHIDFamily.kext/Contents/Resources/"],
+            ["/usr/bin/rsync", "-a", "-i", f"{source}/apfs.kext/Contents/Info.plist", f"{destination}/apfs.kext/Contents/"],
+            ["/usr/bin/rsync", "-a", "-i", f"{source}/apfs.kext/apfs", f"{destination}/apfs.kext/"],
+        ])
+
+        _apply(delta.commands())
+        self._assert_merged()
+        self.assertEqual(os.readlink(self.root_extensions / "apfs.kext/apfs"), "Contents/MacOS/apfs-new")
+
+
+    def test_file_became_directory(self) -> None:
+        os.unlink(self.kdk_extensions / "System.kext/PlugIns/Libkern.kext/Libkern")
+        _write(self.kdk_extensions / "System.kext/PlugIns/Libkern.kext/Libkern/Libkern", b"libkern")
+
+        delta = self._compare()
+
+        self.assertEqual(delta.remove, ["System.kext/PlugIns/Libkern.kext/Libkern"])
+        self.assertEqual(delta.mkdir,  ["System.kext/PlugIns/Libkern.kext/Libkern"])
+        self.assertEqual(delta.add,    ["System.kext/PlugIns/Libkern.kext/Libkern/Libkern"])
+        self.assertEqual(delta.commands()[0], ["/bin/rm", "-Rf", f"{self.root_extensions}/System.kext/PlugIns/Libkern.kext/Libkern"])
+
+        _apply(delta.commands())
+        self._assert_merged()
+
+
+    def test_directory_became_file(self) -> None:
+        shutil.rmtree(self.kdk_extensions / "IOHIDFamily.kext/Contents/MacOS")
+        _write(self.kdk_extensions / "IOHIDFamily.kext/Contents/MacOS", b"flattened")
+
+        delta = self._compare()
+
+        self.assertEqual(delta.remove,  ["IOHIDFamily.kext/Contents/MacOS"])
+        self.assertEqual(delta.replace, ["IOHIDFamily.kext/Contents/MacOS"])
+
+        _apply(delta.commands())
+        self._assert_merged()
+
+
+    def test_target_deleted_and_modified(self) -> None:
+        os.unlink(self.root_extensions / "apfs.kext/Contents/MacOS/apfs")
+        _write(self.root_extensions / "IOHIDFamily.kext/Contents/Info.plist", b"modified on target", MTIME + 60)
+        shutil.rmtree(self.root_extensions / "System.kext/PlugIns")
+
+        delta = self._compare()
+
+        self.assertEqual(delta.mkdir,   ["System.kext/PlugIns", "System.kext/PlugIns/Libkern.kext"])
+        self.assertEqual(delta.add,     ["System.kext/PlugIns/Libkern.kext/Libkern", "apfs.kext/Contents/MacOS/apfs"])
+        self.assertEqual(delta.replace, ["IOHIDFamily.kext/Contents/Info.plist"])
+
+        _apply(delta.commands())
+        self._assert_merged()
+
+
+    def test_command_path_limit(self) -> None:
+        for i in range(kdk_delta.COMMAND_PATH_LIMIT + 1):
+            _write(self.kdk_extensions / f"Many.kext/Contents/Resources/{i}.strings", b"strings")
+
+        rsync = [args for args in self._compare().commands() if args[0] == "/usr/bin/rsync"]
+
+        self.assertEqual(len(rsync), 2)
+        self.assertEqual(len(rsync[0]) - 4, kdk_delta.COMMAND_PATH_LIMIT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+test_kdk_validation.py: KDK validation against pkg receipts, using synthetic KDK trees
+"""
+
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import mock
+
+from . import load_module
+
+
+kdk_validation = load_module("support/kdk_validation.py")
+
+
+MTIME = 1_700_000_000
+
+EXTENSIONS = kdk_validation.EXTENSIONS_PATH
+
+RECEIPT = [
+    "System",
+    "System/Library",
+    f"{EXTENSIONS}/",
+    f"{EXTENSIONS}/apfs.kext",
+    f"{EXTENSIONS}/apfs.kext/Contents",
+    f"{EXTENSIONS}/apfs.kext/Contents/Info.plist",
+    f"{EXTENSIONS}/apfs.kext/Contents/MacOS",
+    f"{EXTENSIONS}/apfs.kext/Contents/MacOS/apfs",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents/Info.plist",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/A",
+    f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/Current",
+    f"{EXTENSIONS}/System.kext",
+    "System/Library/KernelCollections",
+    "System/Library/KernelCollections/BootKernelExtensions.kc.development",
+]
+
+
+class TestKernelDebugKitValidationIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+        self.kdk = Path(self._temp_dir.name) / "KDK_14.7_23H124.kdk"
+        self.cache_path = Path(self._temp_dir.name) / "Cache" / "KDK-Validation.json"
+
+        for line in RECEIPT:
+            path = self.kdk / line.rstrip("/")
+            if path.name == "Current":
+                path.symlink_to("A")
+            elif path.name in ["Info.plist", "apfs", "System.kext", "BootKernelExtensions.kc.development"]:
+                path.write_bytes(b"\x00")
+            else:
+                path.mkdir(parents=True, exist_ok=True)
+
+        # Directory loop, only the link itself may be reported
+        (self.kdk / EXTENSIONS / "apfs.kext/Contents/Loop").symlink_to("..")
+
+        # Settle directory modification times, thus later removals are detected regardless of timestamp granularity
+        for directory, _, _ in os.walk(self.kdk):
+            os.utime(directory, (MTIME, MTIME))
+
+
+    def _index(self) -> "kdk_validation.KernelDebugKitValidationIndex":
+        return kdk_validation.KernelDebugKitValidationIndex(cache_path=self.cache_path, max_workers=2)
+
+
+    def test_valid(self) -> None:
+        present = self._index().scan(self.kdk)
+
+        self.assertEqual(self._index().missing_files(self.kdk, RECEIPT), [])
+        self.assertIn(f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/Current", present)
+        self.assertIn(f"{EXTENSIONS}/apfs.kext/Contents/Loop", present)
+        self.assertNotIn(f"{EXTENSIONS}/apfs.kext/Contents/Loop/Contents", present)
+        self.assertFalse(any(path.startswith(f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/Current/") for path in present))
+
+
+    def test_missing_files(self) -> None:
+        (self.kdk / EXTENSIONS / "IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents/Info.plist").unlink()
+        (self.kdk / EXTENSIONS / "System.kext").unlink()
+        (self.kdk / EXTENSIONS / "IOGraphicsFamily.kext/Versions/A").rmdir()
+
+        self.assertEqual(
+            self._index().missing_files(self.kdk, RECEIPT),
+            [
+                f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents/Info.plist",
+                f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/A",
+                # Dangling once its target is removed
+                f"{EXTENSIONS}/IOGraphicsFamily.kext/Versions/Current",
+                f"{EXTENSIONS}/System.kext",
+            ]
+        )
+
+
+    def test_missing_extensions(self) -> None:
+        self.assertEqual(self._index().missing_files(self.kdk / "Missing", RECEIPT)[0], f"{EXTENSIONS}")
+        self._index().record_valid(self.kdk / "Missing")
+        self.assertFalse(self.cache_path.exists())
+
+
+    def test_cache_hit_skips_scan(self) -> None:
+        validation = self._index()
+        self.assertFalse(validation.is_cached_valid(self.kdk))
+        self.assertEqual(validation.missing_files(self.kdk, RECEIPT), [])
+        validation.record_valid(self.kdk)
+
+        # Fresh index, as on the next launch
+        validation = self._index()
+        with mock.patch.object(validation, "scan") as scan, mock.patch.object(validation, "_walk") as walk:
+            self.assertTrue(validation.is_cached_valid(self.kdk))
+        scan.assert_not_called()
+        walk.assert_not_called()
+
+
+    def test_nested_removal_invalidates_cache(self) -> None:
+        validation = self._index()
+        validation.missing_files(self.kdk, RECEIPT)
+        validation.record_valid(self.kdk)
+
+        (self.kdk / EXTENSIONS / "IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents/Info.plist").unlink()
+
+        validation = self._index()
+        self.assertFalse(validation.is_cached_valid(self.kdk))
+        self.assertEqual(
+            validation.missing_files(self.kdk, RECEIPT),
+            [f"{EXTENSIONS}/IOGraphicsFamily.kext/PlugIns/IONDRVSupport.kext/Contents/Info.plist"]
+        )
+
+
+    def test_forget(self) -> None:
+        validation = self._index()
+        validation.missing_files(self.kdk, RECEIPT)
+        validation.record_valid(self.kdk)
+
+        validation.forget(self.kdk)
+
+        self.assertFalse(self._index().is_cached_valid(self.kdk))
+
+
+    def test_corrupt_cache(self) -> None:
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text("{")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertFalse(self._index().is_cached_valid(self.kdk))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+test_kernelcache_fingerprint.py: Kernel cache input fingerprinting against synthetic volumes
+"""
+
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from . import load_module
+
+
+fingerprint = load_module("sys_patch/kernelcache/fingerprint.py")
+
+
+PARAMETERS = {"OS Build": "23H124", "Kernel Debug Kit": "/Library/Developer/KDKs/KDK_14.7_23H124.kdk"}
+
+
+class TestKernelCacheFingerprint(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+        self.root = Path(self._temp_dir.name) / "Root"
+        self.data = Path(self._temp_dir.name) / "Data"
+
+        self._write(self.root / "System/Library/Extensions/IOHIDFamily.kext/Contents/Info.plist", b"plist")
+        self._write(self.root / "System/Library/Extensions/IOHIDFamily.kext/Contents/PlugIns/IOHIDEventDriver.kext/Contents/MacOS/IOHIDEventDriver", b"binary")
+        self._write(self.root / "System/Library/Kernels/kernel", b"kernel")
+        self._write(self.data / "Library/Extensions/Thirdparty.kext/Contents/Info.plist", b"plist")
+
+        self.collections = [str(Path(self._temp_dir.name) / "BootKernelExtensions.kc"), str(Path(self._temp_dir.name) / "SystemKernelExtensions.kc")]
+        for collection in self.collections:
+            self._write(Path(collection), b"collection")
+
+
+    def _write(self, path: Path, contents: bytes, mtime_ns: int = 1_000_000_000_000_000_000) -> None:
+        # Fixed modification times, thus rewriting identical contents is not a change
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(contents)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+    def _fingerprint(self, parameters: dict = PARAMETERS) -> str:
+        return fingerprint.KernelCacheFingerprint(self.root, self.data, parameters).fingerprint()
+
+
+    def test_stable(self) -> None:
+        self.assertEqual(self._fingerprint(), self._fingerprint())
+
+
+    def test_kext_edit(self) -> None:
+        previous = self._fingerprint()
+        self._write(self.root / "System/Library/Extensions/IOHIDFamily.kext/Contents/PlugIns/IOHIDEventDriver.kext/Contents/MacOS/IOHIDEventDriver", b"patched")
+        self.assertNotEqual(self._fingerprint(), previous)
+
+
+    def test_kext_touched(self) -> None:
+        previous = self._fingerprint()
+        self._write(self.root / "System/Library/Extensions/IOHIDFamily.kext/Contents/Info.plist", b"plist", mtime_ns=2_000_000_000_000_000_000)
+        self.assertNotEqual(self._fingerprint(), previous)
+
+
+    def test_kext_added(self) -> None:
+        previous = self._fingerprint()
+        self._write(self.data / "Library/Extensions/Added.kext/Contents/Info.plist", b"plist")
+        self.assertNotEqual(self._fingerprint(), previous)
+
+
+    def test_kext_removed(self) -> None:
+        previous = self._fingerprint()
+        (self.data / "Library/Extensions/Thirdparty.kext/Contents/Info.plist").unlink()
+        self.assertNotEqual(self._fingerprint(), previous)
+
+
+    def test_non_kext_ignored(self) -> None:
+        previous = self._fingerprint()
+        self._write(self.data / "Library/Extensions/.DS_Store", b"finder")
+        self.assertEqual(self._fingerprint(), previous)
+
+
+    def test_kernel_changed(self) -> None:
+        previous = self._fingerprint()
+        self._write(self.root / "System/Library/Kernels/kernel", b"kernel.development")
+        self.assertNotEqual(self._fingerprint(), previous)
+
+
+    def test_parameters(self) -> None:
+        previous = self._fingerprint()
+        self.assertNotEqual(self._fingerprint({**PARAMETERS, "Kernel Debug Kit": "/Library/Developer/KDKs/KDK_14.7.1_23H222.kdk"}), previous)
+        self.assertNotEqual(self._fingerprint({**PARAMETERS, "Auxiliary Cache Only": True}), previous)
+
+
+    def test_matches(self) -> None:
+        metadata = fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).metadata(self.collections)
+        self.assertTrue(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(metadata, self.collections))
+
+
+    def test_matches_inputs_changed(self) -> None:
+        metadata = fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).metadata(self.collections)
+        self._write(self.data / "Library/Extensions/Added.kext/Contents/Info.plist", b"plist")
+        self.assertFalse(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(metadata, self.collections))
+
+
+    def test_matches_collection_touched(self) -> None:
+        metadata = fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).metadata(self.collections)
+        self._write(Path(self.collections[0]), b"collection", mtime_ns=2_000_000_000_000_000_000)
+        self.assertFalse(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(metadata, self.collections))
+
+
+    def test_matches_collection_missing(self) -> None:
+        metadata = fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).metadata(self.collections)
+        Path(self.collections[1]).unlink()
+        self.assertFalse(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(metadata, self.collections))
+
+
+    def test_matches_collections_differ(self) -> None:
+        metadata = fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).metadata(self.collections)
+        self.assertFalse(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(metadata, self.collections[:1]))
+        self.assertFalse(fingerprint.KernelCacheFingerprint(self.root, self.data, PARAMETERS).matches(None, self.collections))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+test_network_handler.py: Segmented and resumed downloads against a local HTTP server
+
+network_handler imports utilities, and thus macOS-only modules, these tests only run on macOS
+"""
+
+import sys
+import random
+import plistlib
+import tempfile
+import threading
+import unittest
+import http.server
+
+from pathlib import Path
+from unittest import mock
+
+from . import load_module
+
+
+if sys.platform == "darwin":
+    network_handler = load_module("support/network_handler.py")
+
+
+SEGMENT_MINIMUM_SIZE: int   = 64 * 1024
+DOWNLOAD_CHUNK_SIZE:  int   = 16 * 1024  # Several chunks per segment
+DATA:                 bytes = random.Random(0).randbytes(SEGMENT_MINIMUM_SIZE * 8 + 1234)
+ETAG:                 str   = '"oclp-test"'
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves DATA, honouring single byte ranges while the server advertises and honours them
+    """
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+    def _send_headers(self, status: int, length: int, content_range: str = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", ETAG)
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+
+    def do_HEAD(self) -> None:
+        self._send_headers(200, len(DATA))
+
+
+    def do_GET(self) -> None:
+        requested = self.headers.get("Range")
+        with self.server.lock:
+            self.server.requests.append(requested)
+
+        if requested is None or not self.server.honour_ranges or self.headers.get("If-Range", ETAG) != ETAG:
+            self._send_headers(200, len(DATA))
+            self.wfile.write(DATA)
+            return
+
+        start, end = requested.removeprefix("bytes=").split("-")
+        start, end = int(start), int(end) if end else len(DATA) - 1
+        self._send_headers(206, end - start + 1, f"bytes {start}-{end}/{len(DATA)}")
+        self.wfile.write(DATA[start:end + 1])
+
+
+@unittest.skipUnless(sys.platform == "darwin", "network_handler requires macOS")
+class TestDownloadObject(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.path = Path(self._temp_dir.name) / "InstallAssistant.pkg"
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        self.server.accept_ranges = True
+        self.server.honour_ranges = True
+        self.server.requests = []
+        self.server.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/InstallAssistant.pkg"
+
+        mock.patch.object(network_handler, "SEGMENT_MINIMUM_SIZE", SEGMENT_MINIMUM_SIZE).start()
+        mock.patch.object(network_handler, "DOWNLOAD_CHUNK_SIZE", DOWNLOAD_CHUNK_SIZE).start()
+        mock.patch.object(network_handler.utilities, "disable_sleep_while_running").start()
+        mock.patch.object(network_handler.utilities, "enable_sleep_after_running").start()
+        self.addCleanup(mock.patch.stopall)
+
+
+    def _download(self, segments: int) -> "network_handler.DownloadObject":
+        download_object = network_handler.DownloadObject(self.url, self.path, segments=segments)
+        download_object.download(spawn_thread=False)
+        return download_object
+
+
+    def test_segmented(self) -> None:
+        download_object = self._download(segments=4)
+
+        self.assertTrue(download_object.download_complete)
+        self.assertEqual(self.path.read_bytes(), DATA)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertTrue(all(requested.startswith("bytes=") for requested in self.server.requests))
+        self.assertFalse(download_object.resume_state_path.exists())
+
+
+    def test_without_accept_ranges(self) -> None:
+        self.server.accept_ranges = False
+        self.server.honour_ranges = False
+
+        with self.assertLogs(level="INFO") as logs:
+            download_object = self._download(segments=4)
+
+        self.assertTrue(download_object.download_complete)
+        self.assertEqual(self.path.read_bytes(), DATA)
+        self.assertEqual(self.server.requests, [None])
+        self.assertTrue(any("falling back to single stream download" in line for line in logs.output))
+
+
+    def test_ranges_ignored(self) -> None:
+        # Advertised, though each request receives the entire file
+        self.server.honour_ranges = False
+
+        with self.assertLogs(level="ERROR"):
+            download_object = self._download(segments=4)
+
+        self.assertFalse(download_object.download_complete)
+        self.assertIn("did not honour range request", download_object.error_msg)
+
+
+    def test_small_file_single_stream(self) -> None:
+        with mock.patch.object(network_handler, "SEGMENT_MINIMUM_SIZE", len(DATA)):
+            download_object = self._download(segments=4)
+
+        self.assertTrue(download_object.download_complete)
+        self.assertEqual(self.path.read_bytes(), DATA)
+        self.assertEqual(self.server.requests, [None])
+
+
+    def test_resume_segmented(self) -> None:
+        # Interrupted download, with the first and last 100 KiB written
+        written = [(0, 100 * 1024), (len(DATA) - 100 * 1024, len(DATA))]
+        partial = bytearray(len(DATA))
+        for start, end in written:
+            partial[start:end] = DATA[start:end]
+        self.path.write_bytes(bytes(partial))
+        self.path.with_name(self.path.name + network_handler.RESUME_STATE_SUFFIX).write_bytes(plistlib.dumps({
+            "URL":    self.url,
+            "Size":   len(DATA),
+            "Ranges": [list(x) for x in written],
+            "ETag":   ETAG,
+        }))
+
+        download_object = self._download(segments=4)
+
+        self.assertTrue(download_object.download_complete)
+        self.assertEqual(self.path.read_bytes(), DATA)
+        self.assertEqual(download_object.resumed_file_size, 200 * 1024)
+        for requested in self.server.requests:
+            start, end = (int(x) for x in requested.removeprefix("bytes=").split("-"))
+            self.assertFalse(any(start < written_end and end >= written_start for written_start, written_end in written), requested)
+
+
+if __name__ == "__main__":
+    unittest.main()
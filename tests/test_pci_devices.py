@@ -0,0 +1,142 @@
+"""
+test_pci_devices.py: PCI device classification against a recorded IORegistry dump
+"""
+
+import plistlib
+import unittest
+import itertools
+
+from pathlib import Path
+from unittest import mock
+
+from . import load_module
+
+
+pci_devices = load_module("detections/pci_devices.py")
+
+
+# iMac12,2 with an aftermarket NVMe drive, spoofed Wi-Fi card and an unsupported GPU
+FIXTURE = Path(__file__).parent / "fixtures" / "pci_registry_imac12_2.plist"
+
+
+class TestPCIRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with FIXTURE.open("rb") as f:
+            self.dump = plistlib.load(f)
+        self.registry = pci_devices.PCIRegistry.from_dump(self.dump)
+
+
+    def test_gpus(self) -> None:
+        gpus = self.registry.gpus()
+
+        self.assertEqual([type(gpu) for gpu in gpus], [pci_devices.AMD, pci_devices.Intel])
+        self.assertEqual(gpus[0].arch, pci_devices.AMD.Archs.TeraScale_2)
+        self.assertEqual(gpus[0].model, "AMD Radeon HD 6970M")
+        self.assertEqual(gpus[0].name, "GFX0")
+        self.assertEqual(gpus[0].acpi_path, "IOACPIPlane:/_SB/PCI0@0/PEG0@10000/GFX0@0")
+        self.assertEqual(gpus[0].pci_path, "PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)")
+        self.assertEqual(gpus[1].arch, pci_devices.Intel.Archs.Sandy_Bridge)
+        self.assertEqual(gpus[1].class_code, 0x038000)
+        self.assertTrue(gpus[1].disable_metal)
+        self.assertFalse(gpus[0].disable_metal)
+
+
+    def test_gpu_by_name(self) -> None:
+        self.assertEqual(self.registry.gpu("GFX0"), self.registry.gpus()[0])
+        self.assertEqual(self.registry.gpu("IGPU").arch, pci_devices.Intel.Archs.Sandy_Bridge)
+        self.assertIsNone(self.registry.gpu("GFX1"))
+        self.assertIsNone(self.registry.gpu("GFX2"))
+
+
+    def test_wifi_anti_spoof(self) -> None:
+        wifi = self.registry.wifi()
+
+        self.assertIsInstance(wifi, pci_devices.Broadcom)
+        self.assertEqual((wifi.vendor_id, wifi.device_id), (0x14E4, 0x4331))
+        self.assertEqual(wifi.chipset, pci_devices.Broadcom.Chipsets.AirPortBrcm4360)
+        self.assertEqual(wifi.country_code, "US")
+
+        spoofed = pci_devices.PCIDevice.from_registry_entry(self.registry.match_name("ARPT", pci_devices.WirelessCard.CLASS_CODES))
+        self.assertEqual(spoofed.device_id, 0x43BA)
+        self.assertEqual(spoofed.device_id_unspoofed, 0x4331)
+
+
+    def test_ethernet(self) -> None:
+        ethernet = self.registry.ethernet()
+
+        self.assertEqual(len(ethernet), 1)
+        self.assertIsInstance(ethernet[0], pci_devices.BroadcomEthernet)
+        self.assertEqual(ethernet[0].chipset, pci_devices.BroadcomEthernet.Chipsets.AppleBCM5701Ethernet)
+
+
+    def test_storage(self) -> None:
+        storage = self.registry.storage()
+
+        self.assertEqual([type(controller) for controller in storage], [pci_devices.SATAController, pci_devices.NVMeController])
+        self.assertEqual(storage[1].aspm, 2)
+        self.assertEqual(storage[1].pci_path, "PciRoot(0x0)/Pci(0x1C,0x6)/Pci(0x0,0x0)")
+
+
+    def test_usb_and_sdxc_controllers(self) -> None:
+        self.assertEqual([(type(controller), controller.name) for controller in self.registry.usb_controllers()], [
+            (pci_devices.EHCIController, "EHC2"),
+            (pci_devices.EHCIController, "EHC1"),
+        ])
+        self.assertEqual([controller.device_id for controller in self.registry.sdxc_controllers()], [0x16BC])
+
+
+    def test_match_registry_order(self) -> None:
+        self.assertEqual([device.name for device in self.registry.match(pci_devices.GPU.CLASS_CODES)], ["GFX0", "IGPU", "GFX1"])
+        self.assertEqual(self.registry.match([0x0C0330]), [])
+
+
+    def test_dump_round_trip(self) -> None:
+        self.assertEqual(self.registry.dump(), self.dump)
+        self.assertEqual(pci_devices.PCIRegistry.from_dump(self.registry.dump()), self.registry)
+
+
+class TestDeviceIDTable(unittest.TestCase):
+
+    def _vendors(self) -> list:
+        return [
+            vendor for vendor in itertools.chain.from_iterable([subclass.__subclasses__() for subclass in pci_devices.PCIDevice.__subclasses__()])
+            if hasattr(vendor, "DEVICE_IDS")
+        ]
+
+
+    def test_no_conflicts(self) -> None:
+        with self.assertNoLogs(level="WARNING"):
+            table = pci_devices._compile_device_id_table()
+        self.assertEqual(table, pci_devices.DEVICE_ID_TABLE)
+
+
+    def test_conflict_logged(self) -> None:
+        conflicting = {**pci_devices.AMD.DEVICE_IDS, pci_devices.AMD.Archs.Navi: pci_devices.AMD.DEVICE_IDS[pci_devices.AMD.Archs.Navi] + [0x6720]}
+        with mock.patch.object(pci_devices.AMD, "DEVICE_IDS", conflicting), self.assertLogs(level="WARNING") as logs:
+            table = pci_devices._compile_device_id_table()
+
+        self.assertIn("1002:6720", logs.output[0])
+        self.assertIs(table[(0x1002, 0x6720)], pci_devices.AMD.Archs.TeraScale_2)
+
+
+    def test_classify_matches_per_class_lookup(self) -> None:
+        """
+        Table lookups must match the original per-class if/elif chains: first DEVICE_IDS entry listing the device ID, otherwise Unknown
+        """
+
+        for vendor in self._vendors():
+            device_ids = set(itertools.chain.from_iterable(vendor.DEVICE_IDS.values())) | {0x0000, 0xFFFF}
+            classified = pci_devices.classify_device_ids((vendor.VENDOR_ID, device_id) for device_id in device_ids)
+
+            for device_id in device_ids:
+                expected = next((value for value, ids in vendor.DEVICE_IDS.items() if device_id in ids), None)
+                device   = vendor(vendor.VENDOR_ID, device_id, vendor.CLASS_CODES[0])
+                resolved = device.arch if isinstance(device, pci_devices.GPU) else device.chipset
+
+                self.assertIs(resolved, expected or type(resolved).Unknown, f"{vendor.__name__} {device_id:04X}")
+                self.assertIs(classified[(vendor.VENDOR_ID, device_id)], expected, f"{vendor.__name__} {device_id:04X}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+test_smbios_index.py: Compare the indexed SMBIOS lookups against linear scans of smbios_data
+"""
+
+import unittest
+
+from . import load_module
+
+
+smbios_index = load_module("datasets/smbios_index.py")
+smbios_data  = load_module("datasets/smbios_data.py")
+pci_devices  = load_module("detections/pci_devices.py")
+os_data      = load_module("datasets/os_data.py")
+
+
+def _linear_find_model_off_board(board: str):
+    """
+    generate_smbios.find_model_off_board() prior to the index
+    """
+
+    # Strip extra data from Target Types (ap, uppercase)
+    if not (board.startswith("Mac-") or board.startswith("VMM-")):
+        if board.lower().endswith("ap"):
+            board = board[:-2]
+        board = board.lower()
+
+    for key in smbios_data.smbios_dictionary:
+        if board in [smbios_data.smbios_dictionary[key]["Board ID"], smbios_data.smbios_dictionary[key]["SecureBootModel"]]:
+            if key.endswith("_v2") or key.endswith("_v3") or key.endswith("_v4"):
+                # smbios_data has duplicate SMBIOS to handle multiple board IDs
+                key = key[:-3]
+            if key == "MacPro4,1":
+                # 4,1 and 5,1 have the same board ID, best to return the newer ID
+                key = "MacPro5,1"
+            return key
+    return None
+
+
+class TestSMBIOSIndex(unittest.TestCase):
+
+    def test_find_model_off_board(self) -> None:
+        boards = {"Mac-0000000000000000", "VMM-x86_64", "", "ap"}
+        for data in smbios_data.smbios_dictionary.values():
+            boards.add(data["Board ID"])
+            if data["SecureBootModel"] is not None:
+                # As reported by firmware, ie. 'J680AP'
+                boards.update([data["SecureBootModel"], data["SecureBootModel"].upper(), data["SecureBootModel"].upper() + "AP"])
+        boards.discard(None)
+
+        for board in sorted(boards):
+            self.assertEqual(smbios_index.find_model_off_board(board), _linear_find_model_off_board(board), board)
+
+
+    def test_find_model_off_board_normalization(self) -> None:
+        self.assertEqual(smbios_index.find_model_off_board(smbios_data.smbios_dictionary["iMac9,1_v3"]["Board ID"]), "iMac9,1")
+        self.assertEqual(smbios_index.find_model_off_board(smbios_data.smbios_dictionary["MacBook5,1_v2"]["Board ID"]), "MacBook5,1")
+        self.assertEqual(smbios_index.find_model_off_board(smbios_data.smbios_dictionary["MacPro4,1"]["Board ID"]), "MacPro5,1")
+        self.assertEqual(smbios_index.find_model_off_board("J680AP"), "MacBookPro15,1")
+        self.assertIsNone(smbios_index.find_model_off_board("Mac-0000000000000000"))
+
+
+    def test_find_board_off_model(self) -> None:
+        for model, data in smbios_data.smbios_dictionary.items():
+            self.assertEqual(smbios_index.find_board_off_model(model), data["Board ID"], model)
+        self.assertIsNone(smbios_index.find_board_off_model("MacBookPro99,1"))
+
+
+    def test_query(self) -> None:
+        # Models with stock Kepler GPUs, dropped before Monterey
+        expected = [
+            model for model, data in smbios_data.smbios_dictionary.items()
+            if pci_devices.NVIDIA.Archs.Kepler in data["Stock GPUs"] and data["Max OS Supported"] < os_data.os_data.monterey
+        ]
+
+        results = smbios_index.query(stock_gpu=pci_devices.NVIDIA.Archs.Kepler, max_os_before=os_data.os_data.monterey)
+
+        self.assertEqual([record.model for record in results], expected)
+        self.assertIn("iMac13,1", expected)
+        self.assertEqual(
+            [record.model for record in smbios_index.query(stock_gpu=pci_devices.NVIDIA.Archs.Kepler, max_os_before=os_data.os_data.monterey, include_variants=False)],
+            [model for model in expected if "_" not in model and " " not in model]
+        )
+
+
+    def test_unknown_keys(self) -> None:
+        dictionary = {"iMac12,2": {**smbios_data.smbios_dictionary["iMac12,2"], "Unknown Key": True}}
+        with self.assertRaises(Exception):
+            smbios_index.SMBIOSIndex(dictionary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+test_subprocess_wrapper.py: PrivilegedBatch against a fake Privileged Helper
+"""
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from . import load_module
+
+
+subprocess_wrapper = load_module("support/subprocess_wrapper.py")
+
+
+# Records its arguments, then runs them unprivileged
+FAKE_HELPER = f"""#!{sys.executable}
+import os, sys, json
+with open(os.environ["FAKE_HELPER_LOG"], "a") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+os.execv(sys.argv[1], sys.argv[1:])
+"""
+
+
+class TestPrivilegedBatch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.root = Path(self._temp_dir.name)
+
+        self.helper = self.root / "helper"
+        self.helper.write_text(FAKE_HELPER)
+        self.helper.chmod(0o755)
+
+        self.log = self.root / "helper.log"
+        os.environ["FAKE_HELPER_LOG"] = str(self.log)
+        self.addCleanup(os.environ.pop, "FAKE_HELPER_LOG")
+
+
+    def _invocations(self) -> list:
+        if not self.log.exists():
+            return []
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+
+    def test_single_invocation(self) -> None:
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(self.helper))
+        for i in range(100):
+            source      = self.root / f"source {i}"
+            destination = self.root / f"destination {i}"
+            source.write_text(str(i))
+            batch.add(["/bin/cp", source, destination])
+            batch.add(["/bin/chmod", "600", destination])
+            batch.add(["/bin/rm", source])
+
+        results = batch.run()
+
+        invocations = self._invocations()
+        self.assertEqual(len(invocations), 1)
+        self.assertEqual(invocations[0][:2], ["/bin/sh", "-c"])
+        self.assertEqual(len(results), 300)
+        self.assertTrue(all(result.returncode == 0 and verify for result, verify in results))
+        self.assertEqual(results[0][0].args, ["/bin/cp", str(self.root / "source 0"), str(self.root / "destination 0")])
+
+        for i in range(100):
+            self.assertFalse((self.root / f"source {i}").exists())
+            self.assertEqual((self.root / f"destination {i}").read_text(), str(i))
+            self.assertEqual((self.root / f"destination {i}").stat().st_mode & 0o777, 0o600)
+
+
+    def test_combined_commands(self) -> None:
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(self.helper))
+        for i in range(3):
+            batch.add(["/bin/mkdir", "-p", self.root / f"folder {i}"])
+
+        results = batch.run()
+
+        self.assertEqual(len(self._invocations()), 1)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0].args, ["/bin/mkdir", "-p"] + [str(self.root / f"folder {i}") for i in range(3)])
+
+
+    def test_stops_at_verified_failure(self) -> None:
+        missing = self.root / "missing"
+        created = self.root / "created"
+
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(self.helper))
+        batch.add(["/bin/rm", missing], verify=False)
+        batch.add(["/bin/mkdir", created])
+        batch.add(["/bin/rm", missing])
+        batch.add(["/bin/mkdir", self.root / "not reached"])
+
+        results = batch.run()
+
+        self.assertEqual(len(self._invocations()), 1)
+        self.assertEqual([(result.returncode != 0, verify) for result, verify in results], [(True, False), (False, True), (True, True)])
+        self.assertIn(b"missing", results[2][0].stdout)
+        self.assertTrue(created.exists())
+        self.assertFalse((self.root / "not reached").exists())
+
+        batch.add(["/bin/rm", missing])
+        with self.assertRaises(Exception), self.assertLogs(level="ERROR"):
+            batch.run_and_verify()
+
+
+    def test_output_per_command(self) -> None:
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(self.helper))
+        batch.add(["/bin/echo", "first"])
+        batch.add(["/bin/echo", "-n", "second"])
+        batch.add(["/bin/echo", "$HOME; exit 1"])
+
+        results = batch.run()
+
+        self.assertEqual([result.stdout for result, _ in results], [b"first\n", b"second", b"$HOME; exit 1\n"])
+
+
+    def test_split_invocations(self) -> None:
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(self.helper))
+        batch.SCRIPT_LENGTH_LIMIT = 1024
+        for i in range(50):
+            batch.add(["/bin/mkdir", self.root / f"folder {i}"])
+            batch.add(["/bin/rm", "-d", self.root / f"folder {i}"], verify=False)
+
+        results = batch.run()
+
+        self.assertGreater(len(self._invocations()), 1)
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all(result.returncode == 0 for result, _ in results))
+
+
+    def test_helper_failure(self) -> None:
+        helper = self.root / "rejecting-helper"
+        helper.write_text("#!/bin/sh\necho rejected\nexit 166\n")
+        helper.chmod(0o755)
+
+        batch = subprocess_wrapper.PrivilegedBatch(helper=str(helper))
+        batch.add(["/bin/mkdir", self.root / "folder"])
+
+        results = batch.run()
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0].returncode, 166)
+        self.assertEqual(results[0][0].stdout, b"rejected\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+test_sucatalog_parser.py: Compare the incremental sucatalog parser against plistlib
+"""
+
+import datetime
+import plistlib
+import unittest
+
+from . import load_module
+
+
+parser = load_module("sucatalog/parser.py")
+
+
+INSTALL_ASSISTANT = {
+    "ExtendedMetaInfo": {
+        "InstallAssistantPackageIdentifiers": {
+            "SharedSupport": "com.apple.pkg.InstallAssistant.macOSSequoia",
+        },
+    },
+    "PostDate": datetime.datetime(2024, 9, 16, 17, 0, 0),
+    "Packages": [{"URL": "https://example.com/InstallAssistant.pkg", "Size": 15000000000}],
+}
+
+UPDATE = {
+    "ExtendedMetaInfo": {"ProductType": "update", "Nested": {"Versions": [1, 2]}},
+    "PostDate": datetime.datetime(2024, 1, 1),
+    "Packages": [{"URL": "https://example.com/Update.pkg", "Size": 3}],
+}
+
+
+def _catalog(products: dict) -> bytes:
+    # Nested top-level keys after Products, reaching the same depth as product contents
+    return plistlib.dumps({
+        "CatalogVersion": 2,
+        "Products":       products,
+        "Signature":      {"Nested": {"Deep": [1, {"Key": "Value"}], "Data": b"\x00\x01"}},
+        "IndexDate":      datetime.datetime(2024, 10, 1),
+    })
+
+
+class TestCatalogParser(unittest.TestCase):
+
+    def test_matches_plistlib(self):
+        data = _catalog({"001-00001": INSTALL_ASSISTANT, "001-00002": UPDATE})
+        self.assertEqual(parser.parse_catalog(data), plistlib.loads(data))
+
+
+    def test_skipped_final_product_keeps_trailing_keys(self):
+        # Regression: skip state of the final (non-InstallAssistant) product leaked past Products
+        data = _catalog({"001-00001": INSTALL_ASSISTANT, "001-00002": UPDATE})
+
+        expected = plistlib.loads(data)
+        expected["Products"] = {"001-00001": expected["Products"]["001-00001"]}
+
+        self.assertEqual(parser.parse_catalog(data, install_assistants_only=True), expected)
+
+
+    def test_skipped_products_only(self):
+        data = _catalog({"001-00002": UPDATE, "001-00003": UPDATE})
+
+        expected = plistlib.loads(data)
+        expected["Products"] = {}
+
+        self.assertEqual(parser.parse_catalog(data, install_assistants_only=True), expected)
+
+
+    def test_products_without_extended_meta_info_unconverted(self):
+        # Conversion of the unsupported element would raise
+        data = _catalog({"001-00001": INSTALL_ASSISTANT, "001-00004": {"Packages": [], "Marker": "Unconverted"}})
+        data = data.replace(b"<string>Unconverted</string>", b"<unsupported/>")
+
+        self.assertEqual(list(parser.parse_catalog(data, install_assistants_only=True)["Products"]), ["001-00001"])
+        with self.assertRaises(ValueError):
+            parser.parse_catalog(data)
+
+
+    def test_iter_products(self):
+        data = _catalog({"001-00002": UPDATE, "001-00001": INSTALL_ASSISTANT})
+        self.assertEqual(
+            [product_id for product_id, _ in parser.iter_products(data, install_assistants_only=True)],
+            ["001-00001"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()